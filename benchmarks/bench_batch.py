@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares shuffling standard decks and dealing two cards from each for many tables,
+with a Deck per table against a single DeckBatch.
+
+Run from the repository root with: python -m benchmarks.bench_batch
+"""
+
+import time
+
+import pyCardDeck
+from pyCardDeck.batch import DeckBatch
+
+TABLES = (100, 2_000, 20_000)
+
+
+def standard_decks(tables: int) -> list:
+    decks = []
+    for _ in range(tables):
+        deck = pyCardDeck.Deck(rng=1)
+        deck.load_standard_deck()
+        decks.append(deck)
+    return decks
+
+
+def decks_round(decks: list) -> float:
+    start = time.perf_counter()
+    for deck in decks:
+        deck.shuffle()
+        deck.draw_many(2)
+    return time.perf_counter() - start
+
+
+def batch_round(batch: DeckBatch) -> float:
+    batch.reset()
+    start = time.perf_counter()
+    batch.shuffle_all()
+    batch.draw_all(2)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    catalog = pyCardDeck.CardCatalog.standard()
+    print(f"{'tables':>8} {'Decks':>12} {'DeckBatch':>12}")
+    for tables in TABLES:
+        decks_time = min(decks_round(standard_decks(tables)) for _ in range(3))
+        batch = DeckBatch(tables, catalog, rng=1)
+        batch_time = min(batch_round(batch) for _ in range(3))
+        print(f"{tables:>8} {decks_time * 1e3:>10.2f}ms {batch_time * 1e3:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
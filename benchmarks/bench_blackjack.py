@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares playing basic strategy hands one by one on a Shoe with the vectorized
+engine of pyCardDeck.blackjack, and prints the EV both report.
+
+Run from the repository root with: python -m benchmarks.bench_blackjack
+"""
+
+import time
+
+from pyCardDeck.blackjack import basic_strategy, play_reference, simulate
+
+
+def main() -> None:
+    strategy = basic_strategy()
+    for name, play, hands in (
+        ("Shoe, hand by hand", play_reference, 50_000),
+        ("vectorized", simulate, 2_000_000),
+    ):
+        start = time.perf_counter()
+        result = play(hands, strategy, rng=1)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name}: {hands / elapsed * 60 / 1e6:.1f}M hands per minute, "
+            f"EV {result.ev:+.4f} ({result.low:+.4f} to {result.high:+.4f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares PokerCard with SlottedPokerCard: memory per card, comparing cards
+as Deck does, sorting and set membership.
+
+Run from the repository root with: python -m benchmarks.bench_cards
+"""
+
+import random
+import sys
+import timeit
+
+import pyCardDeck
+from pyCardDeck.deck import _card_compare
+
+RANKS = (("2", "Two"), ("7", "Seven"), ("10", "Ten"), ("Q", "Queen"), ("A", "Ace"))
+SUITS = ("Clubs", "Diamonds", "Hearts", "Spades")
+RANK_CODES = {rank: code for code, (rank, _) in enumerate(RANKS)}
+
+
+def cards(card_type: type) -> list:
+    made = [card_type(suit, rank, name) for rank, name in RANKS for suit in SUITS] * 50
+    random.Random(1).shuffle(made)
+    return made
+
+
+def rank_order(card) -> tuple:
+    return RANK_CODES[card.rank], card.suit
+
+
+def card_size(card) -> int:
+    size = sys.getsizeof(card)
+    if hasattr(card, "__dict__"):
+        size += sys.getsizeof(card.__dict__)
+    return size
+
+
+def main() -> None:
+    print(f"{'card':>18} {'bytes':>6} {'compare':>10} {'sort':>10} {'set':>10}")
+    for card_type in (pyCardDeck.PokerCard, pyCardDeck.SlottedPokerCard):
+        made = cards(card_type)
+        pairs = list(zip(made, reversed(made)))
+        compare = min(
+            timeit.repeat(
+                lambda: [_card_compare(a, b) for a, b in pairs], number=20, repeat=3
+            )
+        )
+        if card_type is pyCardDeck.PokerCard:
+            # Sorting by rank needs a key and the cards can't go into sets
+            sort = min(
+                timeit.repeat(lambda: sorted(made, key=rank_order), number=20, repeat=3)
+            )
+            in_set = float("nan")
+        else:
+            sort = min(timeit.repeat(lambda: sorted(made), number=20, repeat=3))
+            in_set = min(timeit.repeat(lambda: set(made), number=20, repeat=3))
+        print(
+            f"{card_type.__name__:>18} {card_size(made[0]):>6}"
+            f" {compare / 20 * 1e3:>8.3f}ms {sort / 20 * 1e3:>8.3f}ms"
+            f" {in_set / 20 * 1e3:>8.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares the memory every live standard deck takes as a Deck, as a Deck sharing
+a catalog and as a CompactDeck, counting the deck and everything allocated for it.
+
+Run from the repository root with: python -m benchmarks.bench_compact
+"""
+
+import gc
+import tracemalloc
+
+import pyCardDeck
+
+DECKS = 10_000
+
+
+def deck() -> pyCardDeck.Deck:
+    return pyCardDeck.Deck()
+
+
+def catalog_deck() -> pyCardDeck.Deck:
+    return pyCardDeck.Deck(catalog=pyCardDeck.CardCatalog.standard())
+
+
+def compact_deck() -> pyCardDeck.Deck:
+    return pyCardDeck.CompactDeck(catalog=pyCardDeck.CardCatalog.standard())
+
+
+def bytes_per_deck(factory) -> float:
+    gc.collect()
+    tracemalloc.start()
+    decks = []
+    for _ in range(DECKS):
+        new_deck = factory()
+        new_deck.load_standard_deck()
+        new_deck.shuffle()
+        decks.append(new_deck)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / len(decks)
+
+
+def main() -> None:
+    # Load the shared template and catalog first, so they aren't counted
+    compact_deck().load_standard_deck()
+    print(f"{'storage':>12} {'bytes/deck':>12} {'cards':>10}")
+    for name, factory in (
+        ("Deck", deck),
+        ("catalog", catalog_deck),
+        ("CompactDeck", compact_deck),
+    ):
+        sample = factory()
+        sample.load_standard_deck()
+        print(
+            f"{name:>12} {bytes_per_deck(factory):>12.0f}"
+            f" {sample._cards.__sizeof__():>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
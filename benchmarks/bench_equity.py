@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures how long the equity calculator takes for a heads-up hand
+on every street, enumerating or sampling the runouts.
+
+Run from the repository root with: python -m benchmarks.bench_equity
+"""
+
+import os
+import time
+
+from pyCardDeck.equity import equity
+
+HANDS = [["Ace of Spades", "King of Spades"], ["Queen of Hearts", "Queen of Diamonds"]]
+BOARD = [
+    "Two of Spades",
+    "Seven of Spades",
+    "Queen of Clubs",
+    "Four of Hearts",
+    "Nine of Spades",
+]
+
+
+def measure(label: str, **options) -> None:
+    start = time.perf_counter()
+    first, _ = equity(HANDS, rng=1, **options)
+    elapsed = time.perf_counter() - start
+    kind = "exact" if first.exact else "sampled"
+    print(
+        f"{label:>28} {elapsed * 1e3:>9.1f}ms {first.runouts:>9} {kind:>8}"
+        f" {first.equity:>7.3f}"
+    )
+
+
+def main() -> None:
+    print(f"{'':>28} {'time':>11} {'runouts':>9} {'':>8} {'equity':>7}")
+    measure("pre-flop, 10k samples", samples=10_000)
+    measure("pre-flop, 10ms budget", time_budget=0.01)
+    measure("flop", board=BOARD[:3])
+    measure("turn", board=BOARD[:4])
+    measure("river", board=BOARD)
+    cores = os.cpu_count() or 1
+    measure("pre-flop exact", exact_limit=2_000_000)
+    if cores > 1:
+        measure(
+            f"pre-flop exact, {cores} workers", exact_limit=2_000_000, workers=cores
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures the poker hand evaluator: building the tables, scoring single
+5- and 7-card hands and scoring a batch of hands with NumPy.
+
+Run from the repository root with: python -m benchmarks.bench_evaluator
+"""
+
+import random
+import time
+import timeit
+
+import pyCardDeck
+from pyCardDeck import evaluator
+
+HANDS = 100_000
+
+
+def main() -> None:
+    start = time.perf_counter()
+    evaluator._tables()
+    print(f"tables built in {(time.perf_counter() - start) * 1e3:.1f}ms")
+    codes = evaluator.catalog_codes(pyCardDeck.CardCatalog.standard())
+    rng = random.Random(1)
+    for size in (5, 7):
+        hands = [rng.sample(codes, size) for _ in range(HANDS)]
+        single = min(
+            timeit.repeat(
+                lambda: [evaluator.evaluate_codes(hand) for hand in hands],
+                number=1,
+                repeat=3,
+            )
+        )
+        line = f"{size} cards: {single / HANDS * 1e6:.2f}us per hand"
+        try:
+            import numpy
+        except ImportError:
+            print(line)
+            continue
+        array = numpy.array(hands)
+        evaluator.evaluate_array(array[:1])
+        batch = min(
+            timeit.repeat(lambda: evaluator.evaluate_array(array), number=1, repeat=3)
+        )
+        print(f"{line}, {batch / HANDS * 1e6:.2f}us per hand in a batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares cloning a deck at every node of a game tree path with copy.deepcopy,
+with a copy of the list of cards and with Deck.fork, at depths 10 to 20.
+Every node clones its parent's deck, draws a card and discards it.
+
+Run from the repository root with: python -m benchmarks.bench_fork
+"""
+
+import copy
+import timeit
+from collections.abc import Callable
+
+import pyCardDeck
+
+
+def list_copy(deck: pyCardDeck.Deck) -> pyCardDeck.Deck:
+    cloned = pyCardDeck.Deck(cards=list(deck), reshuffle=deck._reshuffle)
+    cloned._discard_pile = list(deck._discard_pile)
+    return cloned
+
+
+def path(deck: pyCardDeck.Deck, clone: Callable, depth: int) -> None:
+    for _ in range(depth):
+        deck = clone(deck)
+        deck.discard(deck.draw())
+
+
+def main() -> None:
+    standard = pyCardDeck.Deck()
+    standard.load_standard_deck()
+    big = pyCardDeck.Deck(
+        cards=list(range(1, 100_001)), storage=pyCardDeck.TreeList, rng=1
+    )
+    for name, deck in (("52 cards", standard), ("100k cards, TreeList", big)):
+        deck.shuffle()
+        for depth in (10, 15, 20):
+            timings = []
+            for clone in (copy.deepcopy, list_copy, pyCardDeck.Deck.fork):
+                number = 3 if clone is copy.deepcopy and len(deck) > 52 else 100
+                elapsed = min(
+                    timeit.repeat(
+                        lambda: path(deck, clone, depth), number=number, repeat=3
+                    )
+                )
+                timings.append(f"{elapsed / number * 1e6:10.1f}us")
+            print(f"{name}, depth {depth}: deepcopy/list copy/fork", *timings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares taking back a draw with the journal's undo, with a deepcopy taken
+before the draw and with loading a JSON export of the deck, for deck sizes
+from 52 to 100k cards.
+
+Run from the repository root with: python -m benchmarks.bench_journal
+"""
+
+import copy
+import timeit
+
+import pyCardDeck
+
+
+def undo(deck: pyCardDeck.Deck) -> None:
+    deck.draw()
+    deck.undo()
+
+
+def deepcopy(deck: pyCardDeck.Deck) -> None:
+    saved = copy.deepcopy(deck)
+    deck.draw()
+    deck.__dict__.update(saved.__dict__)
+
+
+def reload(deck: pyCardDeck.Deck) -> None:
+    saved = deck.export("json")
+    deck.draw()
+    deck.load(saved)
+
+
+def main() -> None:
+    for size in (52, 1000, 100_000):
+        timings = []
+        for take_back in (undo, deepcopy, reload):
+            deck = pyCardDeck.Deck(cards=list(range(1, size + 1)))
+            deck.start_journal()
+            number = 1000 if take_back is undo or size <= 1000 else 3
+            elapsed = min(
+                timeit.repeat(lambda: take_back(deck), number=number, repeat=3)
+            )
+            timings.append(f"{elapsed / number * 1e6:10.1f}us")
+        print(f"{size} cards: undo/deepcopy/export and load", *timings)
+
+
+if __name__ == "__main__":
+    main()
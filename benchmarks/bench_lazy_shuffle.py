@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares eager and lazy shuffling when only a few cards are drawn after each shuffle.
+
+Run from the repository root with: python -m benchmarks.bench_lazy_shuffle
+"""
+
+import timeit
+
+import pyCardDeck
+
+CASES = ((416, 10), (1_000_000, 7))
+
+
+def shuffle_and_draw(deck: pyCardDeck.Deck, number: int) -> None:
+    deck.shuffle()
+    deck.draw_many(number)
+    deck.add_many(range(number))
+
+
+def main() -> None:
+    print(f"{'cards':>9} {'drawn':>6} {'eager':>12} {'lazy':>12}")
+    for size, number in CASES:
+        results = []
+        for lazy in (False, True):
+            deck = pyCardDeck.Deck(cards=list(range(size)), rng=1, lazy_shuffle=lazy)
+            repeat = max(1, 100_000 // size)
+            seconds = min(
+                timeit.repeat(
+                    lambda: shuffle_and_draw(deck, number), number=repeat, repeat=3
+                )
+            )
+            results.append(seconds / repeat * 1e3)
+        print(f"{size:>9} {number:>6} {results[0]:>10.3f}ms {results[1]:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures what logging costs per draw: with DEBUG disabled, in fast mode,
+with DEBUG enabled (to a handler that drops the records) and with a trace hook.
+
+Run from the repository root with: python -m benchmarks.bench_logging
+"""
+
+import logging
+import timeit
+
+import pyCardDeck
+
+SIZE = 100_000
+
+
+def draws() -> float:
+    deck = pyCardDeck.Deck(cards=list(range(1, SIZE + 1)), reshuffle=False)
+    return min(timeit.repeat(deck.draw, number=SIZE // 10, repeat=10)) / (SIZE // 10)
+
+
+def main() -> None:
+    logger = logging.getLogger("pyCardDeck")
+    events = []
+    for name, fast, level, hook in (
+        ("DEBUG disabled", False, logging.WARNING, None),
+        ("fast mode", True, logging.WARNING, None),
+        ("DEBUG enabled", False, logging.DEBUG, None),
+        ("fast mode with trace hook", True, logging.WARNING, events.append),
+    ):
+        pyCardDeck.set_fast_mode(fast)
+        pyCardDeck.set_trace_hook(
+            None if hook is None else lambda event, deck, details: hook(event)
+        )
+        logger.setLevel(level)
+        print(f"{name}: {draws() * 1e9:.0f}ns per draw")
+    pyCardDeck.set_fast_mode(False)
+    pyCardDeck.set_trace_hook(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares auditing a game of 1000 draws and discards on a standard deck with a JSON
+export after every operation and with a replay log, by size and time, and measures
+how long replaying and verifying the log takes.
+
+Run from the repository root with: python -m benchmarks.bench_replay
+"""
+
+import io
+import time
+from collections.abc import Callable
+
+import pyCardDeck
+from pyCardDeck.replay import record, verify
+
+OPERATIONS = 1000
+
+
+def game(deck: pyCardDeck.Deck, after: Callable[[], None]) -> None:
+    for _ in range(OPERATIONS // 2):
+        card = deck.draw_random()
+        after()
+        deck.discard(card)
+        after()
+
+
+def standard_deck() -> pyCardDeck.Deck:
+    deck = pyCardDeck.Deck()
+    deck.load_standard_deck()
+    deck._reshuffle = True
+    return deck
+
+
+def main() -> None:
+    deck = standard_deck()
+    dumps = []
+    start = time.perf_counter()
+    game(deck, lambda: dumps.append(deck.export("json")))
+    elapsed = time.perf_counter() - start
+    size = sum(map(len, dumps))
+    print(f"export after every operation: {size / 1e3:8.0f}kB {elapsed:6.2f}s")
+
+    deck = standard_deck()
+    stream = io.StringIO()
+    start = time.perf_counter()
+    recorder = record(deck, stream, seed=1)
+    game(deck, lambda: None)
+    checkpoint = recorder.checkpoint()
+    elapsed = time.perf_counter() - start
+    log = stream.getvalue()
+    print(f"replay log:                   {len(log) / 1e3:8.0f}kB {elapsed:6.2f}s")
+
+    lines = log.splitlines()
+    start = time.perf_counter()
+    verify(lines, checkpoint)
+    print(f"replaying the log: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
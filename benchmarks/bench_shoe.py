@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares building and resetting a 6 deck shoe from standard decks by hand
+with Shoe, and measures how many simple blackjack hands a Shoe deals per minute.
+
+Run from the repository root with: python -m benchmarks.bench_shoe
+"""
+
+import timeit
+
+import pyCardDeck
+
+VALUES = {"J": 10, "Q": 10, "K": 10, "A": 11}
+
+
+def shoe_by_hand() -> pyCardDeck.Deck:
+    shoe = pyCardDeck.Deck()
+    for _ in range(6):
+        deck = pyCardDeck.Deck()
+        deck.load_standard_deck()
+        shoe.add_many(list(deck))
+    return shoe
+
+
+def reset_by_hand(shoe: pyCardDeck.Deck) -> None:
+    while not shoe.empty and len(shoe) > 1:
+        shoe.discard(shoe.draw())
+    shoe.discard(shoe.draw())
+
+
+def value(hand: list) -> int:
+    return sum(VALUES.get(card.rank) or int(card.rank) for card in hand)
+
+
+def play(shoe: pyCardDeck.Shoe, hands: int) -> None:
+    for _ in range(hands):
+        player, dealer = shoe.deal(2, 2)
+        while value(player) < 17:
+            player.append(shoe.draw())
+        while value(dealer) < 17:
+            dealer.append(shoe.draw())
+        if shoe.cut_card_reached:
+            shoe.reset()
+
+
+def main() -> None:
+    build = min(timeit.repeat(shoe_by_hand, number=10, repeat=3)) / 10
+    built = pyCardDeck.Shoe(decks=6)
+    reset = min(timeit.repeat(built.reset, number=100, repeat=3)) / 100
+    print(f"6 decks by hand {build * 1e3:.2f}ms, Shoe.reset {reset * 1e3:.3f}ms")
+    by_hand = shoe_by_hand()
+    back = min(timeit.repeat(lambda: reset_by_hand(by_hand), number=10, repeat=3)) / 10
+    print(f"dealing out and shuffling back a shoe by hand {back * 1e3:.2f}ms")
+    for lazy in (False, True):
+        shoe = pyCardDeck.Shoe(decks=6, rng=1, lazy_shuffle=lazy)
+        elapsed = min(timeit.repeat(lambda: play(shoe, 10_000), number=1, repeat=3))
+        print(
+            f"lazy_shuffle={lazy}: {10_000 / elapsed * 60 / 1e6:.2f}M hands per minute"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures how pyCardDeck.simulate scales with the number of worker processes,
+playing a hand of blackjack-like high card against the dealer per trial.
+
+Run from the repository root with: python -m benchmarks.bench_simulate
+"""
+
+import os
+import random
+import time
+
+import pyCardDeck
+from pyCardDeck.simulate import run
+
+TRIALS = 200_000
+VALUES = {"J": 10, "Q": 10, "K": 10, "A": 11}
+
+
+def new_deck(rng: random.Random) -> pyCardDeck.Deck:
+    deck = pyCardDeck.Deck(rng=rng)
+    deck.load_standard_deck()
+    return deck
+
+
+def value(hand: list) -> int:
+    return sum(VALUES.get(card.rank) or int(card.rank) for card in hand)
+
+
+def hand(deck: pyCardDeck.Deck) -> str:
+    deck.shuffle()
+    player, dealer = deck.deal(2, 2)
+    while value(player) < 17:
+        player.append(deck.draw())
+    if value(player) > 21:
+        return "dealer"
+    while value(dealer) < 17:
+        dealer.append(deck.draw())
+    if value(dealer) > 21 or value(player) > value(dealer):
+        return "player"
+    return "push" if value(player) == value(dealer) else "dealer"
+
+
+def main() -> None:
+    cores = os.cpu_count() or 1
+    workers = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    print(f"{cores} cores, {TRIALS} trials")
+    print(f"{'workers':>8} {'time':>10} {'speedup':>8}")
+    single = None
+    for count in workers:
+        start = time.perf_counter()
+        outcomes = run(hand, new_deck, TRIALS, seed=1, workers=count, chunk_size=5000)
+        elapsed = time.perf_counter() - start
+        single = single or elapsed
+        print(f"{count:>8} {elapsed:>9.2f}s {single / elapsed:>7.2f}x")
+    print(dict(outcomes))
+
+
+if __name__ == "__main__":
+    main()
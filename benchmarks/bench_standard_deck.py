@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures Deck.load_standard_deck: the first call reads the deck file,
+later calls copy the cached cards.
+
+Run from the repository root with: python -m benchmarks.bench_standard_deck
+"""
+
+import timeit
+
+import pyCardDeck
+from pyCardDeck.deck import _standard_deck_template
+
+NUMBER = 10_000
+
+
+def main() -> None:
+    _standard_deck_template.cache_clear()
+    first = timeit.timeit(lambda: pyCardDeck.Deck().load_standard_deck(), number=1)
+    later = min(
+        timeit.repeat(
+            lambda: pyCardDeck.Deck().load_standard_deck(), number=NUMBER, repeat=3
+        )
+    )
+    print(f"first call: {first * 1e3:.3f}ms")
+    print(f"later calls: {later / NUMBER * 1e6:.3f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Measures what instrumenting a deck with pyCardDeck.stats costs per draw and discard,
+and that decks that aren't instrumented run as fast as before.
+
+Run from the repository root with: python -m benchmarks.bench_stats
+"""
+
+import timeit
+
+import pyCardDeck
+from pyCardDeck.stats import StatsRegistry, instrument
+
+
+def cycle(deck: pyCardDeck.Deck) -> None:
+    for _ in range(1000):
+        deck.discard(deck.draw())
+
+
+def main() -> None:
+    for instrumented in (False, True):
+        deck = pyCardDeck.Deck(cards=list(range(1, 1001)))
+        if instrumented:
+            instrument(deck, [StatsRegistry()])
+        elapsed = min(timeit.repeat(lambda: cycle(deck), number=10, repeat=5))
+        print(
+            f"instrumented={instrumented}: "
+            f"{elapsed / 10_000 * 1e9:.0f}ns per draw and discard"
+        )
+
+
+if __name__ == "__main__":
+    main()
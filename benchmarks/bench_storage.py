@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares drawing and discarding with the top of the deck at the end of the list
+(how Deck stores cards) against keeping the top at index 0.
+
+Run from the repository root with: python -m benchmarks.bench_storage
+"""
+
+import timeit
+
+import pyCardDeck
+
+SIZES = (52, 416, 100_000)
+
+
+def front_storage(size: int) -> None:
+    cards = list(range(size))
+    discard = []
+    while cards:
+        discard.insert(0, cards.pop(0))
+
+
+def end_storage(size: int) -> None:
+    cards = list(range(size))
+    discard = []
+    while cards:
+        discard.append(cards.pop())
+
+
+def deck_storage(size: int) -> None:
+    deck = pyCardDeck.Deck(
+        cards=list(range(size)), reshuffle=False, discard=pyCardDeck.Deck()
+    )
+    while not deck.empty:
+        deck.discard(deck.draw())
+
+
+def main() -> None:
+    print(f"{'cards':>8} {'top at 0':>12} {'top at end':>12} {'Deck':>12}")
+    for size in SIZES:
+        number = max(1, 100_000 // size)
+        front = min(timeit.repeat(lambda: front_storage(size), number=number, repeat=3))
+        end = min(timeit.repeat(lambda: end_storage(size), number=number, repeat=3))
+        deck = min(timeit.repeat(lambda: deck_storage(size), number=number, repeat=3))
+        print(
+            f"{size:>8} {front / number * 1e3:>10.3f}ms {end / number * 1e3:>10.3f}ms"
+            f" {deck / number * 1e3:>10.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
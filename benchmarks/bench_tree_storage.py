@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compares list and TreeList storage for inserting cards at arbitrary positions
+and drawing random cards, to show at which deck size TreeList overtakes lists.
+
+Run from the repository root with: python -m benchmarks.bench_tree_storage
+"""
+
+import timeit
+
+import pyCardDeck
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+OPERATIONS = 2_000
+
+
+def churn(deck: pyCardDeck.Deck) -> None:
+    for position in range(OPERATIONS):
+        deck.add_single(position, position=(position * 7919) % len(deck))
+        deck.draw_random()
+
+
+def main() -> None:
+    print(f"{'cards':>9} {'list':>12} {'TreeList':>12}   (per insert + random draw)")
+    for size in SIZES:
+        results = []
+        for storage in (list, pyCardDeck.TreeList):
+            deck = pyCardDeck.Deck(cards=list(range(size)), rng=1, storage=storage)
+            seconds = min(timeit.repeat(lambda: churn(deck), number=1, repeat=3))
+            results.append(seconds / OPERATIONS * 1e6)
+        print(f"{size:>9} {results[0]:>10.2f}us {results[1]:>10.2f}us")
+
+
+if __name__ == "__main__":
+    main()
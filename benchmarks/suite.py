@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Times every Deck operation across deck sizes and kinds of cards, writes the results
+to a JSON file and flags regressions against a stored baseline.
+
+Run from the repository root with::
+
+    python -m benchmarks.suite --output baseline.json
+    # ... change something ...
+    python -m benchmarks.suite --output new.json --baseline baseline.json
+
+Times are seconds per operation, the best of a few rounds, each round working on
+a freshly built deck. With a baseline, operations that got slower by more than
+the threshold are listed and the exit status is 1. Only operations measured
+in both runs are compared, so a quick run can be checked against a full baseline.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pyCardDeck
+
+SIZES = (52, 1_000, 100_000, 1_000_000)
+KINDS = ("str", "int", "object")
+# Stop repeating an operation after this many seconds or rounds, whichever comes first
+MIN_TIME = 0.2
+MAX_ROUNDS = 5
+THRESHOLD = 0.25
+
+
+def make_cards(size: int, kind: str) -> list:
+    if kind == "str":
+        return ["card {}".format(number) for number in range(size)]
+    if kind == "int":
+        # 0 isn't a card
+        return list(range(1, size + 1))
+    return [pyCardDeck.BaseCard("card {}".format(number)) for number in range(size)]
+
+
+def cheap(size: int) -> int:
+    """
+    Operations per round of an operation that doesn't depend on the deck size,
+    leaving a card in the deck so it never reshuffles
+    """
+    return max(min(size - 1, 1000), 1)
+
+
+def linear(size: int) -> int:
+    """
+    Operations per round of an operation that walks the deck
+    """
+    return max(min(size - 1, 100_000 // size), 1)
+
+
+def prepare_deck(cards: list, count: int) -> tuple:
+    return (pyCardDeck.Deck(cards=cards),)
+
+
+def prepare_targets(cards: list, count: int) -> tuple:
+    deck = pyCardDeck.Deck(cards=cards)
+    return deck, random.Random(0).sample(cards, count)
+
+
+def prepare_new_cards(cards: list, count: int) -> tuple:
+    deck = pyCardDeck.Deck(cards=cards)
+    return deck, cards[:count]
+
+
+def prepare_discarded(cards: list, count: int) -> tuple:
+    deck = pyCardDeck.Deck(cards=cards[:1])
+    deck._discard_pile = list(cards)
+    return (deck,)
+
+
+def prepare_exported(cards: list, count: int) -> tuple:
+    return (pyCardDeck.Deck(cards=cards).export("json"),)
+
+
+def repeat(method: str) -> Callable:
+    def run(count: int, deck: pyCardDeck.Deck) -> None:
+        call = getattr(deck, method)
+        for _ in range(count):
+            call()
+
+    return run
+
+
+def with_targets(method: str) -> Callable:
+    def run(count: int, deck: pyCardDeck.Deck, targets: list) -> None:
+        call = getattr(deck, method)
+        for card in targets:
+            call(card)
+
+    return run
+
+
+def add_many(count: int, deck: pyCardDeck.Deck, cards: list) -> None:
+    deck.add_many(cards)
+
+
+def shuffle_back(count: int, deck: pyCardDeck.Deck) -> None:
+    deck.shuffle_back()
+
+
+def export(count: int, deck: pyCardDeck.Deck) -> None:
+    deck.export("json")
+
+
+def load(count: int, exported: str) -> None:
+    pyCardDeck.Deck().load(exported)
+
+
+def load_standard_deck(count: int, deck: pyCardDeck.Deck) -> None:
+    for _ in range(count):
+        deck.load_standard_deck()
+
+
+def once(size: int) -> int:
+    return 1
+
+
+# Name: (operations per round, preparing the arguments outside the timing, timed function)
+OPERATIONS: dict[str, tuple[Callable, Callable, Callable]] = {
+    "draw": (cheap, prepare_deck, repeat("draw")),
+    "draw_bottom": (cheap, prepare_deck, repeat("draw_bottom")),
+    "draw_random": (cheap, prepare_deck, repeat("draw_random")),
+    "draw_specific": (linear, prepare_targets, with_targets("draw_specific")),
+    "card_exists": (linear, prepare_targets, with_targets("card_exists")),
+    "add_single": (linear, prepare_new_cards, with_targets("add_single")),
+    "add_many": (once, lambda cards, count: prepare_new_cards(cards, 1000), add_many),
+    "shuffle": (once, prepare_deck, repeat("shuffle")),
+    "shuffle_back": (once, prepare_discarded, shuffle_back),
+    "discard": (cheap, prepare_targets, with_targets("discard")),
+    "export": (once, prepare_deck, export),
+    "load": (once, prepare_exported, load),
+}
+# Operations that don't depend on the size or kind of the deck, measured once
+FIXED: dict[str, tuple[Callable, Callable, Callable]] = {
+    "load_standard_deck": (
+        lambda size: 100,
+        lambda cards, count: (pyCardDeck.Deck(),),
+        load_standard_deck,
+    ),
+}
+
+
+def measure(operation: tuple, cards: list) -> float:
+    """
+    :return:    Best time of one operation in seconds
+    """
+    per_round, prepare, run = operation
+    count = per_round(len(cards))
+    best = float("inf")
+    spent = 0.0
+    for _ in range(MAX_ROUNDS):
+        arguments = prepare(cards, count)
+        start = time.perf_counter()
+        run(count, *arguments)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed / count)
+        spent += elapsed
+        if spent >= MIN_TIME:
+            break
+    return best
+
+
+def run_suite(
+    sizes: tuple[int, ...], kinds: tuple[str, ...], operations: tuple[str, ...]
+) -> list[dict[str, Any]]:
+    results = []
+    for name in operations:
+        if name in FIXED:
+            seconds = measure(FIXED[name], [])
+            results.append(result(name, 52, "object", seconds))
+            continue
+        for kind in kinds:
+            for size in sizes:
+                seconds = measure(OPERATIONS[name], make_cards(size, kind))
+                results.append(result(name, size, kind, seconds))
+    return results
+
+
+def result(name: str, size: int, kind: str, seconds: float) -> dict[str, Any]:
+    print("{:<20}{:>10}{:>8}{:>14.3f}us".format(name, size, kind, seconds * 1e6))
+    return {"operation": name, "size": size, "kind": kind, "seconds": seconds}
+
+
+def compare(
+    baseline: list[dict[str, Any]], results: list[dict[str, Any]], threshold: float
+) -> list[tuple[dict[str, Any], float]]:
+    """
+    :return:    Results slower than their baseline by more than `threshold`,
+                with how many times slower they got
+    """
+    stored = {
+        (entry["operation"], entry["size"], entry["kind"]): entry["seconds"]
+        for entry in baseline
+    }
+    regressions = []
+    for entry in results:
+        before = stored.get((entry["operation"], entry["size"], entry["kind"]))
+        if before and entry["seconds"] / before > 1 + threshold:
+            regressions.append((entry, entry["seconds"] / before))
+    return regressions
+
+
+def main(arguments: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)))
+    parser.add_argument("--kinds", default=",".join(KINDS))
+    parser.add_argument(
+        "--operations", default=",".join([*OPERATIONS, *FIXED]), help="comma separated"
+    )
+    parser.add_argument("--output", help="JSON file to write the results to")
+    parser.add_argument("--baseline", help="JSON file of earlier results to compare to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="slowdown flagged as a regression, 0.25 for 25%%",
+    )
+    options = parser.parse_args(arguments)
+    operations = tuple(options.operations.split(","))
+    unknown = set(operations) - set(OPERATIONS) - set(FIXED)
+    if unknown:
+        parser.error("unknown operations: {}".format(", ".join(sorted(unknown))))
+    results = run_suite(
+        tuple(int(size) for size in options.sizes.split(",")),
+        tuple(options.kinds.split(",")),
+        operations,
+    )
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "version": pyCardDeck.__version__,
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+    if not options.baseline:
+        return 0
+    with open(options.baseline) as file:
+        baseline = json.load(file)["results"]
+    regressions = compare(baseline, results, options.threshold)
+    for entry, slower in regressions:
+        print(
+            "REGRESSION {operation} size={size} kind={kind}: ".format(**entry)
+            + "{:.2f}x slower".format(slower)
+        )
+    print("{} regressions against {}".format(len(regressions), options.baseline))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
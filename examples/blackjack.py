@@ -21,8 +21,8 @@ class Player:
 
 class BlackjackGame:
     def __init__(self, players: List[Player]):
-        self.deck = pyCardDeck.Deck()
-        self.deck.load_standard_deck()
+        # Six standard decks, like the shoes of casino tables
+        self.deck = pyCardDeck.Shoe(decks=6)
         self.players = players
         self.scores = {}
         print("Created a game with {} players.".format(len(self.players)))
@@ -54,11 +54,9 @@ class BlackjackGame:
         """
         Deals two cards to each player.
         """
-        for _ in range(2):
-            for p in self.players:
-                newcard = self.deck.draw()
-                p.hand.append(newcard)
-                print("Dealt {} the {}.".format(p.name, str(newcard)))
+        self.deck.deal([p.hand for p in self.players], 2)
+        for p in self.players:
+            print("Dealt {} the {}.".format(p.name, " and ".join(map(str, p.hand))))
 
     def find_winner(self):
         """
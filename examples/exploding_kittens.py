@@ -149,9 +149,7 @@ class Game:
 
     def deal_to_players(self):
         print("Dealing cards to players")
-        for _ in range(4):
-            for player in self.players:
-                player.hand.append(self.deck.draw())
+        self.deck.deal([player.hand for player in self.players], 4)
 
     def ask_for_nope(self):
         noped = False
@@ -10,6 +10,7 @@ import pyCardDeck
 # noinspection PyCompatibility
 from typing import List
 from pyCardDeck.cards import PokerCard
+from pyCardDeck.evaluator import evaluate, hand_class
 
 
 class Player:
@@ -43,7 +44,8 @@ class PokerTable:
         self.river_or_flop()
         # Imagine post-turn, pre-river logic for betting here
         self.river_or_flop()
-        # Imagine some more betting and winner decision here
+        # Imagine some more betting here
+        self.showdown()
         self.cleanup()
 
     def deal_cards(self, number: int):
@@ -53,11 +55,11 @@ class PokerTable:
         :param number:  How many cards to deal
         :type number:   int
         """
-        for _ in range(0, number):
-            for player in self.players:
-                card = self.deck.draw()
-                player.hand.append(card)
-                print("Dealt {} to player {}".format(card, player))
+        self.deck.deal([player.hand for player in self.players], number)
+        for player in self.players:
+            print(
+                "Dealt {} to player {}".format(", ".join(map(str, player.hand)), player)
+            )
 
     def flop(self):
         """
@@ -83,6 +85,19 @@ class PokerTable:
         self.table_cards.append(card)
         print("New card on the table: {}".format(card))
 
+    def showdown(self):
+        """
+        Finds the best hand, lower strength is better
+        """
+        strengths = {
+            player: evaluate(player.hand + self.table_cards) for player in self.players
+        }
+        best = min(strengths.values())
+        winners = [player for player, strength in strengths.items() if strength == best]
+        print(
+            "{} won with {}".format(" and ".join(map(str, winners)), hand_class(best))
+        )
+
     def cleanup(self):
         """
         Cleans up the table to gather all the cards back
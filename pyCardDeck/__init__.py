@@ -17,6 +17,11 @@ __version__ = "1.5.0"
 from .deck import *
 from .errors import *
 from .cards import *
+from .rng import *
+from .storage import *
+from .catalog import *
+from .compact import *
+from .shoe import *
 import logging
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
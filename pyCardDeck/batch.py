@@ -0,0 +1,399 @@
+"""
+Many decks of the same cards kept in one NumPy array, for servers running thousands
+of tables at once. Needs NumPy, so it isn't imported with :py:mod:`pyCardDeck`::
+
+    from pyCardDeck.batch import DeckBatch
+"""
+
+import logging
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+import numpy
+
+from .cards import CardType
+from .catalog import CardCatalog
+from .deck import Deck
+from .errors import CardNotFound, NoCards, NotACard, OutOfCards
+
+log = logging.getLogger(__name__)
+
+
+class DeckBatch:
+    """
+    Any number of decks starting with the same cards, stored as rows of one 2-D array
+    of catalog IDs.
+
+    Each row holds the cards of a deck from the top, preceded by free slots
+    that drawn cards leave behind, and the batch keeps where every row's top card is.
+    Shuffling and drawing all decks at once then takes a few array operations
+    instead of a Python call per deck::
+
+        batch = DeckBatch(20_000, CardCatalog.standard(), rng=7)
+        batch.shuffle_all()
+        hands = batch.draw_all(2)
+        catalog.cards(hands[0])
+
+    Single decks are available as :py:class:`DeckRow` views that work like a :ref:`Deck`,
+    for game code written for decks::
+
+        deck = batch[42]
+        deck.discard(deck.draw())
+
+    :param decks:       Number of decks
+    :param cards:       Cards of every deck, the first card is the top of the deck.
+                        A catalog means all of its cards, in the order of their IDs.
+    :param catalog:     Catalog giving the cards their IDs, a new one by default
+    :param reshuffle:   Whether the decks shuffle their discard piles back when they run out
+    :param rng:         NumPy Generator or seed, all randomness of the batch comes from it
+    """
+
+    def __init__(
+        self,
+        decks: int,
+        cards: Sequence[CardType] | CardCatalog,
+        catalog: CardCatalog | None = None,
+        reshuffle: bool = True,
+        rng: Any = None,
+    ) -> None:
+        if isinstance(cards, CardCatalog):
+            catalog = cards
+            cards = list(catalog)
+        self.catalog = CardCatalog() if catalog is None else catalog
+        self._base = numpy.array([self.catalog.add(card) for card in cards])
+        self._reshuffle = reshuffle
+        self._rng = numpy.random.default_rng(rng)
+        self._size = decks
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Puts every deck back into its starting order and empties the discard piles
+        """
+        dtype = numpy.uint16 if len(self.catalog) <= 0x10000 else numpy.uint32
+        self._ids = numpy.tile(self._base.astype(dtype), (self._size, 1))
+        self._tops = numpy.zeros(self._size, dtype=numpy.intp)
+        self._discards: list[list[int]] = [[] for _ in range(self._size)]
+
+    @property
+    def cards_left(self) -> numpy.ndarray:
+        """
+        :return:    Number of cards in each deck
+        """
+        return self._ids.shape[1] - self._tops
+
+    def shuffle_all(self) -> None:
+        """
+        Shuffles the remaining cards of every deck with one batched permutation
+        """
+        if not self._tops.any():
+            self._ids = self._rng.permuted(self._ids, axis=1)
+        else:
+            # Free slots sort in front of the cards, which get random keys
+            columns = numpy.arange(self._ids.shape[1])
+            keys = self._rng.random(self._ids.shape)
+            keys[columns < self._tops[:, None]] = -1
+            order = numpy.argsort(keys, axis=1, kind="stable")
+            self._ids = numpy.take_along_axis(self._ids, order, axis=1)
+        log.debug("%i decks shuffled", self._size)
+
+    def draw_all(self, number: int = 1) -> numpy.ndarray:
+        """
+        Draws cards from the top of every deck at once
+
+        Unlike drawing from single decks, this doesn't shuffle discard piles back,
+        every deck needs enough cards.
+
+        :param number:          How many cards to draw from each deck
+        :return:                IDs of the drawn cards, a row per deck in the order they were drawn
+        :raises OutOfCards:     when a deck has less than `number` cards
+        """
+        if (self.cards_left < number).any():
+            raise OutOfCards("Not every deck has {} cards to draw".format(number))
+        positions = self._tops[:, None] + numpy.arange(number)
+        drawn = numpy.take_along_axis(self._ids, positions, axis=1)
+        self._tops += number
+        return drawn
+
+    def draw(self, deck: int) -> CardType:
+        """
+        Draws the top card of a single deck, see :py:meth:`Deck.draw`
+
+        :param deck:    Index of the deck
+        :return:        Drawn card
+        """
+        return self[deck].draw()
+
+    def deck(self, deck: int) -> "DeckRow":
+        """
+        :param deck:    Index of the deck
+        :return:        View of the deck working like a :ref:`Deck`
+        """
+        if not -self._size <= deck < self._size:
+            raise IndexError("DeckBatch index out of range")
+        return DeckRow(self, deck % self._size)
+
+    def _grow(self, slots: int) -> None:
+        """
+        Adds free slots in front of every row, for decks that got more cards than they started with
+        """
+        self._ids = numpy.pad(self._ids, ((0, 0), (slots, 0)))
+        self._tops += slots
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, deck: int) -> "DeckRow":
+        return self.deck(deck)
+
+    def __iter__(self) -> Iterator["DeckRow"]:
+        return (DeckRow(self, row) for row in range(self._size))
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return "DeckBatch(decks={0}, cards={1})".format(self._size, len(self._base))
+
+
+class DeckRow:
+    """
+    One deck of a :py:class:`DeckBatch`, with the card handling methods of a :ref:`Deck`.
+    It holds no cards itself, all changes go straight to the batch.
+    Use :py:meth:`to_deck` for a standalone copy, for example to export it.
+    """
+
+    def __init__(self, batch: DeckBatch, row: int) -> None:
+        self._batch = batch
+        self._row = row
+
+    @property
+    def _cards(self) -> numpy.ndarray:
+        """
+        :return:    View of the IDs of the cards in the deck, from the top
+        """
+        return self._batch._ids[self._row, self._batch._tops[self._row] :]
+
+    def _take(self, depth: int) -> CardType:
+        """
+        Removes a card, moving the cards above it down by one slot
+
+        :param depth:   Position of the card, 0 is the top
+        :return:        Removed card
+        """
+        batch = self._batch
+        top = batch._tops[self._row]
+        ids = batch._ids[self._row]
+        card_id = int(ids[top + depth])
+        ids[top + 1 : top + depth + 1] = ids[top : top + depth].copy()
+        batch._tops[self._row] = top + 1
+        return batch.catalog[card_id]
+
+    def _put(self, card_ids: Sequence[int], depth: int) -> None:
+        """
+        Inserts cards, moving the cards above them up
+
+        :param card_ids:    IDs of the cards, the first one ends up on top
+        :param depth:       Position of the first card, 0 is the top
+        """
+        batch = self._batch
+        number = len(card_ids)
+        if batch._tops[self._row] < number:
+            batch._grow(max(number, batch._ids.shape[1] // 2))
+        top = batch._tops[self._row]
+        ids = batch._ids[self._row]
+        ids[top - number : top - number + depth] = ids[top : top + depth].copy()
+        ids[top - number + depth : top + depth] = card_ids
+        batch._tops[self._row] = top - number
+
+    def _draw(self, depth: int, position: str) -> CardType:
+        """
+        Draws the card at `depth`, like Deck does, with a reshuffle when the deck runs out
+        """
+        if not len(self):
+            if not self._batch._reshuffle:
+                raise OutOfCards(
+                    "You tried to draw. No more cards to be drawn. Position: %s",
+                    position,
+                )
+            raise NoCards(
+                "You tried to draw from an empty deck. Position: %s", position
+            )
+        card = self._take(depth)
+        self.reshuffle_if_empty()
+        return card
+
+    def draw(self) -> CardType:
+        """
+        See :py:meth:`Deck.draw`
+        """
+        return self._draw(0, "top")
+
+    def draw_bottom(self) -> CardType:
+        """
+        See :py:meth:`Deck.draw_bottom`
+        """
+        return self._draw(len(self) - 1, "bottom")
+
+    def draw_random(self) -> CardType:
+        """
+        See :py:meth:`Deck.draw_random`
+        """
+        return self._draw(int(self._batch._rng.integers(max(len(self), 1))), "random")
+
+    def draw_many(self, number: int, position: str = "top") -> list[CardType]:
+        """
+        See :py:meth:`Deck.draw_many`
+        """
+        draw = {
+            "top": self.draw,
+            "bottom": self.draw_bottom,
+            "random": self.draw_random,
+        }
+        if position not in draw:
+            raise ValueError(f"Unknown position: {position}")
+        return [draw[position]() for _ in range(number)]
+
+    def deal(
+        self, seats: int | Sequence[list[CardType]], cards_each: int = 1
+    ) -> list[list[CardType]]:
+        """
+        See :py:meth:`Deck.deal`
+        """
+        if isinstance(seats, int):
+            hands: list[list[CardType]] = [[] for _ in range(seats)]
+        else:
+            hands = list(seats)
+        drawn: list[CardType] = []
+        try:
+            for _ in range(len(hands) * cards_each):
+                drawn.append(self.draw())
+        finally:
+            for seat, hand in enumerate(hands):
+                hand.extend(drawn[seat :: len(hands)])
+        return hands
+
+    def draw_specific(self, specific_card: CardType) -> CardType:
+        """
+        See :py:meth:`Deck.draw_specific`
+        """
+        if not len(self):
+            raise NoCards("You tried to draw a specific card from an empty deck")
+        depth = self._depth_of(specific_card)
+        if depth is None:
+            raise CardNotFound("Specific card not found in the deck")
+        card = self._take(depth)
+        self.reshuffle_if_empty()
+        return card
+
+    def card_exists(self, card: CardType) -> bool:
+        """
+        See :py:meth:`Deck.card_exists`
+        """
+        return self._depth_of(card) is not None
+
+    def _depth_of(self, card: CardType) -> int | None:
+        card_id = self._batch.catalog.find(card)
+        if card_id is None:
+            return None
+        found = numpy.flatnonzero(self._cards == card_id)
+        return int(found[0]) if len(found) else None
+
+    def shuffle(self) -> None:
+        """
+        See :py:meth:`Deck.shuffle`
+        """
+        if not len(self):
+            raise NoCards("You tried to shuffle an empty deck")
+        self._batch._rng.shuffle(self._cards)
+
+    def reshuffle_if_empty(self) -> None:
+        """
+        See :py:meth:`Deck.reshuffle_if_empty`
+        """
+        if not len(self) and self._batch._reshuffle:
+            self.shuffle_back()
+
+    def shuffle_back(self) -> None:
+        """
+        See :py:meth:`Deck.shuffle_back`
+        """
+        pile = self._batch._discards[self._row]
+        if pile:
+            self._put(pile, 0)
+        self.shuffle()
+        pile.clear()
+
+    def discard(self, card: CardType) -> None:
+        """
+        See :py:meth:`Deck.discard`
+        """
+        if not card and type(card) != int:
+            raise NotACard(
+                "You tried to insert {} (rank({}) into a discard pile".format(
+                    card, type(card).__name__
+                )
+            )
+        self._batch._discards[self._row].append(self._batch.catalog.add(card))
+
+    def clear(self) -> None:
+        """
+        See :py:meth:`Deck.clear`
+        """
+        self._batch._tops[self._row] = self._batch._ids.shape[1]
+
+    def add_single(self, card: CardType, position: int | None = None) -> None:
+        """
+        See :py:meth:`Deck.add_single`
+        """
+        if position is None:
+            position = int(self._batch._rng.integers(len(self) + 1))
+        elif position < 0:
+            position = max(position + len(self), 0)
+        self._put([self._batch.catalog.add(card)], min(position, len(self)))
+
+    def add_many(self, cards: Sequence[CardType]) -> None:
+        """
+        See :py:meth:`Deck.add_many`
+        """
+        for card in cards:
+            self.add_single(card)
+
+    def show_top(self, number: int) -> list[CardType]:
+        """
+        See :py:meth:`Deck.show_top`
+        """
+        return self[0:number]
+
+    def to_deck(self) -> Deck:
+        """
+        :return:    :ref:`Deck` with the cards and discard pile of this one
+        """
+        deck = Deck(cards=list(self), reshuffle=self._batch._reshuffle)
+        deck._discard_pile = self._batch.catalog.cards(self._batch._discards[self._row])
+        return deck
+
+    @property
+    def cards_left(self) -> int:
+        return len(self)
+
+    @property
+    def discarded(self) -> int:
+        return len(self._batch._discards[self._row])
+
+    @property
+    def empty(self) -> bool:
+        return not len(self)
+
+    def __len__(self) -> int:
+        return int(self._batch._ids.shape[1] - self._batch._tops[self._row])
+
+    def __getitem__(self, position: int | slice) -> CardType | list[CardType]:
+        if isinstance(position, slice):
+            return self._batch.catalog.cards(self._cards[position].tolist())
+        return self._batch.catalog[int(self._cards[position])]
+
+    def __iter__(self) -> Iterator[CardType]:
+        return iter(self._batch.catalog.cards(self._cards.tolist()))
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return "DeckRow(row={0}, cards={1}, discarded={2})".format(
+            self._row, self.cards_left, self.discarded
+        )
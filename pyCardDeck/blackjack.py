@@ -0,0 +1,314 @@
+"""
+Blackjack simulation for evaluating hit and stand strategies over millions of hands.
+Needs NumPy, so it isn't imported with :py:mod:`pyCardDeck`::
+
+    from pyCardDeck.blackjack import basic_strategy, simulate
+
+    result = simulate(10_000_000, basic_strategy(), rng=7)
+    print(result.ev, result.low, result.high)
+
+Cards are represented by their blackjack values, 2 to 10 and 11 for an ace,
+and shoes by the number of cards of every value left in them. A batch of hands
+is played in lock step: every round of hitting draws a card for all hands
+that still hit, picked from their shoes' remaining cards with one array operation.
+
+Every hand is dealt off the top of a freshly shuffled shoe, player and dealer
+alternating for the first two cards, the dealer's first card face up.
+The player only hits or stands, the dealer peeks for blackjack and doesn't
+take cards when the player busted. :py:func:`play_reference` plays the same rules
+on a real :py:class:`shoe.Shoe`, card by card.
+"""
+
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+import numpy
+
+from .cards import CardType
+from .shoe import Shoe
+
+# Cards of every value in one deck, from 2 to 11 (the ace)
+DECK_COUNTS = (4, 4, 4, 4, 4, 4, 4, 4, 16, 4)
+# Hands played at once, bounds the memory of a batch
+BATCH = 100_000
+
+
+class Rules(NamedTuple):
+    """
+    Table rules
+
+    :param decks:               Decks in the shoe
+    :param dealer_hits_soft_17: Whether the dealer hits a soft 17 (H17) instead of standing (S17)
+    :param blackjack_pays:      Payout of a player's blackjack, 1.5 for 3:2
+    """
+
+    decks: int = 6
+    dealer_hits_soft_17: bool = False
+    blackjack_pays: float = 1.5
+
+
+class Result(NamedTuple):
+    """
+    Outcome of a simulation, in bets won per hand
+
+    :param ev:      Expected value per hand
+    :param stderr:  Standard error of the expected value
+    :param low:     Lower bound of the 95% confidence interval
+    :param high:    Upper bound of the 95% confidence interval
+    :param hands:   Number of hands played
+    """
+
+    ev: float
+    stderr: float
+    low: float
+    high: float
+    hands: int
+
+
+def basic_strategy() -> numpy.ndarray:
+    """
+    Hit and stand part of the basic strategy for multi-deck games
+
+    :return:    Strategy table, True to hit, indexed by whether the hand is soft,
+                the player's total (up to 31) and the dealer's up card value (2 to 11)
+    """
+    strategy = threshold_strategy(17)
+    for up in range(2, 7):
+        strategy[0, 13:17, up] = False
+    strategy[0, 12, 4:7] = False
+    strategy[1, 18, 2:9] = False
+    strategy[1, 19:, :] = False
+    strategy[1, 18, 9:] = True
+    return strategy
+
+
+def threshold_strategy(stand: int) -> numpy.ndarray:
+    """
+    Strategy that hits below a total, soft or hard, like the dealer does
+
+    :param stand:   Lowest total to stand on
+    :return:        Strategy table, see :py:func:`basic_strategy`
+    """
+    strategy = numpy.zeros((2, 32, 12), dtype=bool)
+    strategy[:, :stand, :] = True
+    return strategy
+
+
+def simulate(
+    hands: int,
+    strategy: numpy.ndarray,
+    rules: Rules = Rules(),
+    rng: Any = None,
+) -> Result:
+    """
+    Plays hands in vectorized batches
+
+    :param hands:       Number of hands to play
+    :param strategy:    Strategy table, see :py:func:`basic_strategy`
+    :param rules:       Table rules
+    :param rng:         NumPy Generator or seed
+    :return:            Expected value with its confidence interval
+    """
+    rng = numpy.random.default_rng(rng)
+    total = 0.0
+    squares = 0.0
+    for start in range(0, hands, BATCH):
+        payouts = play_batch(min(BATCH, hands - start), strategy, rules, rng)
+        total += payouts.sum()
+        squares += numpy.square(payouts).sum()
+    return _result(total, squares, hands)
+
+
+def play_batch(
+    hands: int,
+    strategy: numpy.ndarray,
+    rules: Rules = Rules(),
+    rng: Any = None,
+    dealt: list | None = None,
+) -> numpy.ndarray:
+    """
+    Plays a batch of hands at once
+
+    :param hands:       Number of hands
+    :param strategy:    Strategy table, see :py:func:`basic_strategy`
+    :param rules:       Table rules
+    :param rng:         NumPy Generator or seed
+    :param dealt:       List to append the values of the cards drawn in every step to,
+                        with 0 for hands that didn't draw, for replaying the hands
+    :return:            Payout of every hand
+    """
+    rng = numpy.random.default_rng(rng)
+    counts = numpy.tile(numpy.array(DECK_COUNTS) * rules.decks, (hands, 1))
+    everyone = numpy.ones(hands, dtype=bool)
+
+    def draw(drawing: numpy.ndarray) -> numpy.ndarray:
+        cumulative = counts.cumsum(axis=1)
+        picked = rng.random(hands) * cumulative[:, -1]
+        index = (cumulative > picked[:, None]).argmax(axis=1)
+        rows = numpy.flatnonzero(drawing)
+        counts[rows, index[rows]] -= 1
+        values = numpy.where(drawing, index + 2, 0)
+        if dealt is not None:
+            dealt.append(values)
+        return values
+
+    player = _Hands(hands)
+    dealer = _Hands(hands)
+    player.add(draw(everyone))
+    up = draw(everyone)
+    dealer.add(up)
+    player.add(draw(everyone))
+    dealer.add(draw(everyone))
+
+    player_blackjack = player.total == 21
+    dealer_blackjack = dealer.total == 21
+    hitting = ~(player_blackjack | dealer_blackjack)
+    hitting &= strategy[player.soft, player.total, up]
+    while hitting.any():
+        player.add(draw(hitting))
+        hitting &= (player.total <= 21) & strategy[
+            player.soft, numpy.minimum(player.total, 31), up
+        ]
+
+    playing = ~(player_blackjack | dealer_blackjack) & (player.total <= 21)
+    hitting = playing & dealer.hits(rules)
+    while hitting.any():
+        dealer.add(draw(hitting))
+        hitting &= dealer.hits(rules)
+
+    payouts = numpy.sign(player.total - dealer.total).astype(float)
+    payouts[dealer.total > 21] = 1
+    payouts[player.total > 21] = -1
+    payouts[dealer_blackjack] = -1
+    payouts[player_blackjack] = rules.blackjack_pays
+    payouts[player_blackjack & dealer_blackjack] = 0
+    return payouts
+
+
+def play_reference(
+    hands: int,
+    strategy: numpy.ndarray,
+    rules: Rules = Rules(),
+    rng: Any = None,
+) -> Result:
+    """
+    Plays hands one card at a time from a :py:class:`shoe.Shoe`, as slow reference
+    for :py:func:`simulate`
+
+    :param hands:       Number of hands to play
+    :param strategy:    Strategy table, see :py:func:`basic_strategy`
+    :param rules:       Table rules
+    :param rng:         Seed or random source of the shoe
+    :return:            Expected value with its confidence interval
+    """
+    shoe = Shoe(decks=rules.decks, rng=rng)
+    total = 0.0
+    squares = 0.0
+    for _ in range(hands):
+        shoe.reset()
+        payout = play_hand(shoe.draw, strategy, rules)
+        total += payout
+        squares += payout * payout
+    return _result(total, squares, hands)
+
+
+def play_hand(
+    draw: Callable[[], CardType], strategy: numpy.ndarray, rules: Rules = Rules()
+) -> float:
+    """
+    Plays one hand card by card
+
+    :param draw:        Draws the next card, for example :py:meth:`Deck.draw`
+    :param strategy:    Strategy table, see :py:func:`basic_strategy`
+    :param rules:       Table rules
+    :return:            Payout of the hand
+    """
+    player = [card_value(draw())]
+    up = card_value(draw())
+    player.append(card_value(draw()))
+    dealer = [up, card_value(draw())]
+    player_total, player_soft = hand_total(player)
+    dealer_total, dealer_soft = hand_total(dealer)
+    if player_total == 21 or dealer_total == 21:
+        if player_total == dealer_total:
+            return 0.0
+        return rules.blackjack_pays if player_total == 21 else -1.0
+    while player_total <= 21 and strategy[int(player_soft), player_total, up]:
+        player.append(card_value(draw()))
+        player_total, player_soft = hand_total(player)
+    if player_total > 21:
+        return -1.0
+    while dealer_total < 17 or (
+        dealer_total == 17 and dealer_soft and rules.dealer_hits_soft_17
+    ):
+        dealer.append(card_value(draw()))
+        dealer_total, dealer_soft = hand_total(dealer)
+    if dealer_total > 21 or player_total > dealer_total:
+        return 1.0
+    return 0.0 if player_total == dealer_total else -1.0
+
+
+def card_value(card: CardType) -> int:
+    """
+    :param card:    Card with a rank, like :py:class:`cards.PokerCard`, or a value
+    :return:        Blackjack value of the card, 11 for an ace
+    """
+    if isinstance(card, int):
+        return card
+    if card.rank == "A":
+        return 11
+    if card.rank in ("J", "Q", "K"):
+        return 10
+    return int(card.rank)
+
+
+def hand_total(values: list[int]) -> tuple[int, bool]:
+    """
+    :param values:  Values of the cards in a hand
+    :return:        Best total of the hand and whether it's soft, with an ace counted as 11
+    """
+    total = sum(values)
+    aces = values.count(11)
+    while total > 21 and aces:
+        total -= 10
+        aces -= 1
+    return total, aces > 0
+
+
+class _Hands:
+    """
+    Totals of a batch of hands, with the number of aces still counted as 11
+    """
+
+    def __init__(self, size: int) -> None:
+        self.total = numpy.zeros(size, dtype=numpy.int64)
+        self.aces = numpy.zeros(size, dtype=numpy.int64)
+
+    @property
+    def soft(self) -> numpy.ndarray:
+        return (self.aces > 0).astype(numpy.intp)
+
+    def add(self, values: numpy.ndarray) -> None:
+        self.total += values
+        self.aces += values == 11
+        busted = (self.total > 21) & (self.aces > 0)
+        while busted.any():
+            self.total[busted] -= 10
+            self.aces[busted] -= 1
+            busted = (self.total > 21) & (self.aces > 0)
+
+    def hits(self, rules: Rules) -> numpy.ndarray:
+        """
+        :return:    Whether the dealer hits these hands
+        """
+        hits = self.total < 17
+        if rules.dealer_hits_soft_17:
+            hits |= (self.total == 17) & (self.aces > 0)
+        return hits
+
+
+def _result(total: float, squares: float, hands: int) -> Result:
+    ev = total / hands
+    variance = max(squares / hands - ev * ev, 0.0)
+    stderr = (variance / hands) ** 0.5
+    return Result(ev, stderr, ev - 1.96 * stderr, ev + 1.96 * stderr, hands)
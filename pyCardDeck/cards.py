@@ -1,3 +1,6 @@
+from functools import total_ordering
+
+
 class BaseCard:
     """
     This is an example Card, showing that each Card should have a name.
@@ -31,4 +34,122 @@ class PokerCard(BaseCard):
         return self.name == other
 
 
-CardType = BaseCard | PokerCard | object | str | int
+# Codes of the ranks and suits of SlottedPokerCard, in ascending order
+_RANK_CODES = {
+    rank: code
+    for code, rank in enumerate(
+        ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"), start=2
+    )
+}
+_SUIT_CODES = {
+    suit: code for code, suit in enumerate(("Clubs", "Diamonds", "Hearts", "Spades"))
+}
+
+
+@total_ordering
+class SlottedCard:
+    """
+    Lightweight alternative to :py:class:`BaseCard` without a per-instance `__dict__`.
+
+    Cards are immutable, they equal their name like :py:class:`PokerCard` does,
+    and their hash is the hash of the name, computed once. Cards sort by name.
+    """
+
+    __slots__ = ("_name", "_hash")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._hash = hash(name)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __eq__(self, other):
+        if isinstance(other, SlottedCard):
+            return self._hash == other._hash and self._name == other._name
+        return self._name == other
+
+    def __lt__(self, other):
+        if isinstance(other, SlottedCard):
+            return self._name < other._name
+        return NotImplemented
+
+    def __hash__(self):
+        return self._hash
+
+    def __reduce__(self):
+        return type(self), (self._name,)
+
+    def __str__(self):
+        return self._name
+
+    def __repr__(self):
+        return "{0}({1})".format(type(self).__name__, {"name": self._name})
+
+
+class SlottedPokerCard(SlottedCard):
+    """
+    Lightweight alternative to :py:class:`PokerCard`, taking the same arguments.
+
+    Besides the rank and suit it keeps their integer codes, :py:attr:`rank_code`
+    from 2 for a two to 14 for an ace and :py:attr:`suit_code` from 0 for clubs
+    to 3 for spades. Cards sort by rank, then by suit.
+
+    :raises ValueError: when the rank or suit isn't one of a standard deck
+    """
+
+    __slots__ = ("_suit", "_rank", "_rank_name", "_code")
+
+    def __init__(self, suit: str, rank: str, name: str) -> None:
+        try:
+            code = _RANK_CODES[rank] * 4 + _SUIT_CODES[suit]
+        except KeyError:
+            raise ValueError("Unknown card: {} of {}".format(rank, suit)) from None
+        super().__init__(f"{name} of {suit}")
+        self._suit = suit
+        self._rank = rank
+        self._rank_name = name
+        self._code = code
+
+    @property
+    def suit(self) -> str:
+        return self._suit
+
+    @property
+    def rank(self) -> str:
+        return self._rank
+
+    @property
+    def rank_code(self) -> int:
+        return self._code >> 2
+
+    @property
+    def suit_code(self) -> int:
+        return self._code & 3
+
+    def __eq__(self, other):
+        if isinstance(other, SlottedPokerCard):
+            return self._code == other._code
+        return super().__eq__(other)
+
+    def __lt__(self, other):
+        try:
+            return self._code < other._code
+        except AttributeError:
+            return NotImplemented
+
+    # Defining __eq__ resets the inherited hash
+    __hash__ = SlottedCard.__hash__
+
+    def __reduce__(self):
+        return type(self), (self._suit, self._rank, self._rank_name)
+
+    def __repr__(self):
+        return "{0}({1})".format(
+            type(self).__name__,
+            {"name": self._name, "suit": self._suit, "rank": self._rank},
+        )
+
+
+CardType = BaseCard | PokerCard | SlottedCard | object | str | int
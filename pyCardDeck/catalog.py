@@ -0,0 +1,139 @@
+from collections.abc import Hashable, Iterable, Iterator
+from functools import lru_cache
+
+from .cards import CardType
+from .deck import _UNKEYED, _card_key, _standard_deck_template
+from .errors import CardNotFound
+
+
+class CardCatalog:
+    """
+    Registry that gives every distinct card a small integer ID and keeps
+    a single shared (interned) instance of it.
+
+    Cards are told apart the same way an indexed :ref:`Deck` does it, see
+    :py:func:`deck._card_key`. Decks created with the same catalog share
+    the interned instances instead of holding copies, and can store the IDs
+    instead of the cards altogether::
+
+        catalog = CardCatalog.standard()
+        deck = Deck(catalog=catalog, card_ids=True)
+        deck.load_standard_deck()
+        catalog[deck.draw()]
+
+    :param cards:   Cards to register, in the order of their IDs
+    """
+
+    def __init__(self, cards: Iterable[CardType] = ()) -> None:
+        self._cards: list[CardType] = []
+        self._ids: dict[Hashable, int] = {}
+        # Interned instances are kept alive by _cards, so their id() is stable
+        self._identities: dict[int, int] = {}
+        for card in cards:
+            self.add(card)
+
+    @classmethod
+    def standard(cls) -> "CardCatalog":
+        """
+        Catalog of the 52 cards of :py:meth:`Deck.load_standard_deck`, created once per process.
+        Its interned cards are the instances standard decks are loaded with.
+
+        :return:    Shared standard catalog
+        """
+        return _standard_catalog()
+
+    def add(self, card: CardType) -> int:
+        """
+        Registers a card, unless an identical card already is
+
+        :param card:        Card to register
+        :return:            ID of the card
+        :raises TypeError:  when the card can't be told apart from others, see :py:func:`deck._card_key`
+        """
+        card_id = self.find(card)
+        if card_id is not None:
+            return card_id
+        key = _card_key(card)
+        if key is _UNKEYED:
+            raise TypeError(
+                "{} has unhashable attributes and can't be added to a catalog".format(
+                    type(card).__name__
+                )
+            )
+        card_id = len(self._cards)
+        self._cards.append(card)
+        self._ids[key] = card_id
+        self._identities[id(card)] = card_id
+        return card_id
+
+    def find(self, card: CardType) -> int | None:
+        """
+        :param card:    Card to look up
+        :return:        ID of the card, None when it isn't registered
+        """
+        card_id = self._identities.get(id(card))
+        if card_id is not None and self._cards[card_id] is card:
+            return card_id
+        key = _card_key(card)
+        if key is _UNKEYED:
+            return None
+        return self._ids.get(key)
+
+    def id_of(self, card: CardType) -> int:
+        """
+        :param card:            Registered card
+        :return:                ID of the card
+        :raises CardNotFound:   when the card isn't registered
+        """
+        card_id = self.find(card)
+        if card_id is None:
+            raise CardNotFound("Card {} is not in the catalog".format(card))
+        return card_id
+
+    def intern(self, card: CardType) -> CardType:
+        """
+        Registers a card if needed and returns the shared instance of it
+
+        :param card:    Card to intern
+        :return:        Interned card identical to the given one
+        """
+        return self._cards[self.add(card)]
+
+    def ids(self, cards: Iterable[CardType]) -> list[int]:
+        """
+        :param cards:           Registered cards
+        :return:                Their IDs
+        :raises CardNotFound:   when a card isn't registered
+        """
+        return [self.id_of(card) for card in cards]
+
+    def cards(self, ids: Iterable[int]) -> list[CardType]:
+        """
+        :param ids:     Card IDs
+        :return:        Interned cards with those IDs
+        """
+        cards = self._cards
+        return [cards[card_id] for card_id in ids]
+
+    def __getitem__(self, card_id: int) -> CardType:
+        return self._cards[card_id]
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __iter__(self) -> Iterator[CardType]:
+        return iter(self._cards)
+
+    def __contains__(self, card: CardType) -> bool:
+        return self.find(card) is not None
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return "CardCatalog(cards={0})".format(len(self._cards))
+
+
+@lru_cache(maxsize=None)
+def _standard_catalog() -> CardCatalog:
+    """
+    Creates the standard catalog on first use
+    """
+    return CardCatalog(reversed(_standard_deck_template()["_cards"]))
@@ -0,0 +1,127 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+from .cards import CardType
+from .catalog import CardCatalog
+from .deck import Deck
+from .rng import RandomSource
+
+
+def _id_array(card_ids: Iterable[int]) -> array:
+    """
+    Storage of :py:class:`CompactDeck`, the smallest array that fits the IDs
+    """
+    card_ids = list(card_ids)
+    return array("B" if max(card_ids, default=0) <= 0xFF else "H", card_ids)
+
+
+class CompactDeck(Deck):
+    """
+    Deck that keeps its cards as catalog IDs in an :py:class:`array.array`,
+    one byte per card while the catalog has up to 256 cards and two bytes after that.
+
+    It behaves like a :ref:`Deck` and takes and returns cards, they are only turned into
+    IDs inside. Meant for programs that keep a lot of decks around, which should then
+    share one catalog::
+
+        catalog = CardCatalog.standard()
+        decks = [CompactDeck(catalog=catalog) for _ in range(100_000)]
+        for deck in decks:
+            deck.load_standard_deck()
+
+    Cards the catalog doesn't know yet are registered when they are put into the deck.
+    Cards returned by the deck are the catalog's shared instances. Integers put into
+    the deck are taken as IDs, so cards that are plain integers need a :ref:`Deck`.
+
+    :param cards:       Input cards, the first card is the top of the deck
+    :param reshuffle:   Set reshuffle to false if you want your deck not to reshuffle after it's depleted
+    :param name:        Name of the deck, used when converting the Deck instance into string
+    :param discard:     optional Deck object to use as discard pile
+    :param indexed:     Keep a multiset index of the cards, see :ref:`Deck`
+    :param rng:         Random source for shuffling and random draws and inserts, see :ref:`Deck`
+    :param lazy_shuffle: Make :py:meth:`shuffle` constant time, see :ref:`Deck`
+    :param catalog:     :py:class:`catalog.CardCatalog` giving the cards their IDs.
+                        A new catalog is created for the deck if there is none.
+    """
+
+    _card_ids = True
+    _storage = staticmethod(_id_array)
+
+    def __init__(
+        self,
+        cards: list[CardType] | None = None,
+        reshuffle: bool = True,
+        name: str | None = None,
+        discard: Deck | None = None,
+        indexed: bool = False,
+        rng: "RandomSource | int | None" = None,
+        lazy_shuffle: bool = False,
+        catalog: CardCatalog | None = None,
+    ):
+        super().__init__(
+            cards,
+            reshuffle=reshuffle,
+            name=name,
+            discard=discard,
+            indexed=indexed,
+            rng=rng,
+            lazy_shuffle=lazy_shuffle,
+            catalog=CardCatalog() if catalog is None else catalog,
+            card_ids=True,
+        )
+
+    def _intern(self, card: CardType) -> int:
+        card_id = super()._intern(card)
+        cards = self.__dict__.get("_cards")
+        if cards is not None and card_id > 0xFF and cards.typecode == "B":
+            # The catalog outgrew single bytes, widen before the ID gets stored
+            self._cards = array("H", cards)
+        return card_id
+
+    def draw(self) -> CardType:
+        return self._catalog[super().draw()]
+
+    def draw_bottom(self) -> CardType:
+        return self._catalog[super().draw_bottom()]
+
+    def draw_random(self) -> CardType:
+        return self._catalog[super().draw_random()]
+
+    def draw_many(self, number: int, position: str = "top") -> list[CardType]:
+        return self._catalog.cards(super().draw_many(number, position))
+
+    def deal(
+        self, seats: "int | Sequence[list[CardType]]", cards_each: int = 1
+    ) -> "list[list[CardType]]":
+        if isinstance(seats, int):
+            hands: list[list[CardType]] = [[] for _ in range(seats)]
+        else:
+            hands = list(seats)
+        dealt: list[list[int]] = [[] for _ in hands]
+        try:
+            super().deal(dealt, cards_each)
+        finally:
+            for hand, card_ids in zip(hands, dealt):
+                hand.extend(self._catalog.cards(card_ids))
+        return hands
+
+    def draw_specific(self, specific_card: CardType) -> CardType:
+        return self._catalog[super().draw_specific(specific_card)]
+
+    def load(self, to_load: str, is_file: bool = False) -> None:
+        super().load(to_load, is_file)
+        discard_pile = self._discard_pile
+        if isinstance(discard_pile, CompactDeck) and "_catalog" not in vars(
+            discard_pile
+        ):
+            # Loaded discard piles come without a catalog, they share the deck's one
+            discard_pile._catalog = self._catalog
+            discard_pile._set_cards(list(discard_pile._cards))
+
+    def __getitem__(self, position: int | slice) -> CardType | list[CardType]:
+        if isinstance(position, slice):
+            return self._catalog.cards(super().__getitem__(position))
+        return self._catalog[super().__getitem__(position)]
+
+    def __iter__(self) -> Iterator[CardType]:
+        return map(self._catalog.__getitem__, super().__iter__())
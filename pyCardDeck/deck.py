@@ -1,16 +1,120 @@
 import logging
+from logging import DEBUG
 import os
-from collections.abc import Iterator
-from random import shuffle, randint, randrange
-
-import jsonpickle
-import yaml
+import random
+from collections import Counter
+from collections.abc import (
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    MutableSequence,
+    Sequence,
+)
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from copy import copy
+from functools import lru_cache
+from inspect import getattr_static
+from itertools import repeat
+from operator import indexOf
+from types import FunctionType
+from typing import TYPE_CHECKING
 
 from .cards import CardType
-from .errors import OutOfCards, NotACard, NoCards, CardNotFound, UnknownFormat
+from .errors import (
+    OutOfCards,
+    NotACard,
+    NoCards,
+    CardNotFound,
+    NoHistory,
+    UnknownFormat,
+)
+from .journal import CARDS, DISCARD, INSERT, PILE, REMOVE, SET, Journal
+from .rng import RandomSource, as_random_source
+from .storage import TreeList
+
+if TYPE_CHECKING:
+    from .catalog import CardCatalog
+    from .stats import StatsRegistry
 
 log = logging.getLogger(__name__)
 
+# Index key shared by all cards that can't be keyed
+_UNKEYED = object()
+# Index key counting cards whose own __eq__ can match cards with other keys
+_SCANNED = object()
+
+# Whether the hot paths log at DEBUG level, see set_fast_mode
+_verbose = True
+# Receives the events of the hot paths, see set_trace_hook
+_trace_hook: "TraceHook | None" = None
+_tracing = False
+# Whether the hot paths report at all, they check it before anything else
+_reporting = True
+
+# Attributes only meaningful at runtime, they are left out of exported decks
+_TRANSIENT = (
+    "_index",
+    "_rng",
+    "_storage",
+    "_lazy_shuffle",
+    "_unshuffled",
+    "_catalog",
+    "_card_ids",
+    "_stats",
+    "_shared",
+    "_journal",
+)
+
+
+TraceHook = Callable[[str, "Deck", dict], None]
+
+
+def set_fast_mode(enabled: bool = True) -> None:
+    """
+    Switches the fast mode on or off. In fast mode drawing, inserting, discarding
+    and shuffling skip their debug logging entirely, instead of paying for
+    the logging calls even when DEBUG isn't enabled. Warnings and errors
+    are still logged and a trace hook still gets its events.
+
+    :param enabled: Whether to skip the debug logging of the hot paths
+    """
+    global _verbose
+    _verbose = not enabled
+    _update_reporting()
+
+
+def set_trace_hook(hook: "TraceHook | None") -> None:
+    """
+    Installs a hook that gets a structured event for every draw, insert, discard
+    and shuffle of all decks, for example to collect traces. It's called
+    with the name of the operation ("draw", "draw_many", "draw_specific", "card_exists",
+    "shuffle", "shuffle_back", "discard", "add_single" or "add_many"),
+    the deck and a dict with the details, like the card and the position.
+    The dict is the one the debug log message is formatted with, don't change it.
+
+    :param hook:    The hook, None to remove it
+    """
+    global _trace_hook
+    _trace_hook = hook
+    _update_reporting()
+
+
+def _update_reporting() -> None:
+    global _reporting, _tracing
+    _tracing = _trace_hook is not None
+    _reporting = _verbose or _tracing
+
+
+def _report(event: str, deck: "Deck", message: str, details: dict) -> None:
+    """
+    Logs an event of a hot path and passes it to the trace hook
+    """
+    if _verbose:
+        log.debug(message, details)
+    if _tracing:
+        _trace_hook(event, deck, details)
+
 
 class Deck:
     """
@@ -21,30 +125,300 @@ class Deck:
     :param reshuffle:   Set reshuffle to false if you want your deck not to reshuffle after it's depleted
     :param name:        Name of the deck, used when converting the Deck instance into string
     :param discard:     optional Deck object to use as discard pile
+    :param indexed:     Keep a multiset index of the cards, making :py:meth:`card_exists`
+                        and :py:meth:`draw_specific` misses constant time. See :py:func:`_card_key`
+                        for how indexed cards are matched.
+    :param rng:         Random source for shuffling and random draws and inserts.
+                        Either an integer seed, a :py:class:`random.Random`, a NumPy Generator
+                        or any :py:class:`rng.RandomSource`. Uses the global :py:mod:`random`
+                        generator by default.
+    :param storage:     Sequence type to keep the cards in, called with the list of cards.
+                        Lists are best for most games, :py:class:`storage.TreeList` is faster
+                        for big decks with many inserts and draws at arbitrary positions.
+    :param lazy_shuffle: Make :py:meth:`shuffle` constant time. Cards are then only shuffled
+                        into place when they are drawn or looked at, with the same odds as
+                        a full shuffle. Great for decks with many cards of which only a few
+                        are drawn before the next shuffle.
+    :param catalog:     :py:class:`catalog.CardCatalog` to intern the cards with. Cards put
+                        into the deck are replaced by the catalog's shared instance of them,
+                        new cards get registered.
+    :param card_ids:    Keep catalog IDs instead of cards, the deck then returns IDs
+                        and takes either IDs or cards. Needs a catalog.
     """
 
+    _index: Counter | None = None
+    _rng: RandomSource = random
+    _storage: Callable[..., MutableSequence] = list
+    _lazy_shuffle: bool = False
+    # Number of cards at the bottom of _cards that a lazy shuffle hasn't put into place yet
+    _unshuffled: int = 0
+    _catalog: "CardCatalog | None" = None
+    _card_ids: bool = False
+    _stats: "StatsRegistry | None" = None
+    # Whether the cards, a list discard pile and the index may be shared with forks
+    _shared: bool = False
+    _journal: Journal | None = None
+
     def __init__(
         self,
         cards: list[CardType] | None = None,
         reshuffle: bool = True,
         name: str | None = None,
         discard: "Deck | None" = None,
+        indexed: bool = False,
+        rng: "RandomSource | int | None" = None,
+        storage: Callable[..., MutableSequence] | None = None,
+        lazy_shuffle: bool = False,
+        catalog: "CardCatalog | None" = None,
+        card_ids: bool = False,
     ):
         """
         Create the deck
         """
 
         self.name = name
-        if cards is None:
-            self._cards: list[CardType] = []
-        else:
-            self._cards = cards
+        if storage is not None:
+            self._storage = storage
+        if lazy_shuffle:
+            self._lazy_shuffle = True
+        if card_ids and catalog is None:
+            raise ValueError("card_ids needs a catalog to map the IDs to cards")
+        if catalog is not None:
+            self._catalog = catalog
+            self._card_ids = card_ids
+        # Cards are stored bottom to top, so the top of the deck is the end of the list
+        self._set_cards([] if cards is None else cards[::-1])
         if discard is None:
             self._discard_pile: Deck | list[CardType] = []
         else:
             self._discard_pile = discard
         self._reshuffle = reshuffle
         self.set_file_location("exported_deck")
+        if indexed:
+            self._index = Counter(_index_keys(self._cards))
+        if rng is not None:
+            self._rng = as_random_source(rng)
+
+    def _set_cards(self, cards: list[CardType]) -> None:
+        """
+        Replaces all cards of the deck, keeping the deck's storage type and index
+
+        :param cards:   New cards, from the bottom to the top
+        """
+        if self._catalog is not None:
+            cards = [self._intern(card) for card in cards]
+        if self._storage is list:
+            self._cards: MutableSequence[CardType] = cards
+        else:
+            self._cards = self._storage(cards)
+        self._unshuffled = 0
+        if self._index is not None:
+            self._index = Counter(_index_keys(self._cards))
+
+    def fork(self, rng: "RandomSource | int | None" = None) -> "Deck":
+        """
+        Creates an independent copy of the deck in O(1), for example for every node
+        of a game tree search
+
+        The copy and the deck share their cards, discard pile and index until one of them
+        changes. Changing a deck copies them first, the cards themselves aren't copied,
+        so that's one copy of the list of cards, of only the changed blocks
+        with :py:class:`storage.TreeList`. Discard piles that are decks get forked too.
+        Card instances, the catalog and the random source are shared, the fork
+        isn't instrumented (see :py:func:`stats.instrument`). A journal is copied,
+        so the fork can undo what happened before it was created.
+
+        A pending lazy shuffle is finished first, so the fork has exactly the same order
+        of cards as the deck.
+
+        :param rng:     Random source of the fork, see :ref:`Deck`, shares the deck's by default
+        :return:        The fork, of the same class as the deck
+        """
+        self._settle()
+        forked = object.__new__(type(self))
+        forked.__dict__.update(
+            (name, value)
+            for name, value in self.__dict__.items()
+            if name != "_stats" and not _is_method(type(self), name)
+        )
+        if isinstance(self._discard_pile, Deck):
+            forked._discard_pile = self._discard_pile.fork()
+        if self._journal is not None:
+            forked._journal = self._journal.copy()
+        if rng is not None:
+            forked._rng = as_random_source(rng)
+        self._shared = forked._shared = True
+        return forked
+
+    def _own(self) -> None:
+        """
+        Copies what a fork shares with other decks, before it gets changed. See :py:meth:`fork`
+        """
+        self._cards = copy(self._cards)
+        if not isinstance(self._discard_pile, Deck):
+            self._discard_pile = list(self._discard_pile)
+        if self._index is not None:
+            self._index = self._index.copy()
+        self._shared = False
+
+    def start_journal(self, limit: int | None = None) -> Journal:
+        """
+        Starts recording every change of the deck, so it can be undone and redone
+
+        Draws, inserts, discards, shuffles and reshuffles are recorded by what they
+        changed, like the cards taken out at a position, so :py:meth:`undo`
+        and :py:meth:`redo` take time proportional to the operation, not to the deck size.
+        Loading the deck forgets the history. Starting a journal again forgets it too.
+
+        :param limit:       Most operations to remember, the oldest are forgotten first
+        :return:            The journal of the deck
+        :raises ValueError: when the deck shuffles lazily, its cards only get their
+                            place when they are drawn, so there is nothing to record
+        """
+        if self._lazy_shuffle:
+            raise ValueError("Decks with lazy_shuffle can't keep a journal")
+        self._journal = Journal(limit)
+        return self._journal
+
+    def stop_journal(self) -> None:
+        """
+        Stops recording changes of the deck and forgets its history
+        """
+        self._journal = None
+
+    def undo(self) -> None:
+        """
+        Reverts the last operation recorded in the journal, see :py:meth:`start_journal`
+
+        :raises NoHistory:  when there is no journal or nothing to undo
+        """
+        if self._journal is None:
+            raise NoHistory("The deck doesn't keep a journal")
+        self._journal.undo(self)
+        log.debug("Operation undone")
+
+    def redo(self) -> None:
+        """
+        Repeats the last undone operation, see :py:meth:`start_journal`
+
+        :raises NoHistory:  when there is no journal or nothing to redo
+        """
+        if self._journal is None:
+            raise NoHistory("The deck doesn't keep a journal")
+        self._journal.redo(self)
+        log.debug("Operation redone")
+
+    def _joined(self) -> AbstractContextManager:
+        """
+        Context in which changes are recorded as part of the last operation in the journal
+        """
+        return nullcontext() if self._journal is None else self._journal.joined()
+
+    def _intern(self, card: CardType) -> CardType:
+        """
+        Turns a card put into the deck into the form the deck keeps it in:
+        the card itself, its interned instance or its catalog ID
+
+        :param card:    Card, or catalog ID for decks with `card_ids`
+        :return:        Card to store
+        """
+        catalog = self._catalog
+        if catalog is None:
+            return card
+        if self._card_ids:
+            return card if type(card) is int else catalog.add(card)
+        return catalog.intern(card)
+
+    def _stored_form(self, card: CardType) -> CardType | None:
+        """
+        Like :py:meth:`_intern`, but for looking cards up, so unknown cards aren't registered
+
+        :param card:    Card, or catalog ID for decks with `card_ids`
+        :return:        Card as the deck would store it, None when it can't be in the deck
+        """
+        catalog = self._catalog
+        if catalog is None or (self._card_ids and type(card) is int):
+            return card
+        card_id = catalog.find(card)
+        if card_id is None:
+            # Cards the catalog doesn't know can still be equal to ones it does
+            for known_id, known_card in enumerate(catalog):
+                if _card_compare(card, known_card):
+                    card_id = known_id
+                    break
+            else:
+                return None
+        if self._card_ids:
+            return card_id
+        return catalog[card_id]
+
+    def _settle_top(self, number: int) -> None:
+        """
+        Finishes a lazy shuffle for the top cards of the deck, one Fisher-Yates step per card
+
+        :param number:  How many cards from the top have to be in their final place
+        """
+        if self._shared:
+            self._own()
+        cards = self._cards
+        pending = self._unshuffled
+        stop = max(len(cards) - number, 0)
+        randrange = self._rng.randrange
+        while pending > stop:
+            swap = randrange(pending)
+            pending -= 1
+            cards[swap], cards[pending] = cards[pending], cards[swap]
+        self._unshuffled = pending
+
+    def _settle(self) -> None:
+        """
+        Finishes a lazy shuffle for the whole deck
+        """
+        pending = self._unshuffled
+        if pending:
+            if self._shared:
+                self._own()
+            cards = self._cards[:pending]
+            self._rng.shuffle(cards)
+            self._cards[:pending] = cards
+            self._unshuffled = 0
+
+    def _index_add(self, cards: Iterable[CardType]) -> None:
+        """
+        Registers cards that were put into the deck with the index, if there is one
+        """
+        if self._index is not None:
+            self._index.update(_index_keys(cards))
+
+    def _index_remove(self, cards: Iterable[CardType]) -> None:
+        """
+        Unregisters cards that were taken out of the deck from the index, if there is one
+        """
+        if self._index is not None:
+            self._index.subtract(_index_keys(cards))
+
+    def _index_lookup(self, card: CardType) -> bool | None:
+        """
+        Asks the index whether a card is in the deck
+
+        :param card:    Card identical to the one you are looking for
+        :return:        True or False, None when there is no index or it can't tell
+                        and the deck has to be searched
+        """
+        if self._index is None:
+            return None
+        key = _card_key(card)
+        if key is not _UNKEYED:
+            if self._index[key] > 0:
+                return True
+            # A miss is only certain when no __eq__ could match a card with another key
+            if (
+                self._index[_UNKEYED] <= 0
+                and self._index[_SCANNED] <= 0
+                and (key is card or not _compares_by_eq(type(card)))
+            ):
+                return False
+        return None
 
     def _get_card(self, position: str = "top") -> CardType:
         """
@@ -55,18 +429,106 @@ class Deck:
         :raises OutOfCards:     when there are no cards in the deck
         :raises NoCards:        when the deck runs out of cards (no reshuffle)
         """
-        if self._cards:
-            positions = {
-                "top": 0,
-                "bottom": len(self._cards) - 1,
-                "random": randrange(len(self._cards)),
-            }
-            card = self._cards.pop(positions[position])
+        if self._shared:
+            self._own()
+        cards = self._cards
+        if cards:
+            if position == "top":
+                if self._unshuffled == len(cards):
+                    self._settle_top(1)
+                card = cards.pop()
+                index = len(cards)
+            elif position == "bottom":
+                self._settle()
+                card = cards.pop(0)
+                index = 0
+            else:
+                self._settle()
+                index = self._rng.randrange(len(cards))
+                card = cards.pop(index)
+            self._index_remove((card,))
+            if self._journal is not None:
+                self._journal.record((REMOVE, index, [card]))
             self.reshuffle_if_empty()
-            log.debug("Card drawn from %s: %s", position, card)
+            if _reporting and (_tracing or log.isEnabledFor(DEBUG)):
+                _report(
+                    "draw",
+                    self,
+                    "Card drawn from %(position)s: %(card)s",
+                    {"position": position, "card": card},
+                )
             return card
+        else:
+            self._raise_empty(position)
 
-        elif not self._reshuffle:
+    def _draw_into(self, drawn: list[CardType], number: int, position: str) -> None:
+        """
+        Helper function for drawing many cards from the deck at once. Shouldn't be used
+
+        Takes as many cards as possible in one slice and only reshuffles when the deck
+        runs out, so the result is the same as drawing the cards one by one.
+        Cards are appended to `drawn` as they are drawn, so it holds the drawn cards
+        even when an exception is raised.
+
+        :param drawn:           List to append the drawn cards to
+        :param number:          How many cards to draw
+        :param position:        Where to draw from
+        :raises OutOfCards:     when there are no cards in the deck
+        :raises NoCards:        when the deck runs out of cards (no reshuffle)
+        """
+        if self._shared:
+            self._own()
+        journal = self._journal
+        # Later batches and reshuffles belong to the same operation as the first batch
+        join = False
+        while number > 0:
+            cards = self._cards
+            if not cards:
+                self._raise_empty(position)
+            taken = min(number, len(cards))
+            if position == "top":
+                self._settle_top(taken)
+                batch = cards[: -taken - 1 : -1]
+                if journal is not None:
+                    journal.record((REMOVE, len(cards) - taken, batch[::-1]), join)
+                del cards[-taken:]
+            elif position == "bottom":
+                self._settle()
+                batch = cards[:taken]
+                if journal is not None:
+                    journal.record((REMOVE, 0, list(batch)), join)
+                del cards[:taken]
+            else:
+                self._settle()
+                picked = self._rng.sample(range(len(cards)), taken)
+                batch = [cards[index] for index in picked]
+                for index in sorted(picked, reverse=True):
+                    if journal is not None:
+                        journal.record((REMOVE, index, [cards[index]]), join)
+                        join = True
+                    del cards[index]
+            join = True
+            self._index_remove(batch)
+            drawn.extend(batch)
+            number -= taken
+            if _reporting and (_tracing or log.isEnabledFor(DEBUG)):
+                _report(
+                    "draw_many",
+                    self,
+                    "%(number)i cards drawn from %(position)s",
+                    {"number": taken, "position": position},
+                )
+            self.reshuffle_if_empty()
+
+    def _raise_empty(self, position: str) -> None:
+        """
+        Raises the right exception for drawing from an empty deck
+
+        :param position:        Where the draw was from
+        :raises OutOfCards:     when the deck doesn't reshuffle
+        :raises NoCards:        otherwise
+        """
+        if not self._reshuffle:
             log.debug(
                 "You tried to draw. No more cards to be drawn. Position: %s", position
             )
@@ -110,6 +572,56 @@ class Deck:
         """
         return self._get_card("random")
 
+    def draw_many(self, number: int, position: str = "top") -> list[CardType]:
+        """
+        Draw several cards from the deck at once
+
+        Gives the same cards as calling :py:meth:`draw`, :py:meth:`draw_bottom`
+        or :py:meth:`draw_random` `number` times, including reshuffling
+        the discard pile back when the deck runs out, but without the per card overhead.
+
+        :param number:          How many cards to draw
+        :param position:        Where to draw from, either "top", "bottom" or "random"
+        :return:                Drawn cards in the order they were drawn
+        :raises OutOfCards:     when there are no cards in the deck
+        :raises NoCards:        when the deck runs out of cards (no reshuffle)
+        """
+        if position not in ("top", "bottom", "random"):
+            raise ValueError(f"Unknown position: {position}")
+        drawn: list[CardType] = []
+        self._draw_into(drawn, number, position)
+        return drawn
+
+    def deal(
+        self, seats: "int | Sequence[list[CardType]]", cards_each: int = 1
+    ) -> "list[list[CardType]]":
+        """
+        Deal cards from the top of the deck to several seats, one card at a time
+        going around the table
+
+        Seats get the same cards as if you called :py:meth:`draw` for every seat
+        in turn, `cards_each` times around, including reshuffling the discard pile
+        back when the deck runs out. If the deck runs out of cards for good,
+        the cards dealt until then are still in the hands.
+
+        :param seats:           Either the number of seats, or existing hands to extend
+        :param cards_each:      How many cards every seat gets
+        :return:                Hands in seat order
+        :raises OutOfCards:     when there are no cards in the deck
+        :raises NoCards:        when the deck runs out of cards (no reshuffle)
+        """
+        if isinstance(seats, int):
+            hands: list[list[CardType]] = [[] for _ in range(seats)]
+        else:
+            hands = list(seats)
+        drawn: list[CardType] = []
+        try:
+            self._draw_into(drawn, len(hands) * cards_each, "top")
+        finally:
+            for seat, hand in enumerate(hands):
+                hand.extend(drawn[seat :: len(hands)])
+        return hands
+
     def draw_specific(self, specific_card: CardType) -> CardType:
         """
         Draw a specific card from the deck
@@ -128,18 +640,37 @@ class Deck:
         :raises NoCards:        when the deck runs out of cards (no reshuffle)
         :raises CardNotFound:   when the card is not found in the deck
         """
-        log.debug("Attempting to find card: %s", specific_card)
+        if self._shared:
+            self._own()
         if self._cards:
-            for available_card in self._cards:
-                if _card_compare(specific_card, available_card):
-                    card = available_card
-                    break
-            else:
+            specific_card = self._stored_form(specific_card)
+            found = None if specific_card is None else self._index_lookup(specific_card)
+            if specific_card is None or found is False:
                 log.debug("Specific card not found in the deck")
                 raise CardNotFound("Specific card not found in the deck")
-            self._cards.remove(card)
+            self._settle()
+            if found:
+                depth = _find_keyed(self._cards, specific_card)
+            else:
+                for depth, available_card in enumerate(reversed(self._cards)):
+                    if _card_compare(specific_card, available_card):
+                        break
+                else:
+                    log.debug("Specific card not found in the deck")
+                    raise CardNotFound("Specific card not found in the deck")
+            index = len(self._cards) - 1 - depth
+            card = self._cards.pop(index)
+            self._index_remove((card,))
+            if self._journal is not None:
+                self._journal.record((REMOVE, index, [card]))
             self.reshuffle_if_empty()
-            log.debug("Specific card drawn: %s", card)
+            if _reporting and (_tracing or log.isEnabledFor(DEBUG)):
+                _report(
+                    "draw_specific",
+                    self,
+                    "Specific card drawn: %(card)s",
+                    {"card": card},
+                )
             return card
 
         else:
@@ -161,12 +692,24 @@ class Deck:
         :param card:    Card identical to the one you are looking for
         :return:        True if exists, False if doesn't exist
         """
-        found = False
-        for available_card in self._cards:
-            if _card_compare(card, available_card):
-                found = True
-                break
-        log.debug("Card %s exists in the deck: %s", card, found)
+        card = self._stored_form(card)
+        if card is None:
+            found = False
+        else:
+            found = self._index_lookup(card)
+        if found is None:
+            found = False
+            for available_card in self._cards:
+                if _card_compare(card, available_card):
+                    found = True
+                    break
+        if _reporting and (_tracing or log.isEnabledFor(DEBUG)):
+            _report(
+                "card_exists",
+                self,
+                "Card %(card)s exists in the deck: %(found)s",
+                {"card": card, "found": found},
+            )
         return found
 
     def shuffle(self) -> None:
@@ -175,9 +718,23 @@ class Deck:
 
         :raises NoCards:     when there are no cards to be shuffled
         """
+        if self._shared:
+            self._own()
         if self._cards:
-            shuffle(self._cards)
-            log.debug("Deck shuffled")
+            if self._journal is not None:
+                before = list(self._cards)
+            if self._lazy_shuffle:
+                self._unshuffled = len(self._cards)
+            elif isinstance(self._cards, list):
+                self._rng.shuffle(self._cards)
+            else:
+                cards = list(self._cards)
+                self._rng.shuffle(cards)
+                self._cards = self._storage(cards)
+            if self._journal is not None:
+                self._journal.record((CARDS, before, list(self._cards)))
+            if _reporting and (_tracing or log.isEnabledFor(DEBUG)):
+                _report("shuffle", self, "Deck shuffled", {"cards": len(self._cards)})
         else:
             log.warning("You tried to shuffle an empty deck")
             raise NoCards("You tried to shuffle an empty deck")
@@ -188,20 +745,44 @@ class Deck:
         shuffles the discard pile back into the card pile
         """
         if not self._cards and self._reshuffle:
-            self.shuffle_back()
+            # The reshuffle is undone together with the draw that caused it
+            with self._joined():
+                self.shuffle_back()
 
     def shuffle_back(self) -> None:
         """
         Shuffles the discard pile back into the main pile
         """
-        for card in self._discard_pile:
-            self._cards.append(card)
-        self.shuffle()
+        if self._shared:
+            self._own()
+        if self._catalog is None:
+            returned = list(self._discard_pile)
+        else:
+            returned = [self._intern(card) for card in self._discard_pile]
+        journal = self._journal
+        if journal is not None:
+            journal.record((INSERT, len(self._cards), returned))
+            if isinstance(self._discard_pile, Deck):
+                discarded = list(self._discard_pile._cards)
+            else:
+                discarded = self._discard_pile
+        self._cards.extend(returned)
+        self._index_add(returned)
+        with self._joined():
+            self.shuffle()
         if isinstance(self._discard_pile, Deck):
             self._discard_pile.clear()
         else:
             self._discard_pile = []
-        log.debug("Cards have been shuffled back from the discard pile")
+        if journal is not None:
+            journal.record((PILE, discarded, []), join=True)
+        if _reporting and (_tracing or log.isEnabledFor(DEBUG)):
+            _report(
+                "shuffle_back",
+                self,
+                "Cards have been shuffled back from the discard pile",
+                {"cards": len(returned)},
+            )
 
     def discard(self, card: CardType) -> None:
         """
@@ -210,13 +791,19 @@ class Deck:
         :param card:        Card to be discarded
         :raises NotACard:   When you try to insert False/None into a discard pile
         """
-        log.debug("Card being discarded: %s", card)
+        if self._shared:
+            self._own()
         if card or type(card) == int:
             if isinstance(self._discard_pile, Deck):
                 self._discard_pile.add_single(card, 0)
+                if self._journal is not None:
+                    self._journal.record((DISCARD, self._discard_pile._cards[-1]))
             else:
-                self._discard_pile.append(card)
-            log.debug("Card %s discarded", card)
+                self._discard_pile.append(self._intern(card))
+                if self._journal is not None:
+                    self._journal.record((DISCARD, self._discard_pile[-1]))
+            if _reporting and (_tracing or log.isEnabledFor(DEBUG)):
+                _report("discard", self, "Card %(card)s discarded", {"card": card})
         else:
             log.warning(
                 "You tried to insert %s (rank(%s) into a discard pile",
@@ -233,7 +820,9 @@ class Deck:
         """
         Empties the deck, destroying contents
         """
-        self._cards = []
+        if self._journal is not None:
+            self._journal.record((CARDS, self._cards, []))
+        self._set_cards([])
 
     def add_single(self, card: CardType, position: int | None = None) -> None:
         """
@@ -244,23 +833,111 @@ class Deck:
                             where 0 = top of the deck, 1 = second card from top etc.
                             By default the position is random.
         """
+        if self._shared:
+            self._own()
+        card = self._intern(card)
+        self._index_add((card,))
         if position is not None:
-            self._cards.insert(position, card)
-            log.debug("Card %s inserted to position %i", card, position)
-            log.debug(self._cards)
+            if self._unshuffled:
+                self._settle_top(position if position >= 0 else len(self._cards))
+            index = _insert_index(position, len(self._cards))
+            self._cards.insert(index, card)
+            if self._journal is not None:
+                self._journal.record((INSERT, index, [card]))
+            if _reporting and (_tracing or log.isEnabledFor(DEBUG)):
+                _report(
+                    "add_single",
+                    self,
+                    "Card %(card)s inserted to position %(position)i",
+                    {"card": card, "position": position},
+                )
         else:
-            self._cards.insert(randint(0, len(self._cards)), card)
-            log.debug("Card %s shuffled into the deck", card)
+            index = self._insert_random(card)
+            if self._journal is not None:
+                self._journal.record((INSERT, index, [card]))
+            if _reporting and (_tracing or log.isEnabledFor(DEBUG)):
+                _report(
+                    "add_single",
+                    self,
+                    "Card %(card)s shuffled into the deck",
+                    {"card": card, "position": None},
+                )
+
+    def _insert_random(self, card: CardType) -> int:
+        """
+        Inserts a card at a uniformly random position, without touching the index
+
+        :param card:        Card you want to insert
+        :return:            Index of Deck._cards the card was inserted at
+        """
+        index = self._rng.randrange(len(self._cards) + 1)
+        if self._unshuffled and index <= self._unshuffled:
+            # Cards that land among the not yet shuffled ones just join them
+            index = self._unshuffled
+            self._unshuffled += 1
+        self._cards.insert(index, card)
+        return index
 
     def add_many(self, cards: list[CardType]) -> None:
         """
         Shuffles a list of cards into the deck
 
+        Every card lands at a uniformly random position, like calling :py:meth:`add_single`
+        for each of them, but the deck is rebuilt in a single pass instead of
+        inserting the cards one by one.
+
         :param cards:   Cards you want to shuffle in
         """
-        for card in cards:
-            self.add_single(card)
-        log.debug("New cards shuffled into the deck")
+        if self._shared:
+            self._own()
+        new_cards = [self._intern(card) for card in cards]
+        old_cards = self._cards
+        if isinstance(old_cards, TreeList):
+            # Inserting one by one is cheaper than rebuilding a TreeList,
+            # other storage types like arrays have linear inserts and get rebuilt
+            for number, card in enumerate(new_cards):
+                index = self._insert_random(card)
+                if self._journal is not None:
+                    self._journal.record((INSERT, index, [card]), number > 0)
+            self._index_add(new_cards)
+            if _reporting and (_tracing or log.isEnabledFor(DEBUG)):
+                _report(
+                    "add_many",
+                    self,
+                    "%(cards)i new cards shuffled into the deck",
+                    {"cards": len(new_cards)},
+                )
+            return
+        # Pick the final positions of the new cards, in a random order,
+        # and fill the gaps between them with the old cards
+        positions = sorted(
+            self._rng.sample(range(len(old_cards) + len(new_cards)), len(new_cards))
+        )
+        self._rng.shuffle(new_cards)
+        merged: list[CardType] = []
+        start = 0
+        unshuffled = self._unshuffled
+        for offset, (position, card) in enumerate(zip(positions, new_cards)):
+            end = position - offset
+            if unshuffled and end <= self._unshuffled:
+                # Cards that land among the not yet shuffled ones just join them
+                unshuffled += 1
+            merged.extend(old_cards[start:end])
+            merged.append(card)
+            start = end
+        merged.extend(old_cards[start:])
+        self._cards = merged if self._storage is list else self._storage(merged)
+        self._unshuffled = unshuffled
+        self._index_add(new_cards)
+        if self._journal is not None:
+            self._journal.record((CARDS, old_cards, list(merged)))
+        if _reporting and (_tracing or log.isEnabledFor(DEBUG)):
+            _report(
+                "add_many",
+                self,
+                "%(cards)i new cards shuffled into the deck",
+                {"cards": len(new_cards)},
+            )
 
     def show_top(self, number: int) -> list[CardType]:
         """
@@ -274,7 +951,7 @@ class Deck:
         :param number:      How many cards you want to show
         :return:            Cards you want to show
         """
-        return self._cards[0:number]
+        return self[0:number]
 
     def set_file_location(self, location) -> None:
         """
@@ -324,9 +1001,11 @@ class Deck:
         temp_location = self._save_location
         self._save_location = None
 
-        exported = _get_exported_string(format_stripped, self)
-
-        self._save_location = temp_location
+        try:
+            with _exported_form(self):
+                exported = _get_exported_string(format_stripped, self)
+        finally:
+            self._save_location = temp_location
 
         if to_file:
             with open(self._save_location, "w") as target_file:
@@ -358,6 +1037,10 @@ class Deck:
                 loadable = file.read()
         else:
             loadable = to_load
+        # Serialization libraries are imported on first use to keep importing pyCardDeck cheap
+        import jsonpickle
+        import yaml
+
         try:
             result = jsonpickle.decode(loadable)
             log.debug("loading JSON")
@@ -365,21 +1048,50 @@ class Deck:
             result = yaml.unsafe_load(loadable)
             log.debug("loading YAML")
         try:
+            _flip_cards(result)
             del result.__dict__["_save_location"]
             self.__dict__.update(result.__dict__)
         except AttributeError:
             raise UnknownFormat
+        self._set_cards(self._cards)
+        if self._catalog is not None and isinstance(self._discard_pile, list):
+            self._discard_pile = [self._intern(card) for card in self._discard_pile]
+        if self._journal is not None:
+            self._journal.clear()
+
+    def replay(self, log: Iterable[str]) -> None:
+        """
+        Puts the deck into the state recorded in a replay log, by starting
+        from the logged cards and seed and making all the logged calls again.
+        See :py:mod:`replay` for how to record one.
+
+        .. warning::
+
+            See :meth:`load` for security considerations.
+
+        :param log:             Lines of the log, like a file opened for reading.
+                                The deck should be set up like the recorded one,
+                                with the same storage, catalog and card IDs.
+        :raises ReplayError:    When the log doesn't replay the way it was recorded
+                                or the deck doesn't match a checkpoint of the log
+        """
+        from .replay import replay
+
+        replay(self, log)
 
     def load_standard_deck(self) -> None:
         """
         Loads a standard deck of 52 cards into the deck
-        """
-        location = os.path.join(os.path.dirname(__file__), "standard_deck.yml")
 
-        with open(location) as f:
-            data = yaml.unsafe_load(f).__dict__
-        del data["_save_location"]
+        The deck file is only read the first time, later calls copy the cards over.
+        This means the card instances are shared by all standard decks, so don't change them.
+        """
+        data = _standard_deck_template()
         self.__dict__.update(data)
+        self._set_cards(data["_cards"][:])
+        self._discard_pile = data["_discard_pile"][:]
+        if self._journal is not None:
+            self._journal.clear()
 
     @property
     def cards_left(self) -> int:
@@ -428,6 +1140,14 @@ class Deck:
         """
         return not self._cards
 
+    @property
+    def stats(self) -> dict:
+        """
+        :return:    Snapshot of the stats of every operation called on the deck
+                    since :py:func:`stats.instrument`, empty when it isn't instrumented
+        """
+        return {} if self._stats is None else self._stats.snapshot()
+
     @property
     def file_location(self) -> str:
         """
@@ -449,14 +1169,59 @@ class Deck:
     def __len__(self) -> int:
         return len(self._cards)
 
-    def __getitem__(self, position: int) -> CardType:
-        return self._cards[position]
-
-    def __setitem__(self, position: int, card: CardType) -> None:
-        self._cards[position] = card
+    def __getitem__(self, position: int | slice) -> CardType | list[CardType]:
+        if self._unshuffled:
+            self._settle_top(_depth(position, len(self._cards)))
+        if isinstance(position, slice):
+            return self._cards[_internal_slice(position, len(self._cards))]
+        return self._cards[_internal_index(position, len(self._cards))]
+
+    def __setitem__(self, position: int | slice, card: CardType) -> None:
+        if self._shared:
+            self._own()
+        if self._unshuffled:
+            self._settle_top(_depth(position, len(self._cards)))
+        if isinstance(position, slice):
+            cards = list(reversed(self._cards))
+            new_cards = [self._intern(new_card) for new_card in card]
+            self._index_remove(cards[position])
+            cards[position] = new_cards
+            self._index_add(new_cards)
+            cards.reverse()
+            if self._journal is not None:
+                self._journal.record((CARDS, self._cards, list(cards)))
+            self._cards = self._storage(cards)
+        else:
+            index = _internal_index(position, len(self._cards))
+            card = self._intern(card)
+            self._index_remove((self._cards[index],))
+            self._index_add((card,))
+            if self._journal is not None:
+                self._journal.record((SET, index, self._cards[index], card))
+            self._cards[index] = card
 
     def __iter__(self) -> Iterator[CardType]:
-        return iter(self._cards)
+        self._settle()
+        return reversed(self._cards)
+
+
+@lru_cache(maxsize=None)
+def _standard_deck_template() -> dict:
+    """
+    Reads the standard deck file once per process
+
+    :return:    Attributes of the standard deck, to be copied into a Deck
+    """
+    import yaml
+
+    location = os.path.join(os.path.dirname(__file__), "standard_deck.yml")
+
+    with open(location) as f:
+        result = yaml.unsafe_load(f)
+    _flip_cards(result)
+    data = result.__dict__
+    del data["_save_location"]
+    return data
 
 
 def _card_compare(card: CardType, second_card: CardType) -> bool:
@@ -465,21 +1230,209 @@ def _card_compare(card: CardType, second_card: CardType) -> bool:
     if that returns False, it checks `__dict__` and name of the Class
     that spawned them.
     """
+    if second_card is card:
+        return True
     identity = False
     if second_card == card:
         identity = True
     else:
-        try:
-            if (
-                second_card.__dict__ == card.__dict__
-                and type(second_card).__name__ == type(card).__name__
-            ):
-                identity = True
-        except AttributeError:
-            pass
+        # Cards without a __dict__ (strings, integers, slotted cards) are done after __eq__
+        second_dict = getattr(second_card, "__dict__", None)
+        if (
+            second_dict is not None
+            and second_dict == getattr(card, "__dict__", None)
+            and type(second_card).__name__ == type(card).__name__
+        ):
+            identity = True
     return identity
 
 
+def _card_key(card: CardType) -> Hashable:
+    """
+    Key under which a card is kept in the index of an indexed Deck.
+
+    Hashable cards (strings, integers, instances with their own `__hash__`) are their own key.
+    Other instances are keyed by the name of their class and their `__dict__`,
+    the same things :py:func:`_card_compare` falls back to. Cards with unhashable
+    attributes can't be keyed and indexed decks search for them like unindexed ones.
+    """
+    card_hash = type(card).__hash__
+    has_dict = hasattr(card, "__dict__")
+    if card_hash is not None and (card_hash is not object.__hash__ or not has_dict):
+        return card
+    if not has_dict:
+        return _UNKEYED
+    key = (type(card).__name__, tuple(sorted(card.__dict__.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return _UNKEYED
+    return key
+
+
+def _index_keys(cards: Iterable[CardType]) -> Iterator[Hashable]:
+    """
+    Keys cards are counted under in the index: their own key (see :py:func:`_card_key`)
+    and :py:data:`_SCANNED` for instances with an `__eq__` of their own but no `__hash__`,
+    which can be equal to cards with other keys, like a PokerCard to its name
+    """
+    for card in cards:
+        key = _card_key(card)
+        yield key
+        if key is not card and _compares_by_eq(type(card)):
+            yield _SCANNED
+
+
+@lru_cache(maxsize=None)
+def _compares_by_eq(cls: type) -> bool:
+    """
+    :param cls:     Class of a card
+    :return:        Whether the class compares its instances with its own `__eq__`
+    """
+    return cls.__eq__ is not object.__eq__
+
+
+def _find_keyed(cards: Sequence[CardType], card: CardType) -> int:
+    """
+    Finds a card the index knows about by comparing keys (see :py:func:`_card_key`)
+    instead of calling :py:func:`_card_compare` on every card, so the search runs in C
+
+    :param cards:   Cards of an indexed deck, from the bottom to the top
+    :param card:    Card with a key, at least one card with the same key is in `cards`
+    :return:        Depth from the top of the topmost card with the same key
+    """
+    if _card_key(card) is card:
+        return indexOf(reversed(cards), card)
+    # Other keys are the name of the class and the __dict__, compare the dicts first
+    attributes = map(getattr, reversed(cards), repeat("__dict__"), repeat(None))
+    name = type(card).__name__
+    depth = -1
+    while True:
+        depth += 1 + indexOf(attributes, card.__dict__)
+        if type(cards[len(cards) - 1 - depth]).__name__ == name:
+            return depth
+
+
+def _internal_index(position: int, length: int) -> int:
+    """
+    Translates a position counted from the top of the deck into an index
+    of the underlying bottom to top list
+
+    :param position:        Position from the top, negative counts from the bottom
+    :param length:          Number of cards in the deck
+    :return:                Index into Deck._cards
+    :raises IndexError:     when the position is out of range
+    """
+    if position < 0:
+        position += length
+    if not 0 <= position < length:
+        raise IndexError("deck index out of range")
+    return length - 1 - position
+
+
+def _internal_slice(position: slice, length: int) -> slice:
+    """
+    Translates a slice counted from the top of the deck into a slice
+    of the underlying bottom to top list
+
+    :param position:        Slice of positions from the top
+    :param length:          Number of cards in the deck
+    :return:                Slice of Deck._cards selecting the same cards in the same order
+    """
+    start, stop, step = position.indices(length)
+    count = len(range(start, stop, step))
+    if not count:
+        return slice(0, 0)
+    first = length - 1 - start
+    end = first - step * count
+    return slice(first, end if end >= 0 else None, -step)
+
+
+def _depth(position: int | slice, length: int) -> int:
+    """
+    How many cards from the top of the deck a position reaches
+
+    :param position:        Position or slice of positions from the top
+    :param length:          Number of cards in the deck
+    :return:                Number of top cards including the deepest position
+    """
+    if isinstance(position, slice):
+        positions = range(*position.indices(length))
+        return max(positions) + 1 if positions else 0
+    return position + 1 if position >= 0 else length
+
+
+def _insert_index(position: int, length: int) -> int:
+    """
+    Translates an insert position counted from the top of the deck into an index
+    of the underlying bottom to top list, clamping it the same way list.insert does
+
+    :param position:        Position from the top, 0 puts the card on top
+    :param length:          Number of cards in the deck
+    :return:                Index for Deck._cards.insert
+    """
+    if position < 0:
+        position = max(position + length, 0)
+    return length - min(position, length)
+
+
+@contextmanager
+def _exported_form(deck: Deck) -> Iterator[None]:
+    """
+    Temporarily puts a deck and its discard pile, if it's a Deck, into the form it's exported in:
+    cards listed from the top and no runtime only attributes.
+    """
+    deck._settle()
+    # IDs only make sense with the catalog, which isn't exported
+    catalog = deck._catalog if deck._card_ids else None
+    # Methods wrapped on the instance, like by stats.instrument, are runtime only too
+    hidden = {
+        name: deck.__dict__.pop(name)
+        for name in list(deck.__dict__)
+        if name in _TRANSIENT or _is_method(type(deck), name)
+    }
+    cards = deck._cards
+    deck._cards = list(reversed(cards))
+    discard_pile = deck._discard_pile
+    if catalog is not None:
+        deck._cards = catalog.cards(deck._cards)
+        if isinstance(discard_pile, list):
+            deck._discard_pile = catalog.cards(discard_pile)
+    try:
+        if isinstance(deck._discard_pile, Deck):
+            with _exported_form(deck._discard_pile):
+                yield
+        else:
+            yield
+    finally:
+        deck._cards = cards
+        deck._discard_pile = discard_pile
+        deck.__dict__.update(hidden)
+
+
+@lru_cache(maxsize=None)
+def _is_method(cls: type, name: str) -> bool:
+    """
+    Tells methods wrapped on a deck instance apart from its state
+
+    :param cls:     Class of the deck
+    :param name:    Name of an attribute of the deck
+    :return:        Whether the class defines a method of that name
+    """
+    return isinstance(getattr_static(cls, name, None), FunctionType)
+
+
+def _flip_cards(deck: Deck) -> None:
+    """
+    Reverses the order of stored cards of a deck and of its discard pile, if it's a Deck.
+    Used to convert between the bottom to top storage and the top to bottom
+    order of exported decks.
+    """
+    deck._cards.reverse()
+    if isinstance(deck._discard_pile, Deck):
+        _flip_cards(deck._discard_pile)
+
+
 def _get_exported_string(format_stripped: str, deck: Deck) -> str:
     """
     Helper function to Deck.export()
@@ -490,9 +1443,13 @@ def _get_exported_string(format_stripped: str, deck: Deck) -> str:
     :raises UnknownFormat:      when it doesn't recognize format_stripped
     """
     if format_stripped in ("yaml", "yml"):
+        import yaml
+
         exported = yaml.dump(deck)
         log.debug("Exported deck %r to a yaml string", deck)
     elif format_stripped == "json":
+        import jsonpickle
+
         exported = jsonpickle.encode(deck)
         log.debug("Exported deck %r to a json string", deck)
     else:
@@ -0,0 +1,228 @@
+"""
+Texas Hold'em equity calculator, the chances of every hand to win or split the pot
+given the cards on the table. Needs NumPy, so it isn't imported with :py:mod:`pyCardDeck`::
+
+    from pyCardDeck.equity import equity
+
+    hero, villain = equity([player.hand, []], board=table_cards, time_budget=0.05)
+    hero.equity
+
+Known cards are drawn from a standard :ref:`Deck` with :py:meth:`Deck.draw_specific`,
+so they can be given as anything the deck recognizes, :py:class:`cards.PokerCard`
+instances or names like "Ace of Spades". The remaining runouts are enumerated
+when there are few enough of them and sampled otherwise, scoring all runouts
+of a batch at once with :py:func:`evaluator.evaluate_array`.
+"""
+
+import logging
+import time
+from collections.abc import Iterable, Sequence
+from itertools import combinations
+from math import comb
+from multiprocessing import get_context
+from typing import Any, NamedTuple
+
+import numpy
+
+from .cards import CardType
+from .deck import Deck
+from .evaluator import card_code, evaluate_array
+
+log = logging.getLogger(__name__)
+
+# Runouts scored at once, bounds the memory of a batch
+BATCH = 20_000
+
+
+class Equity(NamedTuple):
+    """
+    Chances of one hand
+
+    :param win:     Chance to win the pot alone
+    :param tie:     Chance to split the pot
+    :param equity:  Average share of the pot, wins plus split shares
+    :param runouts: Number of runouts the chances are based on
+    :param exact:   Whether all runouts were enumerated, otherwise they were sampled
+    """
+
+    win: float
+    tie: float
+    equity: float
+    runouts: int
+    exact: bool
+
+
+def equity(
+    hands: Sequence[Sequence[CardType]],
+    board: Sequence[CardType] = (),
+    dead: Iterable[CardType] = (),
+    samples: int = 100_000,
+    time_budget: float | None = None,
+    exact_limit: int = 200_000,
+    rng: Any = None,
+    workers: int = 1,
+) -> list[Equity]:
+    """
+    Calculates the equity of every hand
+
+    :param hands:       Hole cards of every player, an empty hand for an unknown one
+    :param board:       Cards on the table, up to 5
+    :param dead:        Other cards known to be out of the deck, like burned cards
+    :param samples:     Most runouts to sample when they aren't enumerated
+    :param time_budget: Seconds to stop sampling after, at least one batch is sampled
+    :param exact_limit: Enumerate the runouts when there are at most this many of them
+                        and all hands are known
+    :param rng:         NumPy Generator or seed for sampling
+    :param workers:     Processes enumerating the runouts, 1 to enumerate in this process
+    :return:            Equity of every hand, in the order of `hands`
+    :raises CardNotFound:   when a card isn't in a standard deck or is given twice
+    :raises ValueError:     when there are too many cards
+    """
+    if len(board) > 5 or any(len(hand) > 2 for hand in hands):
+        raise ValueError("Hands have up to 2 cards and the board up to 5")
+    deck = Deck(reshuffle=False)
+    deck.load_standard_deck()
+    holes = [[card_code(deck.draw_specific(card)) for card in hand] for hand in hands]
+    known_board = [card_code(deck.draw_specific(card)) for card in board]
+    for card in dead:
+        deck.draw_specific(card)
+    remaining = numpy.array([card_code(card) for card in deck])
+    missing = 5 - len(known_board)
+    unknown = sum(2 - len(hole) for hole in holes)
+    if not unknown and comb(len(remaining), missing) <= exact_limit:
+        totals, runouts = _enumerate(holes, known_board, remaining, missing, workers)
+        exact = True
+    else:
+        totals, runouts = _sample(
+            holes,
+            known_board,
+            remaining,
+            missing + unknown,
+            samples,
+            time_budget,
+            numpy.random.default_rng(rng),
+        )
+        exact = False
+    log.debug(
+        "Equity from %i %s runouts", runouts, "enumerated" if exact else "sampled"
+    )
+    wins, ties, shares = totals / max(runouts, 1)
+    return [
+        Equity(float(win), float(tie), float(share), runouts, exact)
+        for win, tie, share in zip(wins, ties, shares)
+    ]
+
+
+def equity_many(
+    situations: Iterable[tuple[Sequence[Sequence[CardType]], Sequence[CardType]]],
+    **options: Any,
+) -> list[list[Equity]]:
+    """
+    Calculates the equity of many situations, see :py:func:`equity`
+
+    :param situations:  Pairs of hands and board
+    :param options:     Options for :py:func:`equity`
+    :return:            Equities of every situation
+    """
+    return [equity(hands, board, **options) for hands, board in situations]
+
+
+def _enumerate(
+    holes: list[list[int]],
+    board: list[int],
+    remaining: numpy.ndarray,
+    missing: int,
+    workers: int,
+) -> tuple[numpy.ndarray, int]:
+    """
+    Scores every runout of the board
+
+    :return:    Wins, ties and shares of every hand summed over the runouts, and their number
+    """
+    picked = list(combinations(range(len(remaining)), missing))
+    runouts = remaining[
+        numpy.array(picked, dtype=numpy.intp).reshape(len(picked), missing)
+    ]
+    chunks = [
+        (holes, board, runouts[start : start + BATCH])
+        for start in range(0, len(runouts), BATCH)
+    ]
+    if workers > 1 and len(chunks) > 1:
+        with get_context().Pool(min(workers, len(chunks))) as pool:
+            scored = pool.map(_score_chunk, chunks)
+    else:
+        scored = [_score_chunk(chunk) for chunk in chunks]
+    return sum(scored), len(runouts)
+
+
+def _sample(
+    holes: list[list[int]],
+    board: list[int],
+    remaining: numpy.ndarray,
+    drawn: int,
+    samples: int,
+    time_budget: float | None,
+    rng: numpy.random.Generator,
+) -> tuple[numpy.ndarray, int]:
+    """
+    Scores random runouts, dealing the unknown hole cards as well
+
+    :return:    Wins, ties and shares of every hand summed over the runouts, and their number
+    """
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    totals = numpy.zeros((3, len(holes)))
+    runouts = 0
+    # With a deadline, start small and size the next batches to the time that's left
+    batch = BATCH if deadline is None else 500
+    while runouts < samples:
+        size = min(batch, samples - runouts)
+        start = time.perf_counter()
+        picked = numpy.argsort(rng.random((size, len(remaining))), axis=1)[:, :drawn]
+        totals += _score_chunk((holes, board, remaining[picked]))
+        runouts += size
+        if deadline is not None:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            batch = min(int(size * (deadline - now) / (now - start)) + 1, BATCH)
+    return totals, runouts
+
+
+def _score_chunk(chunk: tuple) -> numpy.ndarray:
+    """
+    Scores runouts, the cards of each runout complete the board first
+    and then the unknown hands in order
+
+    :return:    Wins, ties and shares of every hand summed over the runouts
+    """
+    holes, board, runouts = chunk
+    size = len(runouts)
+    missing = 5 - len(board)
+    boards = numpy.hstack(
+        [
+            numpy.tile(numpy.array(board, dtype=numpy.int64), (size, 1)),
+            runouts[:, :missing],
+        ]
+    )
+    dealt = missing
+    strengths = []
+    for hole in holes:
+        cards = numpy.hstack(
+            [
+                numpy.tile(numpy.array(hole, dtype=numpy.int64), (size, 1)),
+                runouts[:, dealt : dealt + 2 - len(hole)],
+                boards,
+            ]
+        )
+        dealt += 2 - len(hole)
+        strengths.append(evaluate_array(cards))
+    strengths = numpy.stack(strengths, axis=1)
+    winners = strengths == strengths.min(axis=1, keepdims=True)
+    counts = winners.sum(axis=1, keepdims=True)
+    return numpy.stack(
+        [
+            (winners & (counts == 1)).sum(axis=0),
+            (winners & (counts > 1)).sum(axis=0),
+            (winners / counts).sum(axis=0),
+        ]
+    )
@@ -39,6 +39,23 @@ class CardNotFound(DeckException):
     pass
 
 
+class NoHistory(DeckException):
+    """
+    Exception that's thrown when there is nothing to undo or redo
+    """
+
+    pass
+
+
+class ReplayError(DeckException):
+    """
+    Exception that's thrown when a replay log can't be replayed
+    or the replayed deck doesn't match it
+    """
+
+    pass
+
+
 class UnknownFormat(Exception):
     """
     Exception thrown when trying to export to a unknown format.
@@ -0,0 +1,275 @@
+"""
+Poker hand evaluator for :py:class:`cards.PokerCard` and anything else with the `rank`
+and `suit` of a standard deck::
+
+    from pyCardDeck.evaluator import evaluate, hand_class
+
+    strength = evaluate(player.hand + table_cards)
+    hand_class(strength)  # 'Two Pair'
+
+Hands of 5 to 7 cards get a strength from 1 (royal flush) to 7462 (seven high),
+lower is better and equal hands get equal strengths.
+
+Cards are encoded into integers the way Cactus Kev's evaluator does it::
+
+    xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+
+with a bit for the rank (b), a bit for the suit (cdhs), the rank number (r)
+and a prime number for the rank (p). A 5-card hand is then a flush when the suit bits
+of all cards overlap, ranks of hands with 5 different ranks are found by OR-ing the rank bits,
+and all other hands are told apart by the product of their primes,
+each looked up in a table. The tables are generated on first use.
+"""
+
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from itertools import combinations
+from typing import Any
+
+from .cards import CardType
+
+RANKS = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A")
+SUITS = ("Spades", "Hearts", "Diamonds", "Clubs")
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Worst strength of every hand class, from the best class
+CLASSES = (
+    (10, "Straight Flush"),
+    (166, "Four of a Kind"),
+    (322, "Full House"),
+    (1599, "Flush"),
+    (1609, "Straight"),
+    (2467, "Three of a Kind"),
+    (3325, "Two Pair"),
+    (6185, "Pair"),
+    (7462, "High Card"),
+)
+
+_RANK_NUMBERS = {rank: number for number, rank in enumerate(RANKS)}
+_SUIT_BITS = {suit: 0x1000 << number for number, suit in enumerate(SUITS)}
+
+
+class _Tables:
+    """
+    Lookup tables, see :py:func:`_tables`
+
+    :param flushes:     Strength of 5-card flushes by their rank bits
+    :param unique:      Strength of other hands of 5 different ranks by their rank bits
+    :param products:    Strength of all other 5-card hands by the product of their primes
+    :param flushes7:    Strength of the best flush within 5 to 7 cards of one suit by their rank bits
+    """
+
+    def __init__(
+        self, flushes: list[int], unique: list[int], products: dict[int, int]
+    ) -> None:
+        self.flushes = flushes
+        self.unique = unique
+        self.products = products
+        self.flushes7 = [0] * 0x2000
+        for bits in range(0x2000):
+            if 5 <= bin(bits).count("1") <= 7:
+                self.flushes7[bits] = min(
+                    flushes[sum(five)] for five in combinations(_bits(bits), 5)
+                )
+
+
+def card_code(card: CardType) -> int:
+    """
+    :param card:        Card with the `rank` and `suit` of a standard deck, like :py:class:`cards.PokerCard`
+    :return:            Integer code of the card for the evaluator
+    :raises ValueError: when the rank or suit isn't one of a standard deck
+    """
+    try:
+        rank = _RANK_NUMBERS[card.rank]
+        suit = _SUIT_BITS[card.suit]
+    except (AttributeError, KeyError):
+        raise ValueError("{} isn't a card of a standard deck".format(card)) from None
+    return (1 << (16 + rank)) | suit | (rank << 8) | PRIMES[rank]
+
+
+def catalog_codes(cards: Iterable[CardType]) -> list[int]:
+    """
+    Codes of cards, for example of all cards of a :py:class:`catalog.CardCatalog`,
+    so hands of catalog IDs can be turned into codes with ``[codes[id] for id in hand]``
+
+    :param cards:   Cards to encode
+    :return:        Their codes
+    """
+    return [card_code(card) for card in cards]
+
+
+def evaluate(cards: Sequence[CardType]) -> int:
+    """
+    :param cards:       5, 6 or 7 cards, see :py:func:`card_code`
+    :return:            Strength of the best 5-card hand among them, lower is better
+    """
+    return evaluate_codes([card_code(card) for card in cards])
+
+
+def evaluate_codes(codes: Sequence[int]) -> int:
+    """
+    :param codes:       Codes of 5, 6 or 7 cards
+    :return:            Strength of the best 5-card hand among them, lower is better
+    :raises ValueError: for other numbers of cards
+    """
+    if len(codes) == 5:
+        return _evaluate5(*codes, _tables())
+    if not 5 < len(codes) <= 7:
+        raise ValueError("Hands have 5 to 7 cards, not {}".format(len(codes)))
+    tables = _tables()
+    for suit in (0x1000, 0x2000, 0x4000, 0x8000):
+        suited = [code for code in codes if code & suit]
+        if len(suited) >= 5:
+            # With 5 cards of a suit out of 7, nothing beats the flush but a straight flush
+            bits = 0
+            for code in suited:
+                bits |= code
+            return tables.flushes7[bits >> 16]
+    return min(_evaluate5(*five, tables) for five in combinations(codes, 5))
+
+
+def evaluate_many(hands: Iterable[Sequence[CardType]]) -> list[int]:
+    """
+    :param hands:   Hands of 5 to 7 cards each
+    :return:        Strength of every hand, see :py:func:`evaluate`
+    """
+    return [evaluate(hand) for hand in hands]
+
+
+def evaluate_array(codes: Any) -> Any:
+    """
+    Evaluates many hands at once with NumPy
+
+    :param codes:       Array of card codes of shape (hands, cards), with 5 to 7 cards per hand
+    :return:            Array of the strength of every hand
+    :raises ValueError: for other numbers of cards
+    """
+    import numpy
+
+    codes = numpy.asarray(codes, dtype=numpy.int64)
+    if codes.ndim != 2 or not 5 <= codes.shape[1] <= 7:
+        raise ValueError("Expected an array of hands of 5 to 7 cards")
+    flushes, unique, products, strengths = _arrays()
+    best = None
+    for five in combinations(range(codes.shape[1]), 5):
+        hand = codes[:, five]
+        bits = numpy.bitwise_or.reduce(hand, axis=1) >> 16
+        suited = numpy.bitwise_and.reduce(hand, axis=1) & 0xF000
+        product = numpy.prod(hand & 0xFF, axis=1)
+        found = strengths[numpy.searchsorted(products, product)]
+        strength = numpy.where(unique[bits] > 0, unique[bits], found)
+        strength = numpy.where(suited > 0, flushes[bits], strength)
+        best = strength if best is None else numpy.minimum(best, strength)
+    return best
+
+
+def hand_class(strength: int) -> str:
+    """
+    :param strength:    Strength from :py:func:`evaluate`
+    :return:            Name of the hand class, like "Full House"
+    """
+    for worst, name in CLASSES:
+        if strength <= worst:
+            return name
+    raise ValueError("Strengths go from 1 to 7462, not {}".format(strength))
+
+
+def _evaluate5(
+    first: int, second: int, third: int, fourth: int, fifth: int, tables: _Tables
+) -> int:
+    """
+    Strength of a 5-card hand, the handful of integer operations it takes
+    """
+    bits = (first | second | third | fourth | fifth) >> 16
+    if first & second & third & fourth & fifth & 0xF000:
+        return tables.flushes[bits]
+    strength = tables.unique[bits]
+    if strength:
+        return strength
+    return tables.products[
+        (first & 0xFF)
+        * (second & 0xFF)
+        * (third & 0xFF)
+        * (fourth & 0xFF)
+        * (fifth & 0xFF)
+    ]
+
+
+def _bits(bits: int) -> list[int]:
+    """
+    :return:    Single bits that are set in bits
+    """
+    return [1 << rank for rank in range(13) if bits >> rank & 1]
+
+
+@lru_cache(maxsize=None)
+def _tables() -> _Tables:
+    """
+    Generates the lookup tables once per process, going from the best hands to the worst
+    """
+    descending = list(reversed(range(13)))
+    straights = [0x1F00 >> shift for shift in range(9)] + [0x100F]
+    others = [
+        sum(1 << rank for rank in ranks)
+        for ranks in combinations(descending, 5)
+        if sum(1 << rank for rank in ranks) not in straights
+    ]
+    flushes = [0] * 0x2000
+    unique = [0] * 0x2000
+    products: dict[int, int] = {}
+    strength = 0
+
+    def count(table: list[int] | dict[int, int], key: int) -> None:
+        nonlocal strength
+        strength += 1
+        table[key] = strength
+
+    for bits in straights:
+        count(flushes, bits)
+    for quads in descending:
+        for kicker in descending:
+            if kicker != quads:
+                count(products, PRIMES[quads] ** 4 * PRIMES[kicker])
+    for trips in descending:
+        for pair in descending:
+            if pair != trips:
+                count(products, PRIMES[trips] ** 3 * PRIMES[pair] ** 2)
+    for bits in others:
+        count(flushes, bits)
+    for bits in straights:
+        count(unique, bits)
+    for trips in descending:
+        kickers = [rank for rank in descending if rank != trips]
+        for first, second in combinations(kickers, 2):
+            count(products, PRIMES[trips] ** 3 * PRIMES[first] * PRIMES[second])
+    for high, low in combinations(descending, 2):
+        for kicker in descending:
+            if kicker not in (high, low):
+                count(products, PRIMES[high] ** 2 * PRIMES[low] ** 2 * PRIMES[kicker])
+    for pair in descending:
+        kickers = [rank for rank in descending if rank != pair]
+        for first, second, third in combinations(kickers, 3):
+            count(
+                products,
+                PRIMES[pair] ** 2 * PRIMES[first] * PRIMES[second] * PRIMES[third],
+            )
+    for bits in others:
+        count(unique, bits)
+    return _Tables(flushes, unique, products)
+
+
+@lru_cache(maxsize=None)
+def _arrays() -> tuple:
+    """
+    The lookup tables as NumPy arrays, with the products sorted for a binary search
+    """
+    import numpy
+
+    tables = _tables()
+    products = sorted(tables.products)
+    return (
+        numpy.array(tables.flushes),
+        numpy.array(tables.unique),
+        numpy.array(products, dtype=numpy.int64),
+        numpy.array([tables.products[product] for product in products] + [0]),
+    )
@@ -0,0 +1,199 @@
+"""
+Journal of the changes to a deck, for undoing and redoing them::
+
+    deck.start_journal()
+    card = deck.draw()
+    deck.undo()  # the card is back on top
+    deck.redo()  # and drawn again
+
+Every operation is recorded as one or more steps that say exactly what changed
+in the deck's storage, like the cards removed at a position, so undoing
+and redoing takes time proportional to the operation and not to the deck size.
+Operations that reorder the whole deck anyway, like shuffles, keep the order
+before and after them.
+"""
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from .errors import NoHistory
+
+if TYPE_CHECKING:
+    from .deck import Deck
+
+# Cards removed from the storage at an index, in storage order
+REMOVE = "remove"
+# Cards inserted into the storage at an index, in storage order
+INSERT = "insert"
+# Card at an index of the storage replaced by another one
+SET = "set"
+# All cards of the storage before and after the operation
+CARDS = "cards"
+# Card put on top of the discard pile
+DISCARD = "discard"
+# All cards of the discard pile before and after the operation
+PILE = "pile"
+
+Step = tuple[Any, ...]
+
+
+class Journal:
+    """
+    Undo and redo history of a deck, see :py:meth:`Deck.start_journal`
+
+    :param limit:   Most operations to remember, the oldest are forgotten first.
+                    No limit by default.
+    """
+
+    def __init__(self, limit: int | None = None) -> None:
+        self.limit = limit
+        self._undo: deque[list[Step]] = deque(maxlen=limit)
+        self._redo: list[list[Step]] = []
+        self._joining = 0
+
+    def record(self, step: Step, join: bool = False) -> None:
+        """
+        Records a step of an operation and forgets what could have been redone
+
+        :param step:    What changed
+        :param join:    Whether the step belongs to the last recorded operation
+        """
+        if (join or self._joining) and self._undo:
+            self._undo[-1].append(step)
+        else:
+            self._undo.append([step])
+        self._redo.clear()
+
+    @contextmanager
+    def joined(self) -> Iterator[None]:
+        """
+        Records all steps within the block as part of the last recorded operation
+        """
+        self._joining += 1
+        try:
+            yield
+        finally:
+            self._joining -= 1
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def clear(self) -> None:
+        """
+        Forgets the whole history
+        """
+        self._undo.clear()
+        self._redo.clear()
+
+    def copy(self) -> "Journal":
+        """
+        :return:    Journal with the same history, for a fork of the deck
+        """
+        copied = Journal(self.limit)
+        copied._undo.extend(list(steps) for steps in self._undo)
+        copied._redo.extend(list(steps) for steps in self._redo)
+        return copied
+
+    def undo(self, deck: "Deck") -> None:
+        """
+        Reverts the last recorded operation
+
+        :param deck:        Deck the journal belongs to
+        :raises NoHistory:  when there is nothing to undo
+        """
+        if not self._undo:
+            raise NoHistory("There is nothing to undo")
+        steps = self._undo.pop()
+        _own(deck)
+        for step in reversed(steps):
+            _apply(deck, step, forward=False)
+        self._redo.append(steps)
+
+    def redo(self, deck: "Deck") -> None:
+        """
+        Repeats the last undone operation
+
+        :param deck:        Deck the journal belongs to
+        :raises NoHistory:  when there is nothing to redo
+        """
+        if not self._redo:
+            raise NoHistory("There is nothing to redo")
+        steps = self._redo.pop()
+        _own(deck)
+        for step in steps:
+            _apply(deck, step, forward=True)
+        self._undo.append(steps)
+
+    def __len__(self) -> int:
+        """
+        :return:    Number of operations that can be undone
+        """
+        return len(self._undo)
+
+
+def _own(deck: "Deck") -> None:
+    """
+    Makes sure nothing the journal changes is shared with a fork
+    """
+    if deck._shared:
+        deck._own()
+    pile = deck._discard_pile
+    if not isinstance(pile, list) and pile._shared:
+        pile._own()
+
+
+def _apply(deck: "Deck", step: Step, forward: bool) -> None:
+    """
+    Does a step, or reverts it
+    """
+    kind = step[0]
+    if kind is REMOVE or kind is INSERT:
+        _, index, items = step
+        if (kind is REMOVE) == forward:
+            del deck._cards[index : index + len(items)]
+            deck._index_remove(items)
+        else:
+            _insert(deck._cards, index, items)
+            deck._index_add(items)
+    elif kind is SET:
+        _, index, old, new = step
+        deck._index_remove((old,) if forward else (new,))
+        deck._index_add((new,) if forward else (old,))
+        deck._cards[index] = new if forward else old
+    elif kind is CARDS:
+        _, old, new = step
+        deck._set_cards(list(new if forward else old))
+    elif kind is DISCARD:
+        _, card = step
+        pile = deck._discard_pile
+        if isinstance(pile, list):
+            if forward:
+                pile.append(card)
+            else:
+                pile.pop()
+        elif forward:
+            pile._cards.append(card)
+            pile._index_add((card,))
+        else:
+            pile._index_remove((pile._cards.pop(),))
+    elif kind is PILE:
+        _, old, new = step
+        if isinstance(deck._discard_pile, list):
+            deck._discard_pile = list(new if forward else old)
+        else:
+            deck._discard_pile._set_cards(list(new if forward else old))
+
+
+def _insert(cards: Any, index: int, items: list) -> None:
+    if isinstance(cards, list):
+        cards[index:index] = items
+    else:
+        for offset, item in enumerate(items):
+            cards.insert(index + offset, item)
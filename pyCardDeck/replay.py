@@ -0,0 +1,318 @@
+"""
+Replay logs of decks: the seed, the cards the deck started with and every call
+made on it, instead of a dump of the whole deck after every change::
+
+    from pyCardDeck.replay import record, verify
+
+    with open("table.log", "w") as log:
+        recorder = record(deck, log)
+        play(deck)
+        recorder.checkpoint()
+
+    with open("table.log") as log:
+        replayed = Deck()
+        replayed.replay(log)
+
+Logs are line-delimited JSON, one line per call, appended as the game goes on.
+A standard deck is logged as just "standard". Random draws, random inserts
+and reshuffles come out the same because the deck gets its own generator seeded
+with the logged seed. Checkpoints are digests of the deck's state,
+replaying checks the state at every checkpoint.
+
+.. warning::
+
+    Cards that aren't strings, integers or the like are logged with ``jsonpickle``.
+    Like :py:meth:`Deck.load`, only replay logs you trust.
+"""
+
+import hashlib
+import json
+import os
+import random
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, TextIO
+
+from .errors import ReplayError
+from .rng import as_random_source
+
+if TYPE_CHECKING:
+    from .deck import Deck
+
+VERSION = 1
+
+# Logged methods, the calls they make on the deck themselves aren't logged
+CALLS = (
+    "draw",
+    "draw_bottom",
+    "draw_random",
+    "draw_many",
+    "deal",
+    "draw_specific",
+    "add_single",
+    "add_many",
+    "shuffle",
+    "shuffle_back",
+    "reshuffle_if_empty",
+    "discard",
+    "clear",
+    "load",
+    "load_standard_deck",
+    "start_journal",
+    "stop_journal",
+    "undo",
+    "redo",
+    "reset",
+)
+
+
+class Recorder:
+    """
+    Writes the calls made on a deck to a replay log, see :py:func:`record`
+
+    :param deck:    Recorded deck
+    :param stream:  Where the lines of the log are written to
+    """
+
+    def __init__(self, deck: "Deck", stream: TextIO) -> None:
+        self.deck = deck
+        self.stream = stream
+        # How many logged calls are running, calls they make aren't logged
+        self._depth = 0
+
+    def checkpoint(self) -> str:
+        """
+        Logs a digest of the deck's current state, replaying checks the state against it
+
+        :return:    The digest, see :py:func:`digest`
+        """
+        state = digest(self.deck)
+        self._write({"checkpoint": state})
+        return state
+
+    def stop(self) -> None:
+        """
+        Stops logging the calls and flushes the log
+        """
+        for name in CALLS:
+            method = self.deck.__dict__.get(name)
+            if getattr(method, "__recorder__", None) is self:
+                del self.deck.__dict__[name]
+        self.stream.flush()
+
+    def _write(self, entry: dict) -> None:
+        self.stream.write(_encode(entry) + "\n")
+
+    def _wrap(self, name: str, method: Callable) -> Callable:
+        def recorded(*args: Any, **kwargs: Any) -> Any:
+            if self._depth:
+                return method(*args, **kwargs)
+            entry: dict[str, Any] = {"call": name}
+            logged_args, logged_kwargs = _logged_call(name, args, kwargs)
+            if logged_args:
+                entry["args"] = logged_args
+            if logged_kwargs:
+                entry["kwargs"] = logged_kwargs
+            self._depth += 1
+            try:
+                return method(*args, **kwargs)
+            except Exception as error:
+                entry["raised"] = type(error).__name__
+                raise
+            finally:
+                self._depth -= 1
+                self._write(entry)
+
+        recorded.__wrapped__ = method  # type: ignore[attr-defined]
+        recorded.__recorder__ = self  # type: ignore[attr-defined]
+        recorded.__doc__ = method.__doc__
+        return recorded
+
+
+def record(deck: "Deck", stream: TextIO, seed: int | None = None) -> Recorder:
+    """
+    Starts logging the calls made on a deck
+
+    The deck gets its own random generator seeded with `seed`, so that its random
+    draws, inserts and shuffles can be replayed. The log starts with the cards
+    the deck has now and a journal's history is forgotten, as it couldn't be replayed.
+    Loads are logged with the whole loaded deck, the only calls that change the deck
+    without being logged are assignments (``deck[0] = card``).
+
+    :param deck:        Deck to record, its discard pile has to be a list
+    :param stream:      Text stream to write the log to, like a file opened for appending
+    :param seed:        Seed of the deck's generator, a random one by default
+    :return:            Recorder, to add checkpoints and stop recording
+    :raises ValueError: when the deck shuffles lazily or its discard pile is a Deck
+    """
+    from .deck import _standard_deck_template
+
+    if deck._lazy_shuffle:
+        raise ValueError("Decks with lazy_shuffle can't be replayed")
+    if not isinstance(deck._discard_pile, list):
+        raise ValueError("Only decks with a list discard pile can be replayed")
+    if seed is None:
+        seed = random.getrandbits(64)
+    deck._rng = as_random_source(seed)
+    header: dict[str, Any] = {
+        "version": VERSION,
+        "seed": seed,
+        "storage": deck._storage.__name__,
+        "reshuffle": deck._reshuffle,
+    }
+    standard = _standard_deck_template()["_cards"]
+    if len(deck._cards) == len(standard) and all(
+        card is standard_card for card, standard_card in zip(deck._cards, standard)
+    ):
+        header["cards"] = "standard"
+    else:
+        header["cards"] = list(deck)
+    header["discarded"] = list(deck._discard_pile)
+    if deck._journal is not None:
+        deck._journal.clear()
+        header["journal"] = deck._journal.limit
+    recorder = Recorder(deck, stream)
+    recorder._write(header)
+    for name in CALLS:
+        if hasattr(deck, name):
+            setattr(deck, name, recorder._wrap(name, getattr(deck, name)))
+    return recorder
+
+
+def replay(deck: "Deck", log: Iterable[str]) -> None:
+    """
+    Puts a deck into the state a replay log ends with, see :py:meth:`Deck.replay`
+    """
+    lines = iter(log)
+    try:
+        header = _decode(next(lines))
+    except StopIteration:
+        raise ReplayError("The replay log is empty")
+    if not isinstance(header, dict) or header.get("version") != VERSION:
+        raise ReplayError("Not a replay log of a known version")
+    if deck._lazy_shuffle:
+        raise ValueError("Decks with lazy_shuffle can't be replayed")
+    if deck._storage.__name__ != header["storage"]:
+        raise ReplayError(
+            "The log was recorded with {} storage, the deck uses {}".format(
+                header["storage"], deck._storage.__name__
+            )
+        )
+    if header["cards"] == "standard":
+        deck.load_standard_deck()
+    else:
+        deck._set_cards(header["cards"][::-1])
+    deck._discard_pile = [deck._intern(card) for card in header["discarded"]]
+    deck._reshuffle = header["reshuffle"]
+    deck._rng = as_random_source(header["seed"])
+    deck.stop_journal()
+    if "journal" in header:
+        deck.start_journal(header["journal"])
+    for number, line in enumerate(lines, start=2):
+        if not line.strip():
+            continue
+        entry = _decode(line)
+        if "checkpoint" in entry:
+            if digest(deck) != entry["checkpoint"]:
+                raise ReplayError(
+                    "The deck doesn't match the checkpoint on line {}".format(number)
+                )
+            continue
+        method = getattr(deck, entry["call"])
+        try:
+            method(*entry.get("args", ()), **entry.get("kwargs", {}))
+        except Exception as error:
+            if type(error).__name__ != entry.get("raised"):
+                raise ReplayError(
+                    "Line {} raised {!r} when replayed".format(number, error)
+                ) from error
+        else:
+            if "raised" in entry:
+                raise ReplayError(
+                    "Line {} raised {} when recorded, but not when replayed".format(
+                        number, entry["raised"]
+                    )
+                )
+
+
+def verify(
+    log: Iterable[str], checkpoint: str | None = None, deck: "Deck | None" = None
+) -> "Deck":
+    """
+    Replays a log and checks the deck against every checkpoint in it
+    and against a checkpoint stored elsewhere
+
+    :param log:             Lines of the replay log
+    :param checkpoint:      Digest the deck should end up with, see :py:func:`digest`
+    :param deck:            Deck to replay into, set up like the recorded one.
+                            A new Deck by default.
+    :return:                The replayed deck
+    :raises ReplayError:    when the deck doesn't match a checkpoint or the replay
+                            goes differently than the recorded game
+    """
+    if deck is None:
+        from .deck import Deck
+
+        deck = Deck()
+    deck.replay(log)
+    if checkpoint is not None and digest(deck) != checkpoint:
+        raise ReplayError("The replayed deck doesn't match the checkpoint")
+    return deck
+
+
+def digest(deck: "Deck") -> str:
+    """
+    Digest of the state of a deck: its cards and its discard pile, in order
+
+    :param deck:    Deck to digest
+    :return:        SHA-256 hex digest
+    """
+    state = _encode([list(deck), list(deck._discard_pile)])
+    return hashlib.sha256(state.encode()).hexdigest()
+
+
+def _logged_call(name: str, args: tuple, kwargs: dict) -> tuple[list, dict]:
+    """
+    Arguments of a call as they are logged. Hands passed to deal are logged as their
+    number and loads from a file as the data in the file, so the file isn't needed
+    to replay the log.
+    """
+    if name == "deal" and args and not isinstance(args[0], int):
+        return [len(args[0]), *args[1:]], kwargs
+    if name == "load":
+        to_load = args[0] if args else kwargs["to_load"]
+        is_file = args[1] if len(args) > 1 else kwargs.get("is_file", False)
+        if is_file:
+            with open(os.path.abspath(os.path.expanduser(to_load))) as file:
+                to_load = file.read()
+        return [to_load], {}
+    return list(args), kwargs
+
+
+def _encode(value: Any) -> str:
+    """
+    Encodes a line of the log, with plain JSON when the cards allow it
+    """
+    if _plain(value):
+        return json.dumps(value, separators=(",", ":"))
+    import jsonpickle
+
+    return jsonpickle.encode(value, make_refs=False)
+
+
+def _plain(value: Any) -> bool:
+    """
+    Whether a value comes back the same from plain JSON
+    """
+    if value is None or type(value) in (str, int, float, bool):
+        return True
+    if type(value) is list:
+        return all(map(_plain, value))
+    if type(value) is dict:
+        return all(type(key) is str and _plain(item) for key, item in value.items())
+    return False
+
+
+def _decode(line: str) -> Any:
+    import jsonpickle
+
+    return jsonpickle.decode(line)
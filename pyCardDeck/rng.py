@@ -0,0 +1,84 @@
+import random
+from collections.abc import MutableSequence, Sequence
+from typing import Any, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class RandomSource(Protocol):
+    """
+    Anything a Deck can draw its randomness from.
+
+    :py:class:`random.Random` instances and the :py:mod:`random` module itself
+    already fit, NumPy generators are wrapped in :py:class:`NumpyRandom`.
+    """
+
+    def randrange(self, stop: int) -> int:
+        """
+        :param stop:    Upper bound, excluded
+        :return:        Random integer from 0 to stop - 1
+        """
+        ...
+
+    def shuffle(self, x: MutableSequence) -> None:
+        """
+        :param x:       Sequence to shuffle in place
+        """
+        ...
+
+    def sample(self, population: Sequence, k: int) -> list:
+        """
+        :param population:  Sequence to pick from
+        :param k:           How many distinct items to pick
+        :return:            Picked items in random order
+        """
+        ...
+
+
+class NumpyRandom:
+    """
+    Adapts a NumPy :py:class:`numpy.random.Generator` to :py:class:`RandomSource`,
+    so shuffles and samples take their entropy from the generator in bulk.
+
+    :param generator:   NumPy Generator, for example ``numpy.random.default_rng(seed)``
+    """
+
+    def __init__(self, generator: Any) -> None:
+        self.generator = generator
+
+    def randrange(self, stop: int) -> int:
+        return int(self.generator.integers(stop))
+
+    def shuffle(self, x: MutableSequence) -> None:
+        self.generator.shuffle(x)
+
+    def sample(self, population: Sequence, k: int) -> list:
+        picked = self.generator.choice(len(population), size=k, replace=False)
+        return [population[index] for index in picked.tolist()]
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return "NumpyRandom({0!r})".format(self.generator)
+
+
+def as_random_source(rng: Any = None) -> RandomSource:
+    """
+    Turns whatever was passed to Deck as `rng` into a :py:class:`RandomSource`
+
+    :param rng:         None for the global :py:mod:`random` generator, an integer seed
+                        for a new :py:class:`random.Random`, a NumPy Generator
+                        or any :py:class:`RandomSource`
+    :return:            Random source for the deck
+    :raises TypeError:  when rng is none of the above
+    """
+    if rng is None:
+        return random
+    if isinstance(rng, int) and not isinstance(rng, bool):
+        return random.Random(rng)
+    if isinstance(rng, RandomSource):
+        return rng
+    if hasattr(rng, "integers") and hasattr(rng, "choice"):
+        return NumpyRandom(rng)
+    raise TypeError(
+        "rng must be a seed, random.Random, numpy Generator or RandomSource, not {}".format(
+            type(rng).__name__
+        )
+    )
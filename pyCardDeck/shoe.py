@@ -0,0 +1,99 @@
+import logging
+
+from .cards import CardType
+from .deck import Deck, _standard_deck_template
+from .rng import RandomSource
+
+log = logging.getLogger(__name__)
+
+
+class Shoe(Deck):
+    """
+    Several decks shuffled together, with a cut card, like the shoes of blackjack tables.
+
+    The cut card is placed so that `penetration` of the shoe is dealt before it comes out.
+    Finish the round when :py:attr:`cut_card_reached` and :py:meth:`reset` the shoe::
+
+        shoe = Shoe(decks=6, penetration=0.75)
+        while playing:
+            play_round(shoe)
+            if shoe.cut_card_reached:
+                shoe.reset()
+
+    The cards of all decks are only loaded once, resetting copies them back into the shoe
+    in one go and shuffles it. Drawn cards don't have to be discarded for that.
+
+    :param decks:       Number of decks in the shoe
+    :param penetration: Part of the shoe dealt before the cut card, from 0 to 1
+    :param cards:       Cards of one deck, the first card is the top of the deck.
+                        A standard deck by default.
+    :param reshuffle:   Set reshuffle to false if you want your shoe not to reshuffle
+                        the discard pile after it's depleted
+    :param name:        Name of the shoe, used when converting the Shoe instance into string
+    :param discard:     optional Deck object to use as discard pile
+    :param indexed:     Keep a multiset index of the cards, see :ref:`Deck`
+    :param rng:         Random source for shuffling and random draws and inserts, see :ref:`Deck`
+    :param lazy_shuffle: Make :py:meth:`shuffle` and :py:meth:`reset` constant time,
+                        see :ref:`Deck`
+    :raises ValueError: when there are no decks or the penetration is out of range
+    """
+
+    def __init__(
+        self,
+        decks: int = 6,
+        penetration: float = 0.75,
+        cards: list[CardType] | None = None,
+        reshuffle: bool = True,
+        name: str | None = None,
+        discard: Deck | None = None,
+        indexed: bool = False,
+        rng: "RandomSource | int | None" = None,
+        lazy_shuffle: bool = False,
+    ):
+        if decks < 1:
+            raise ValueError("A shoe needs at least one deck")
+        if not 0 < penetration <= 1:
+            raise ValueError("Penetration goes from 0 to 1, not {}".format(penetration))
+        super().__init__(
+            reshuffle=reshuffle,
+            name=name,
+            discard=discard,
+            indexed=indexed,
+            rng=rng,
+            lazy_shuffle=lazy_shuffle,
+        )
+        if cards is None:
+            self._deck_cards = list(_standard_deck_template()["_cards"])
+        else:
+            self._deck_cards = cards[::-1]
+        self.decks = decks
+        self.penetration = penetration
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Puts all cards back into the shoe, shuffles it and places the cut card.
+        Empties the discard pile and forgets the journal, if there is one.
+        """
+        self._set_cards(self._deck_cards * self.decks)
+        if isinstance(self._discard_pile, Deck):
+            self._discard_pile.clear()
+        else:
+            self._discard_pile = []
+        self._cut = round(len(self._cards) * (1 - self.penetration))
+        self.shuffle()
+        if self._journal is not None:
+            self._journal.clear()
+        log.debug("Shoe of %i decks reset", self.decks)
+
+    @property
+    def cut_card_reached(self) -> bool:
+        """
+        :return:    Whether the cut card came out and the shoe should be reset
+        """
+        return len(self._cards) <= self._cut
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return "Shoe(decks={0}, cards={1}, discarded={2}, penetration={3})".format(
+            self.decks, self.cards_left, self.discarded, self.penetration
+        )
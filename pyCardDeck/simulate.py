@@ -0,0 +1,137 @@
+"""
+Running many games in parallel, for Monte Carlo simulations::
+
+    def new_deck(rng: random.Random) -> Deck:
+        deck = Deck(rng=rng)
+        deck.load_standard_deck()
+        return deck
+
+    def top_suit(deck: Deck) -> str:
+        deck.shuffle()
+        return deck.draw().suit
+
+    outcomes = run(top_suit, new_deck, trials=1_000_000, seed=7)
+
+Trials are split into chunks and every chunk gets its own random stream derived
+from the seed and the chunk's number, so results only depend on the seed,
+not on how many processes ran them or in which order they finished.
+"""
+
+import logging
+import os
+import random
+import secrets
+from collections import Counter
+from collections.abc import Callable, Hashable, Iterator
+from multiprocessing import get_context
+
+from .deck import Deck
+
+log = logging.getLogger(__name__)
+
+Game = Callable[[Deck], Hashable]
+DeckFactory = Callable[[random.Random], Deck]
+
+
+def simulate(
+    game: Game,
+    deck_factory: DeckFactory,
+    trials: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    chunk_size: int = 1000,
+) -> Iterator[Counter]:
+    """
+    Plays a game many times across a process pool, reporting outcomes as they come in
+
+    For every trial `deck_factory` is called with the random stream of the trial's chunk
+    and `game` plays a game with the deck it returned. The global :py:mod:`random`
+    generator is seeded from the same stream in every chunk, so games using it
+    are reproducible too. When the games are played in this process,
+    the generator's state is restored after every chunk.
+
+    Both callables are sent to the worker processes, so they have to be picklable,
+    for example functions defined at the top level of a module.
+
+    :param game:        Plays one game with the deck and returns its outcome, e.g. who won
+    :param deck_factory: Creates the deck for a trial from a :py:class:`random.Random`
+    :param trials:      Number of games to play
+    :param seed:        Seed of the whole simulation, random by default
+    :param workers:     Number of processes, :py:func:`os.cpu_count` by default.
+                        With 1 the games are played in this process.
+    :param chunk_size:  Games played by a worker in one go
+    :return:            Counts of every outcome so far, after every finished chunk
+    """
+    if seed is None:
+        seed = secrets.randbits(64)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunks = [
+        (game, deck_factory, seed, number, min(chunk_size, trials - start))
+        for number, start in enumerate(range(0, trials, chunk_size))
+    ]
+    log.debug(
+        "Simulating %i trials in %i chunks on %i workers, seed %i",
+        trials,
+        len(chunks),
+        workers,
+        seed,
+    )
+    totals: Counter = Counter()
+    if workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            # Chunks reseed the global generator, the caller's state is put back after
+            state = random.getstate()
+            try:
+                outcomes = _play_chunk(chunk)
+            finally:
+                random.setstate(state)
+            totals.update(outcomes)
+            yield totals.copy()
+        return
+    with get_context().Pool(min(workers, len(chunks))) as pool:
+        for outcomes in pool.imap_unordered(_play_chunk, chunks):
+            totals.update(outcomes)
+            yield totals.copy()
+
+
+def run(
+    game: Game,
+    deck_factory: DeckFactory,
+    trials: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    chunk_size: int = 1000,
+) -> Counter:
+    """
+    Like :py:func:`simulate`, but only returns the final counts
+
+    :return:    Counts of every outcome
+    """
+    totals: Counter = Counter()
+    for totals in simulate(game, deck_factory, trials, seed, workers, chunk_size):
+        pass
+    return totals
+
+
+def chunk_stream(seed: int, chunk: int) -> random.Random:
+    """
+    :param seed:    Seed of the simulation
+    :param chunk:   Number of the chunk
+    :return:        Random stream of the chunk, the same in every process
+    """
+    # String seeds are hashed with SHA-512, so nearby seeds give unrelated streams
+    return random.Random(f"{seed}/{chunk}")
+
+
+def _play_chunk(chunk: tuple) -> Counter:
+    """
+    Plays the trials of one chunk, in a worker process or in this one
+    """
+    game, deck_factory, seed, number, trials = chunk
+    rng = chunk_stream(seed, number)
+    random.seed(rng.getrandbits(64))
+    outcomes: Counter = Counter()
+    for _ in range(trials):
+        outcomes[game(deck_factory(rng))] += 1
+    return outcomes
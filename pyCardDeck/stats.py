@@ -0,0 +1,281 @@
+"""
+Opt-in operation stats for decks: call counts, cards moved and latency histograms
+of every card handling operation::
+
+    from pyCardDeck.stats import ALL_DECKS, instrument
+
+    instrument(deck)
+    ...
+    deck.stats["draw"]["calls"]
+    print(ALL_DECKS.prometheus())
+
+Instrumenting a deck wraps its methods on the instance, the class stays untouched,
+so decks that aren't instrumented don't pay anything for it.
+"""
+
+import json
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .deck import Deck
+
+# Upper bounds of the latency histogram buckets in seconds, the last bucket is unbounded
+BUCKETS = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    1e-2,
+    0.1,
+    1.0,
+)
+
+
+def _one(deck: "Deck", before: int, result: Any, *args: Any, **kwargs: Any) -> int:
+    return 1
+
+
+def _all_cards(
+    deck: "Deck", before: int, result: Any, *args: Any, **kwargs: Any
+) -> int:
+    return len(deck) + deck.discarded
+
+
+def _dealt(
+    deck: "Deck", before: int, result: Any, seats: Any, cards_each: int = 1
+) -> int:
+    return (seats if isinstance(seats, int) else len(seats)) * cards_each
+
+
+# Instrumented methods and how many cards a call moved, from the deck, its size
+# before the call, the result and the arguments of the call
+OPERATIONS: dict[str, Callable[..., int]] = {
+    "draw": _one,
+    "draw_bottom": _one,
+    "draw_random": _one,
+    "draw_many": lambda deck, before, result, *args, **kwargs: len(result),
+    "deal": _dealt,
+    "draw_specific": _one,
+    "add_single": _one,
+    "add_many": lambda deck, before, result, cards: len(deck) - before,
+    "shuffle": lambda deck, before, result: len(deck),
+    "shuffle_back": lambda deck, before, result: len(deck) - before,
+    "discard": _one,
+    "export": _all_cards,
+    "load": _all_cards,
+}
+
+
+class OperationStats:
+    """
+    Stats of one operation
+
+    :param calls:   Number of calls, including failed ones
+    :param errors:  Number of calls that raised an exception
+    :param cards:   Cards moved by the successful calls
+    :param seconds: Total time spent in the calls
+    :param buckets: Number of calls in every latency bucket, see :py:data:`BUCKETS`
+    """
+
+    __slots__ = ("calls", "errors", "cards", "seconds", "buckets")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.cards = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "cards": self.cards,
+            "seconds": self.seconds,
+            "buckets": list(self.buckets),
+        }
+
+
+class StatsRegistry:
+    """
+    Stats of all operations of one deck, or summed up over many decks
+    """
+
+    def __init__(self) -> None:
+        self.operations: dict[str, OperationStats] = {}
+
+    def record(
+        self, operation: str, cards: int, seconds: float, failed: bool = False
+    ) -> None:
+        """
+        :param operation:   Name of the operation
+        :param cards:       Cards the call moved
+        :param seconds:     How long the call took
+        :param failed:      Whether the call raised an exception
+        """
+        stats = self.operations.get(operation)
+        if stats is None:
+            stats = self.operations[operation] = OperationStats()
+        stats.calls += 1
+        stats.errors += failed
+        stats.cards += cards
+        stats.seconds += seconds
+        stats.buckets[bisect_left(BUCKETS, seconds)] += 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        :return:    Copy of the stats of every operation that was called, by its name
+        """
+        return {
+            name: stats.snapshot() for name, stats in sorted(self.operations.items())
+        }
+
+    def reset(self) -> None:
+        """
+        Forgets all stats
+        """
+        self.operations.clear()
+
+    def json(self) -> str:
+        """
+        :return:    The snapshot as JSON, with the bucket bounds
+        """
+        return json.dumps({"buckets": list(BUCKETS), "operations": self.snapshot()})
+
+    def prometheus(
+        self, prefix: str = "pycarddeck", labels: dict[str, str] | None = None
+    ) -> str:
+        """
+        :param prefix:  Prefix of the metric names
+        :param labels:  Extra labels for every sample, like the name of a table
+        :return:        The stats in the Prometheus text exposition format
+        """
+        extra = "".join(
+            ',{}="{}"'.format(name, _escape(value))
+            for name, value in (labels or {}).items()
+        )
+        lines = []
+        for metric, kind, text in (
+            ("operations_total", "counter", "Deck operation calls"),
+            ("operation_errors_total", "counter", "Deck operation calls that failed"),
+            ("cards_moved_total", "counter", "Cards moved by deck operations"),
+            ("operation_seconds", "histogram", "Latency of deck operations"),
+        ):
+            lines.append("# HELP {}_{} {}".format(prefix, metric, text))
+            lines.append("# TYPE {}_{} {}".format(prefix, metric, kind))
+            for name, stats in sorted(self.operations.items()):
+                label = 'operation="{}"{}'.format(name, extra)
+                if metric == "operations_total":
+                    lines.append(_sample(prefix, metric, label, stats.calls))
+                elif metric == "operation_errors_total":
+                    lines.append(_sample(prefix, metric, label, stats.errors))
+                elif metric == "cards_moved_total":
+                    lines.append(_sample(prefix, metric, label, stats.cards))
+                else:
+                    lines.extend(_histogram(prefix, metric, label, stats))
+        return "\n".join(lines) + "\n"
+
+
+# Stats summed up over all instrumented decks
+ALL_DECKS = StatsRegistry()
+
+
+def instrument(
+    deck: "Deck", registries: Iterable[StatsRegistry] = (ALL_DECKS,)
+) -> StatsRegistry:
+    """
+    Starts recording the operations of a deck, see :py:attr:`Deck.stats`.
+    Instrumenting an instrumented deck only returns its stats.
+
+    :param deck:        Deck to instrument
+    :param registries:  Where to sum the stats up besides the deck itself,
+                        :py:data:`ALL_DECKS` by default
+    :return:            Stats of the deck
+    """
+    if deck._stats is not None:
+        return deck._stats
+    stats = StatsRegistry()
+    targets = (stats, *registries)
+    for name, moved in OPERATIONS.items():
+        setattr(deck, name, _wrap(deck, getattr(deck, name), name, moved, targets))
+    deck._stats = stats
+    return stats
+
+
+def uninstrument(deck: "Deck") -> None:
+    """
+    Stops recording the operations of a deck and drops its stats.
+    The stats summed up in other registries stay.
+
+    :param deck:    Instrumented deck
+    """
+    for name in OPERATIONS:
+        deck.__dict__.pop(name, None)
+    deck.__dict__.pop("_stats", None)
+
+
+def _wrap(
+    deck: "Deck",
+    method: Callable,
+    name: str,
+    moved: Callable[..., int],
+    registries: tuple[StatsRegistry, ...],
+) -> Callable:
+    def instrumented(*args: Any, **kwargs: Any) -> Any:
+        before = len(deck)
+        start = perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except BaseException:
+            elapsed = perf_counter() - start
+            for registry in registries:
+                registry.record(name, 0, elapsed, failed=True)
+            raise
+        elapsed = perf_counter() - start
+        cards = moved(deck, before, result, *args, **kwargs)
+        for registry in registries:
+            registry.record(name, cards, elapsed)
+        return result
+
+    instrumented.__wrapped__ = method  # type: ignore[attr-defined]
+    instrumented.__doc__ = method.__doc__
+    return instrumented
+
+
+def _sample(prefix: str, metric: str, label: str, value: float) -> str:
+    return "{}_{}{{{}}} {}".format(prefix, metric, label, value)
+
+
+def _histogram(
+    prefix: str, metric: str, label: str, stats: OperationStats
+) -> list[str]:
+    lines = []
+    cumulative = 0
+    for bound, count in zip((*BUCKETS, "+Inf"), stats.buckets):
+        cumulative += count
+        lines.append(
+            _sample(
+                prefix,
+                metric + "_bucket",
+                '{},le="{}"'.format(label, bound),
+                cumulative,
+            )
+        )
+    lines.append(_sample(prefix, metric + "_sum", label, stats.seconds))
+    lines.append(_sample(prefix, metric + "_count", label, stats.calls))
+    return lines
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,314 @@
+from collections.abc import Iterable, Iterator, MutableSequence
+from itertools import chain, islice
+from typing import Any
+
+
+class TreeList(MutableSequence):
+    """
+    List-like sequence with O(log n) access, insertion and deletion at any position.
+
+    Items are kept in blocks of at most a few hundred items and the blocks are indexed
+    by a binary indexed (Fenwick) tree of their lengths, so finding the n-th item
+    walks the tree instead of the items. Inserting or deleting moves items within
+    a single block only.
+
+    Copies made with :py:meth:`copy` share the blocks with the original until
+    either of them changes a block, so copying takes O(n / block size).
+
+    Plain lists are faster for small decks and for drawing from the top,
+    use this as the storage of a :ref:`Deck` that is large and gets cards drawn
+    from or inserted at arbitrary positions::
+
+        deck = Deck(cards=cards, storage=TreeList)
+
+    :param iterable:    Initial items
+    """
+
+    # Blocks are split once they grow past twice this size
+    block_size = 256
+
+    def __init__(self, iterable: Iterable = ()) -> None:
+        self._blocks: list[list] = []
+        self._tree: list[int] = [0]
+        self._len = 0
+        # IDs of blocks that may be shared with copies of the list
+        self._borrowed: set[int] = set()
+        self.extend(iterable)
+
+    def _writable(self, block: int) -> list:
+        """
+        :param block:   Index of a block
+        :return:        The block, copied first if it may be shared with a copy of the list
+        """
+        items = self._blocks[block]
+        if self._borrowed and id(items) in self._borrowed:
+            self._borrowed.discard(id(items))
+            items = self._blocks[block] = items[:]
+        return items
+
+    def _rebuild(self) -> None:
+        """
+        Rebuilds the index tree after blocks were added, removed or reordered
+        """
+        tree = [0]
+        tree.extend(len(block) for block in self._blocks)
+        size = len(self._blocks)
+        for node in range(1, size + 1):
+            parent = node + (node & -node)
+            if parent <= size:
+                tree[parent] += tree[node]
+        self._tree = tree
+
+    def _update(self, block: int, delta: int) -> None:
+        """
+        Adjusts the index tree after a block grew or shrank by delta items
+        """
+        tree = self._tree
+        node = block + 1
+        size = len(tree)
+        while node < size:
+            tree[node] += delta
+            node += node & -node
+
+    def _prefix(self, blocks: int) -> int:
+        """
+        :return:    Number of items in the first `blocks` blocks
+        """
+        tree = self._tree
+        total = 0
+        while blocks:
+            total += tree[blocks]
+            blocks &= blocks - 1
+        return total
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """
+        Finds an item by its position
+
+        :param index:   Position of the item, must be in range
+        :return:        Index of the block and position within the block
+        """
+        tree = self._tree
+        size = len(tree) - 1
+        block = 0
+        step = 1 << (size.bit_length() - 1) if size else 0
+        while step:
+            node = block + step
+            if node <= size and tree[node] <= index:
+                block = node
+                index -= tree[node]
+            step >>= 1
+        return block, index
+
+    def _append_block(self, block: list) -> None:
+        """
+        Adds a block at the end, updating the index tree in O(log n)
+        """
+        self._blocks.append(block)
+        node = len(self._blocks)
+        self._tree.append(
+            len(block) + self._prefix(node - 1) - self._prefix(node - (node & -node))
+        )
+
+    def _pop_block(self) -> list:
+        """
+        Removes the last block, the index of the other blocks stays valid
+        """
+        self._tree.pop()
+        return self._blocks.pop()
+
+    def _normalize(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("TreeList index out of range")
+        return index
+
+    def _iter_range(self, start: int, stop: int) -> Iterator:
+        """
+        Iterates over the items from start to stop, both in range
+        """
+        if start >= stop:
+            return iter(())
+        block, offset = self._locate(start)
+        items = chain(
+            islice(self._blocks[block], offset, None),
+            chain.from_iterable(islice(self._blocks, block + 1, None)),
+        )
+        return islice(items, stop - start)
+
+    def _assign(self, items: list) -> None:
+        """
+        Replaces all items at once
+        """
+        self._blocks = []
+        self._tree = [0]
+        self._len = 0
+        self._borrowed = set()
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self._iter_range(start, stop))
+            if step == -1:
+                items = list(self._iter_range(stop + 1, start + 1))
+                items.reverse()
+                return items
+            return [self[position] for position in range(start, stop, step)]
+        index = self._normalize(index)
+        block, offset = self._locate(index)
+        return self._blocks[block][offset]
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            items = list(self)
+            items[index] = value
+            self._assign(items)
+            return
+        index = self._normalize(index)
+        block, offset = self._locate(index)
+        self._writable(block)[offset] = value
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1 and stop >= self._len:
+                self._truncate(start)
+            elif len(range(start, stop, step)):
+                items = list(self)
+                del items[index]
+                self._assign(items)
+            return
+        index = self._normalize(index)
+        block, offset = self._locate(index)
+        items = self._writable(block)
+        del items[offset]
+        self._len -= 1
+        if items:
+            self._update(block, -1)
+        elif block == len(self._blocks) - 1:
+            self._pop_block()
+        else:
+            del self._blocks[block]
+            self._rebuild()
+
+    def _truncate(self, length: int) -> None:
+        """
+        Deletes all items from position `length` on, in O(log n) per removed block
+        """
+        while self._len > length:
+            last = self._blocks[-1]
+            if self._len - len(last) >= length:
+                self._pop_block()
+                self._len -= len(last)
+            else:
+                removed = self._len - length
+                del self._writable(len(self._blocks) - 1)[-removed:]
+                self._update(len(self._blocks) - 1, -removed)
+                self._len = length
+
+    def insert(self, index: int, value: Any) -> None:
+        if index < 0:
+            index = max(index + self._len, 0)
+        if index >= self._len:
+            self.append(value)
+            return
+        block, offset = self._locate(index)
+        items = self._writable(block)
+        items.insert(offset, value)
+        self._len += 1
+        if len(items) > 2 * self.block_size:
+            self._blocks[block : block + 1] = [
+                items[: self.block_size],
+                items[self.block_size :],
+            ]
+            self._rebuild()
+        else:
+            self._update(block, 1)
+
+    def append(self, value: Any) -> None:
+        if self._blocks and len(self._blocks[-1]) < 2 * self.block_size:
+            self._writable(len(self._blocks) - 1).append(value)
+            self._update(len(self._blocks) - 1, 1)
+        else:
+            self._append_block([value])
+        self._len += 1
+
+    def extend(self, values: Iterable) -> None:
+        values = list(values)
+        if self._blocks:
+            room = 2 * self.block_size - len(self._blocks[-1])
+            if room > 0:
+                head = values[:room]
+                values = values[room:]
+                self._writable(len(self._blocks) - 1).extend(head)
+                self._update(len(self._blocks) - 1, len(head))
+                self._len += len(head)
+        for start in range(0, len(values), self.block_size):
+            block = values[start : start + self.block_size]
+            self._append_block(block)
+            self._len += len(block)
+
+    def pop(self, index: int = -1) -> Any:
+        if index == -1 and self._blocks:
+            last = self._writable(len(self._blocks) - 1)
+            value = last.pop()
+            self._len -= 1
+            if last:
+                self._update(len(self._blocks) - 1, -1)
+            else:
+                self._pop_block()
+            return value
+        if not self._len:
+            raise IndexError("pop from empty TreeList")
+        value = self[index]
+        del self[index]
+        return value
+
+    def reverse(self) -> None:
+        self._blocks.reverse()
+        for block in range(len(self._blocks)):
+            self._writable(block).reverse()
+        self._rebuild()
+
+    def clear(self) -> None:
+        self._assign([])
+
+    def copy(self) -> "TreeList":
+        """
+        :return:    Copy of the list sharing its blocks until either list changes them
+        """
+        copied = object.__new__(type(self))
+        shared = {id(block) for block in self._blocks}
+        self._borrowed |= shared
+        copied._blocks = list(self._blocks)
+        copied._tree = list(self._tree)
+        copied._len = self._len
+        copied._borrowed = shared
+        return copied
+
+    __copy__ = copy
+
+    def __iter__(self) -> Iterator:
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self) -> Iterator:
+        return chain.from_iterable(reversed(block) for block in reversed(self._blocks))
+
+    def __contains__(self, value: Any) -> bool:
+        return any(value in block for block in self._blocks)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (TreeList, list)):
+            return self._len == len(other) and all(
+                first == second for first, second in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return "TreeList({0!r})".format(list(self))
@@ -0,0 +1,85 @@
+import pytest
+
+from pyCardDeck import *
+
+numpy = pytest.importorskip("numpy")
+
+from pyCardDeck.batch import DeckBatch  # noqa: E402
+
+
+def test_batch_draw_all():
+    batch = DeckBatch(4, ["a", "b", "c"], reshuffle=False)
+    assert (batch.draw_all(2) == [[0, 1]] * 4).all()
+    assert list(batch.cards_left) == [1] * 4
+    with pytest.raises(OutOfCards):
+        batch.draw_all(2)
+    batch.reset()
+    assert list(batch[3]) == ["a", "b", "c"]
+
+
+def test_batch_shuffle_all():
+    catalog = CardCatalog.standard()
+    first = DeckBatch(50, catalog, rng=1)
+    second = DeckBatch(50, catalog, rng=1)
+    first.shuffle_all()
+    second.shuffle_all()
+    assert (first._ids == second._ids).all()
+    assert len({tuple(row) for row in first._ids.tolist()}) == 50
+    assert all(sorted(row) == list(range(52)) for row in first._ids.tolist())
+    drawn = first.draw_all(5)
+    first.shuffle_all()
+    assert (first._ids[:, :5] == drawn).all()
+    assert all(
+        sorted(hand + rest) == list(range(52))
+        for hand, rest in zip(drawn.tolist(), first._ids[:, 5:].tolist())
+    )
+
+
+def test_batch_shuffle_all_uniform():
+    batch = DeckBatch(6000, ["a", "b", "c"], rng=2)
+    first = batch.draw_all(1)
+    batch.shuffle_all()
+    tops = numpy.bincount(batch.draw_all(1)[:, 0], minlength=3)
+    assert (first == 0).all() and tops[0] == 0
+    assert abs(tops[1] - tops[2]) < 300
+
+
+def test_batch_row_like_deck():
+    batch = DeckBatch(2, ["a", "b", "c", "d"], rng=3)
+    deck = batch[1]
+    assert batch.draw(1) == "a"
+    deck.discard("a")
+    assert deck.draw_bottom() == "d"
+    assert deck.draw_specific("c") == "c"
+    assert not deck.card_exists("c") and deck.card_exists("b")
+    with pytest.raises(CardNotFound):
+        deck.draw_specific("x")
+    deck.add_single("c", 0)
+    deck.add_single("d", -1)
+    deck.add_single("e", 1)
+    assert deck.show_top(5) == ["c", "e", "d", "b"]
+    assert len(batch[0]) == 4
+    deck.add_many(["f", "g"])
+    assert sorted(deck) == ["b", "c", "d", "e", "f", "g"]
+    assert deck.draw_many(6, position="random")
+    assert sorted(deck) == ["a"] and deck.discarded == 0
+    with pytest.raises(NotACard):
+        deck.discard(None)
+    copy = deck.to_deck()
+    assert list(copy) == ["a"]
+    assert list(batch[0]) == ["a", "b", "c", "d"]
+
+
+def test_batch_row_deal_and_clear():
+    batch = DeckBatch(2, list("abcdefg"), reshuffle=False)
+    deck = batch[0]
+    hands = deck.deal(2, 2)
+    assert hands == [["a", "c"], ["b", "d"]]
+    assert deck.deal(hands) == [["a", "c", "e"], ["b", "d", "f"]]
+    with pytest.raises(OutOfCards):
+        deck.deal(hands)
+    assert hands == [["a", "c", "e", "g"], ["b", "d", "f"]]
+    batch[1].discard("x")
+    batch[1].clear()
+    assert batch[1].empty and batch[1].discarded == 1
+    assert len(batch[0]) == 0 and list(batch[1]) == []
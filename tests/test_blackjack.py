@@ -0,0 +1,83 @@
+import pytest
+
+from pyCardDeck import *
+
+numpy = pytest.importorskip("numpy")
+
+from pyCardDeck.blackjack import (  # noqa: E402
+    Rules,
+    basic_strategy,
+    card_value,
+    hand_total,
+    play_batch,
+    play_hand,
+    play_reference,
+    simulate,
+    threshold_strategy,
+)
+
+CARDS = {value: PokerCard("Spades", str(value), "") for value in range(2, 11)}
+CARDS[11] = PokerCard("Spades", "A", "Ace of Spades")
+
+
+def replay(dealt: list, hand: int) -> Deck:
+    """
+    Deck with the cards the vectorized engine dealt to a hand, in the order they were drawn
+    """
+    values = [int(step[hand]) for step in dealt if step[hand]]
+    return Deck(cards=[CARDS[value] for value in values], reshuffle=False)
+
+
+@pytest.mark.parametrize("hits_soft_17", [False, True])
+def test_batch_matches_reference_hand_by_hand(hits_soft_17):
+    rules = Rules(decks=2, dealer_hits_soft_17=hits_soft_17)
+    strategy = basic_strategy()
+    dealt: list = []
+    payouts = play_batch(5000, strategy, rules, rng=3, dealt=dealt)
+    for hand, payout in enumerate(payouts):
+        deck = replay(dealt, hand)
+        assert play_hand(deck.draw, strategy, rules) == payout
+        assert deck.empty
+
+
+def test_batch_deals_from_the_shoe():
+    dealt: list = []
+    play_batch(2000, threshold_strategy(21), Rules(decks=1), rng=5, dealt=dealt)
+    drawn = numpy.stack(dealt, axis=1)
+    for hand in drawn:
+        values = hand[hand > 0]
+        assert (numpy.bincount(values, minlength=12)[2:] <= [4] * 8 + [16, 4]).all()
+
+
+def test_simulation_agrees_with_reference():
+    strategy = basic_strategy()
+    fast = simulate(200_000, strategy, rng=11)
+    slow = play_reference(20_000, strategy, rng=11)
+    difference = abs(fast.ev - slow.ev)
+    assert difference < 4 * (fast.stderr**2 + slow.stderr**2) ** 0.5
+    assert fast.low < fast.ev < fast.high
+    assert fast.hands == 200_000
+
+
+def test_basic_strategy_beats_never_busting():
+    basic = simulate(300_000, basic_strategy(), rng=1)
+    timid = simulate(300_000, threshold_strategy(12), rng=1)
+    assert basic.high < 0
+    assert timid.high < basic.low
+
+
+def test_blackjacks():
+    strategy = threshold_strategy(17)
+    natural = Deck(cards=[CARDS[11], CARDS[10], CARDS[10], CARDS[9]], reshuffle=False)
+    assert play_hand(natural.draw, strategy) == 1.5
+    both = Deck(cards=[CARDS[11], CARDS[11], CARDS[10], CARDS[10]], reshuffle=False)
+    assert play_hand(both.draw, strategy, Rules(blackjack_pays=1.2)) == 0
+    dealer = Deck(cards=[CARDS[10], CARDS[11], CARDS[9], CARDS[10]], reshuffle=False)
+    assert play_hand(dealer.draw, strategy) == -1
+
+
+def test_hand_values():
+    assert card_value(PokerCard("Hearts", "K", "King of Hearts")) == 10
+    assert card_value(CARDS[11]) == 11
+    assert hand_total([11, 11, 9]) == (21, True)
+    assert hand_total([11, 10, 5]) == (16, False)
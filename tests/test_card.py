@@ -1,3 +1,5 @@
+import pytest
+
 from pyCardDeck import *
 
 
@@ -14,3 +16,49 @@ def test_PokerCard():
     assert str(card) == "Jack of Hearts"
     assert card.rank == "J"
     assert repr(card).startswith("PokerCard({'")
+
+
+def test_SlottedCard():
+    card = SlottedCard("BaseCard")
+    assert str(card) == "BaseCard"
+    assert repr(card) == "SlottedCard({'name': 'BaseCard'})"
+    assert card == "BaseCard" == card.name
+    assert {card: 1}["BaseCard"] == 1
+    assert SlottedCard("a") < SlottedCard("b")
+    assert not hasattr(card, "__dict__")
+    with pytest.raises(AttributeError):
+        card.name = "Other"
+
+
+def test_SlottedPokerCard():
+    card = SlottedPokerCard("Hearts", "J", "Jack")
+    assert str(card) == "Jack of Hearts"
+    assert repr(card) == repr(PokerCard("Hearts", "J", "Jack")).replace(
+        "PokerCard", "SlottedPokerCard"
+    )
+    assert (card.rank, card.suit, card.rank_code, card.suit_code) == (
+        "J",
+        "Hearts",
+        11,
+        2,
+    )
+    assert card == PokerCard("Hearts", "J", "Jack") == card
+    assert hash(card) == hash(SlottedPokerCard("Hearts", "J", "Jack"))
+    assert sorted(
+        [
+            card,
+            SlottedPokerCard("Spades", "10", "Ten"),
+            SlottedPokerCard("Clubs", "J", "Jack"),
+        ]
+    ) == ["Ten of Spades", "Jack of Clubs", "Jack of Hearts"]
+    with pytest.raises(ValueError):
+        SlottedPokerCard("Stars", "J", "Jack")
+
+
+def test_slotted_export():
+    cards = [SlottedPokerCard("Hearts", "J", "Jack"), SlottedCard("Joker")]
+    for fmt in ("yaml", "json"):
+        loaded = Deck()
+        loaded.load(Deck(cards=cards, indexed=True).export(fmt))
+        assert list(loaded) == cards
+        assert type(loaded.draw()) is SlottedPokerCard
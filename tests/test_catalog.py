@@ -0,0 +1,91 @@
+import pytest
+
+from pyCardDeck import *
+
+
+def test_catalog_ids():
+    catalog = CardCatalog(["a", "b"])
+    assert catalog.add("b") == 1
+    assert catalog.add("c") == 2
+    assert catalog.find("d") is None
+    assert catalog.ids(["c", "a"]) == [2, 0]
+    assert catalog.cards([1, 0]) == ["b", "a"]
+    assert len(catalog) == 3
+    assert "a" in catalog
+    with pytest.raises(CardNotFound):
+        catalog.id_of("d")
+
+
+def test_catalog_interns():
+    catalog = CardCatalog()
+    first = PokerCard("Hearts", "A", "Ace of Hearts")
+    second = PokerCard("Hearts", "A", "Ace of Hearts")
+    assert catalog.intern(first) is first
+    assert catalog.intern(second) is first
+    assert catalog.id_of(second) == 0
+
+
+def test_catalog_unkeyed():
+    class Unkeyed:
+        def __init__(self):
+            self.name = []
+
+    with pytest.raises(TypeError):
+        CardCatalog([Unkeyed()])
+    assert Unkeyed() not in CardCatalog()
+
+
+def test_standard_catalog():
+    catalog = CardCatalog.standard()
+    assert catalog is CardCatalog.standard()
+    assert len(catalog) == 52
+    d = Deck()
+    d.load_standard_deck()
+    assert all(card is catalog[catalog.id_of(card)] for card in d)
+
+
+def test_deck_interns():
+    catalog = CardCatalog()
+    d = Deck(cards=[PokerCard("Hearts", "A", "Ace of Hearts")], catalog=catalog)
+    d.add_single(PokerCard("Hearts", "A", "Ace of Hearts"))
+    d.add_many([PokerCard("Spades", "K", "King of Spades")])
+    d[0] = PokerCard("Spades", "K", "King of Spades")
+    assert len(catalog) == 2
+    assert d[0] is catalog[1]
+    assert d.card_exists(PokerCard("Hearts", "A", "Ace of Hearts"))
+    assert not d.card_exists(PokerCard("Spades", "Q", "Queen of Spades"))
+    assert len(catalog) == 2
+    with pytest.raises(CardNotFound):
+        d.draw_specific(PokerCard("Spades", "Q", "Queen of Spades"))
+
+
+def test_deck_card_ids():
+    catalog = CardCatalog.standard()
+    d = Deck(catalog=catalog, card_ids=True, reshuffle=False)
+    d.load_standard_deck()
+    assert list(d) == list(range(52))
+    top = catalog[d[0]]
+    assert d.card_exists(top)
+    assert d.draw_specific(top) == 0
+    d.add_single(top, 0)
+    assert d.draw() == 0
+    d.discard(top)
+    d.discard(5)
+    assert d._discard_pile == [0, 5]
+    with pytest.raises(ValueError):
+        Deck(card_ids=True)
+
+
+def test_deck_card_ids_export():
+    catalog = CardCatalog(["a", "b", "c"])
+    d = Deck(cards=["c", "a"], catalog=catalog, card_ids=True)
+    d.discard("b")
+    exported = d.export("yaml")
+    assert list(d) == [2, 0]
+    plain = Deck(cards=["c", "a"])
+    plain.discard("b")
+    assert exported == plain.export("yaml")
+    loaded = Deck(catalog=catalog, card_ids=True)
+    loaded.load(exported)
+    assert list(loaded) == [2, 0]
+    assert loaded._discard_pile == [1]
@@ -0,0 +1,93 @@
+import pytest
+
+from pyCardDeck import *
+
+
+def test_compact_plays_like_deck():
+    catalog = CardCatalog.standard()
+    compact = CompactDeck(catalog=catalog, rng=3)
+    compact.load_standard_deck()
+    d = Deck(rng=3)
+    d.load_standard_deck()
+    assert list(compact) == list(d)
+    for deck in (compact, d):
+        deck.shuffle()
+        deck.discard(deck.draw())
+        deck.add_single(deck.draw_random())
+        deck.add_single(deck.draw_many(3, position="bottom")[1], 5)
+        deck.discard(deck.draw_specific(catalog[7]))
+    assert compact.draw() is d.draw()
+    assert compact.deal(2, 3) == d.deal(2, 3)
+    assert compact.show_top(4) == d.show_top(4)
+    assert compact[-1] is d[-1]
+    assert len(compact) == len(d) == 41
+    assert compact.card_exists(d[0])
+    assert not compact.card_exists(catalog[7])
+    assert compact._cards.itemsize == 1
+
+
+def test_compact_reshuffles():
+    compact = CompactDeck(cards=["a", "b", "c"], discard=CompactDeck())
+    compact.discard(compact.draw())
+    compact.discard(compact.draw())
+    assert compact.discarded == 2
+    assert compact.draw() == "c"
+    assert sorted(compact) == ["a", "b"]
+    assert compact.discarded == 0
+    compact.add_many(["d", "e"])
+    assert set(compact.draw_many(3)) < {"a", "b", "d", "e"}
+    assert len(compact) == 1
+
+
+def test_compact_widens():
+    compact = CompactDeck(cards=list("ab"))
+    compact.add_many(["card {}".format(number) for number in range(300)])
+    assert compact._cards.typecode == "H"
+    assert compact.card_exists("card 299")
+    assert len(compact) == 302
+
+
+def test_compact_add_many_merges():
+    compact = CompactDeck(cards=list("abcdef"), rng=5)
+    plain = Deck(cards=list("abcdef"), rng=5)
+    compact.add_many(list("ghij"))
+    plain.add_many(list("ghij"))
+    assert compact._cards.typecode == "B"
+    assert list(compact) == list(plain)
+    assert compact.card_exists("j") and compact.draw() == plain.draw()
+
+
+def test_compact_export():
+    catalog = CardCatalog()
+    compact = CompactDeck(cards=["a", "b", "c"], catalog=catalog, discard=CompactDeck())
+    compact.discard(compact.draw())
+    plain = Deck(cards=["b", "c"], discard=Deck())
+    plain.discard("a")
+    for fmt in ("yaml", "json"):
+        exported = compact.export(fmt)
+        assert exported.replace("compact.CompactDeck", "deck.Deck") == plain.export(fmt)
+        loaded = CompactDeck(catalog=catalog)
+        loaded.load(exported)
+        assert list(loaded) == ["b", "c"]
+        assert loaded._catalog is catalog
+        assert list(loaded._discard_pile) == ["a"]
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda: Deck(catalog=CardCatalog.standard()),
+        lambda: Deck(catalog=CardCatalog.standard(), card_ids=True),
+        CompactDeck,
+    ],
+)
+def test_catalog_name_lookups(make):
+    d = make()
+    d.load_standard_deck()
+    assert d.card_exists("King of Hearts")
+    assert not d.card_exists("Joker")
+    d.draw_specific("Ace of Spades")
+    assert not d.card_exists("Ace of Spades")
+    with pytest.raises(CardNotFound):
+        d.draw_specific("Ace of Spades")
+    assert len(d) == 51
@@ -205,7 +205,7 @@ def test_add_single():
     six = Card("Six")
     d.add_single(six, position=0)
     assert len(d) == 6
-    assert d._cards[0] == six
+    assert d[0] == six
 
 
 def test_add_many():
@@ -410,3 +410,366 @@ def test_yaml():
     prop = d.yaml
     export = d.export("yaml")
     assert prop == export
+
+
+def test_top_order():
+    d = Deck(cards=[1, 2, 3, 4, 5], reshuffle=False)
+    assert list(d) == [1, 2, 3, 4, 5]
+    assert d[0] == 1
+    assert d[-1] == 5
+    assert d[1:4] == [2, 3, 4]
+    assert d[::-2] == [5, 3, 1]
+    assert d.show_top(2) == [1, 2]
+    assert d.show_top(10) == [1, 2, 3, 4, 5]
+    d[0] = 6
+    d[1:3] = [7]
+    assert list(d) == [6, 7, 4, 5]
+    with pytest.raises(IndexError):
+        d[4]
+    d.add_single(8, position=1)
+    d.add_single(9, position=-1)
+    d.add_single(10, position=100)
+    assert list(d) == [6, 8, 7, 4, 9, 5, 10]
+    assert d.draw() == 6
+    assert d.draw_bottom() == 10
+
+
+def test_export_keeps_order():
+    discard = Deck(cards=["x", "y"])
+    d = Deck(cards=[1, 2, 3], discard=discard)
+    exported = d.export("yaml")
+    assert list(d) == [1, 2, 3]
+    e = Deck()
+    e.load(exported)
+    assert list(e) == [1, 2, 3]
+    assert list(e._discard_pile) == ["x", "y"]
+    e.load(d.export("json"))
+    assert list(e) == [1, 2, 3]
+
+
+def test_indexed():
+    one = Card("One", specific_string="bbc")
+    d = Deck(cards=[one, Card("Two"), Card("Two"), 3, "four"], indexed=True)
+    assert d.card_exists(Card("One", specific_string="bbc"))
+    assert not d.card_exists(Card("One"))
+    assert not d.card_exists(DifferentCard("One", specific_string="bbc"))
+    assert d.card_exists(3)
+    assert d.card_exists("four")
+    assert d.draw_specific(Card("Two")).name == "Two"
+    assert d.card_exists(Card("Two"))
+    d.draw_specific(Card("Two"))
+    assert not d.card_exists(Card("Two"))
+    with pytest.raises(CardNotFound):
+        d.draw_specific(Card("Two"))
+    assert d.draw() is one
+    assert not d.card_exists(one)
+    d.add_single(5)
+    d.add_many([6, 7])
+    d[0] = 8
+    assert d.card_exists(8)
+    assert sum(d.card_exists(card) for card in (3, "four", 5, 6, 7)) == 4
+    d.clear()
+    assert not d.card_exists(3)
+
+
+def test_indexed_sync():
+    d = Deck(cards=[1, 2], indexed=True)
+    d.discard(3)
+    d.draw()
+    d.draw()
+    assert d.card_exists(3)
+    d.load(Deck(cards=[4]).export("json"))
+    assert d.card_exists(4)
+    assert not d.card_exists(3)
+    assert "_index" not in d.export("json")
+    d.load_standard_deck()
+    assert d.card_exists(PokerCard("Spades", "A", "Ace"))
+
+
+def test_indexed_slice_assignment():
+    d = Deck(cards=[1, 2, 3], indexed=True, reshuffle=False)
+    d[0:2] = [9]
+    assert list(d) == [9, 3]
+    assert d.card_exists(9) and not d.card_exists(1) and not d.card_exists(2)
+    d.draw_bottom()
+    assert not d.card_exists(3)
+
+
+def test_indexed_draw_specific_topmost_with_same_key():
+    lower = Card("Two")
+    d = Deck(
+        cards=[DifferentCard("Two"), 1, Card("Two"), lower, "x"],
+        indexed=True,
+        reshuffle=False,
+    )
+    assert d.draw_specific(Card("Two")) is not lower
+    assert d.draw_specific(Card("Two")) is lower
+    assert type(d.draw()) is DifferentCard
+    assert d.draw_specific(1) == 1
+
+
+def test_indexed_unkeyed():
+    unkeyed = Card("One", specific_string=["a"])
+    d = Deck(cards=[unkeyed, 1], indexed=True)
+    assert d.card_exists(Card("One", specific_string=["a"]))
+    assert not d.card_exists(Card("Two"))
+    assert d.draw_specific(Card("One", specific_string=["a"])) is unkeyed
+    assert not d.card_exists(Card("One", specific_string=["a"]))
+
+
+def test_indexed_name_lookups():
+    plain, indexed = Deck(), Deck(indexed=True)
+    plain.load_standard_deck()
+    indexed.load_standard_deck()
+    for name in ("King of Hearts", "Ace of Spades", "Joker"):
+        assert indexed.card_exists(name) is plain.card_exists(name)
+    assert indexed.draw_specific("Ace of Spades") is plain.draw_specific(
+        "Ace of Spades"
+    )
+    assert not indexed.card_exists("Ace of Spades")
+    with pytest.raises(CardNotFound):
+        indexed.draw_specific("Joker")
+    named = Deck(cards=["Two of Clubs", 1], indexed=True)
+    assert named.card_exists(PokerCard("Clubs", "2", "Two"))
+
+
+def test_draw_many():
+    d = Deck(cards=[1, 2, 3, 4, 5, 6], reshuffle=False)
+    assert d.draw_many(2) == [1, 2]
+    assert d.draw_many(2, position="bottom") == [6, 5]
+    assert d.draw_many(0) == []
+    assert sorted(d.draw_many(2, position="random")) == [3, 4]
+    assert d.empty
+    with pytest.raises(OutOfCards):
+        d.draw_many(1)
+    with pytest.raises(ValueError):
+        d.draw_many(1, position="middle")
+
+
+def test_draw_many_reshuffle():
+    d = Deck(cards=[1, 2, 3])
+    d.discard(4)
+    d.discard(5)
+    drawn = d.draw_many(4)
+    assert drawn[:3] == [1, 2, 3]
+    assert drawn[3] in (4, 5)
+    assert len(d) == 1
+    assert d.discarded == 0
+    with pytest.raises(NoCards):
+        d.draw_many(2)
+    with pytest.raises(NoCards):
+        Deck().draw_many(1, position="random")
+
+
+def test_deal():
+    d = Deck(cards=list(range(10)), reshuffle=False)
+    assert d.deal(3, 2) == [[0, 3], [1, 4], [2, 5]]
+    hands = [["a"], []]
+    d.deal(hands)
+    assert hands == [["a", 6], [7]]
+    with pytest.raises(OutOfCards):
+        d.deal(hands, 2)
+    assert hands == [["a", 6, 8], [7, 9]]
+    assert d.empty
+
+
+def test_deal_reshuffle():
+    d = Deck(cards=[1, 2, 3])
+    d.discard(4)
+    d.discard(5)
+    hands = d.deal(2, 2)
+    assert hands[0] == [1, 3]
+    assert hands[1][0] == 2
+    assert hands[1][1] in (4, 5)
+    assert len(d) == 1
+
+
+def test_standard_deck_copies():
+    d = Deck()
+    d.load_standard_deck()
+    e = Deck()
+    e.load_standard_deck()
+    d.draw()
+    d.discard(1)
+    assert len(e) == 52
+    assert e.discarded == 0
+    assert e.name == "Standard Deck"
+
+
+def test_add_many_positions():
+    counts = {}
+    for seed in range(3000):
+        d = Deck(cards=[0], rng=seed)
+        d.add_many(["x", "y"])
+        order = tuple(d)
+        counts[order] = counts.get(order, 0) + 1
+    assert len(counts) == 6
+    assert all(400 < count < 600 for count in counts.values())
+    d = Deck(cards=[1, 2, 3], reshuffle=False)
+    d.add_many([])
+    assert list(d) == [1, 2, 3]
+
+
+def uniform(orders: list[tuple], permutations: int) -> bool:
+    counts = {}
+    for order in orders:
+        counts[order] = counts.get(order, 0) + 1
+    expected = len(orders) / permutations
+    return len(counts) == permutations and all(
+        0.7 * expected < count < 1.3 * expected for count in counts.values()
+    )
+
+
+def test_lazy_shuffle_uniform():
+    orders = []
+    for seed in range(4800):
+        d = Deck(cards=[0, 1, 2, 3], lazy_shuffle=True, rng=seed)
+        d.shuffle()
+        orders.append((d.draw(),) + tuple(d.show_top(1)) + tuple(d))
+    assert uniform(orders, 24)
+    orders = []
+    for seed in range(4800):
+        d = Deck(cards=[0, 1, 2], lazy_shuffle=True, rng=seed)
+        d.shuffle()
+        d.show_top(1)
+        d.add_single("x")
+        orders.append(tuple(d))
+    assert uniform(orders, 24)
+    orders = []
+    for seed in range(4800):
+        d = Deck(cards=[0, 1], lazy_shuffle=True, rng=seed)
+        d.shuffle()
+        d.show_top(1)
+        d.add_many(["x", "y"])
+        orders.append(tuple(d))
+    assert uniform(orders, 24)
+
+
+def test_lazy_shuffle_operations():
+    d = Deck(cards=list(range(100)), lazy_shuffle=True, rng=1, reshuffle=False)
+    d.shuffle()
+    assert d._unshuffled == 100
+    top = d.draw_many(3)
+    assert d._unshuffled == 97
+    assert d.show_top(2) == [d[0], d[1]]
+    d.add_single("x", position=5)
+    assert d[5] == "x"
+    d.add_single("y")
+    d.add_many(["z"])
+    d.shuffle()
+    drawn = top + [d.draw(), d.draw_bottom(), d.draw_random()]
+    for hand in d.deal(2, 2):
+        drawn += hand
+    drawn.append(d.draw_specific("z"))
+    drawn += list(d)
+    assert sorted(map(str, drawn)) == sorted(
+        map(str, list(range(100)) + ["x", "y", "z"])
+    )
+    d.shuffle()
+    assert "_unshuffled" not in d.export("yaml")
+    assert d._unshuffled == 0
+
+
+@pytest.fixture
+def reporting():
+    yield
+    set_fast_mode(False)
+    set_trace_hook(None)
+
+
+def test_fast_mode_skips_debug_logs(caplog, reporting):
+    d = Deck(cards=[1, 2, 3])
+    with caplog.at_level("DEBUG", logger="pyCardDeck"):
+        d.discard(d.draw())
+        assert "Card drawn from top: 1" in caplog.text
+        caplog.clear()
+        set_fast_mode()
+        d.discard(d.draw())
+        d.add_single(4, position=0)
+        assert caplog.text == ""
+        with pytest.raises(NoCards):
+            Deck().shuffle()
+        assert "empty deck" in caplog.text
+
+
+def test_trace_hook(reporting):
+    events = []
+    set_fast_mode()
+    set_trace_hook(lambda event, deck, details: events.append((event, details)))
+    d = Deck(cards=[1, 2, 3], reshuffle=False)
+    d.draw()
+    d.draw_many(2, "bottom")
+    d.add_single(5, position=1)
+    d.discard(1)
+    assert events == [
+        ("draw", {"position": "top", "card": 1}),
+        ("draw_many", {"number": 2, "position": "bottom"}),
+        ("add_single", {"card": 5, "position": 1}),
+        ("discard", {"card": 1}),
+    ]
+    set_trace_hook(None)
+    d.draw()
+    assert len(events) == 4
+
+
+def test_fork_is_independent():
+    d = Deck(cards=list(range(1, 11)), reshuffle=False, rng=1)
+    d.discard(20)
+    f = d.fork()
+    assert list(f) == list(d) and f.discarded == 1
+    assert f.draw() == 1
+    f.discard(21)
+    f.add_single(30, position=0)
+    assert list(d) == list(range(1, 11)) and d.discarded == 1
+    g = d.fork()
+    d.shuffle()
+    d[0] = 40
+    assert list(g) == list(range(1, 11))
+    assert f.draw() == 30 and f.draw_specific(5) == 5
+    assert list(f) == [2, 3, 4, 6, 7, 8, 9, 10]
+    assert f.discarded == 2 and g.discarded == 1
+    h = g.fork()
+    g.shuffle_back()
+    assert len(h) == 10 and h.discarded == 1 and len(g) == 11
+
+
+def test_fork_storage_and_index():
+    cards = [str(number) for number in range(600)]
+    for d in (
+        Deck(cards=cards, storage=TreeList, indexed=True),
+        Deck(cards=cards, lazy_shuffle=True),
+        CompactDeck(cards=cards),
+    ):
+        d.shuffle()
+        f = d.fork()
+        drawn = f.draw_many(300)
+        f.add_many(["x", "y"])
+        assert len(d) == 600 and d.card_exists(drawn[0])
+        assert not f.card_exists(drawn[0]) and f.card_exists("x")
+        assert sorted(d) == sorted(cards)
+        assert sorted(list(f) + drawn) == sorted(cards + ["x", "y"])
+        assert type(f) is type(d)
+
+
+def test_fork_discard_deck_and_rng():
+    pile = Deck()
+    d = Deck(cards=[1, 2, 3], discard=pile, rng=5)
+    f = d.fork()
+    f.discard(f.draw())
+    assert f._discard_pile is not pile
+    assert pile.empty and f.discarded == 1
+    first, second = d.fork(rng=9), d.fork(rng=9)
+    assert first._rng is not d._rng
+    first.add_many([4, 5])
+    second.add_many([4, 5])
+    assert list(first) == list(second)
+    assert list(d) == [1, 2, 3]
+
+
+def test_fork_lazy_shuffle():
+    d = Deck(cards=list(range(100)), lazy_shuffle=True, rng=3)
+    d.shuffle()
+    f = d.fork()
+    assert d.show_top(3) == f.show_top(3)
+    assert list(d) == list(f)
+    assert f.draw() == d.draw()
@@ -0,0 +1,82 @@
+from itertools import combinations
+
+import pytest
+
+from pyCardDeck import *
+
+numpy = pytest.importorskip("numpy")
+
+from pyCardDeck.equity import equity, equity_many  # noqa: E402
+from pyCardDeck.evaluator import card_code, evaluate_codes  # noqa: E402
+
+ACES = ["Ace of Spades", "Ace of Hearts"]
+KINGS = ["King of Spades", "King of Hearts"]
+FLOP = ["Two of Clubs", "Seven of Diamonds", "Queen of Clubs"]
+
+
+def test_exact_matches_brute_force():
+    aces, kings = equity([ACES, KINGS], board=FLOP)
+    assert aces.exact and aces.runouts == 990
+    deck = Deck()
+    deck.load_standard_deck()
+    for card in ACES + KINGS + FLOP:
+        deck.draw_specific(card)
+    codes = {card.name: card_code(card) for card in CardCatalog.standard()}
+    board = [codes[name] for name in FLOP]
+    wins = 0
+    for runout in combinations([card_code(card) for card in deck], 2):
+        first = evaluate_codes([codes[name] for name in ACES] + board + list(runout))
+        second = evaluate_codes([codes[name] for name in KINGS] + board + list(runout))
+        wins += first < second
+    assert aces.win == wins / 990
+    assert aces.equity + kings.equity == pytest.approx(1)
+
+
+def test_river_and_ties():
+    board = [
+        "Ace of Clubs",
+        "King of Clubs",
+        "Queen of Diamonds",
+        "Jack of Hearts",
+        "Ten of Spades",
+    ]
+    first, second = equity(
+        [["Two of Clubs", "Three of Clubs"], ["Four of Hearts", "Two of Hearts"]],
+        board=board,
+    )
+    assert first.runouts == 1 and first.tie == 1 and first.equity == 0.5
+
+
+def test_sampled():
+    aces, kings = equity([ACES, KINGS], samples=20_000, rng=1)
+    assert not aces.exact and aces.runouts == 20_000
+    assert aces.equity == pytest.approx(0.82, abs=0.02)
+    again = equity([ACES, KINGS], samples=20_000, rng=1)
+    assert again[0] == aces
+    hero, villain = equity([ACES, []], samples=3000, time_budget=0, rng=2)
+    assert hero.runouts == 500
+    assert hero.equity == pytest.approx(0.85, abs=0.05)
+
+
+def test_known_cards():
+    with pytest.raises(CardNotFound):
+        equity([ACES, ["Ace of Spades", "King of Hearts"]])
+    with pytest.raises(ValueError):
+        equity([ACES + KINGS])
+    dead = equity([ACES, KINGS], board=FLOP, dead=["King of Clubs", "King of Diamonds"])
+    assert dead[1].win < equity([ACES, KINGS], board=FLOP)[1].win
+
+
+def test_equity_many():
+    situations = [([ACES, KINGS], FLOP), ([KINGS, ACES], FLOP)]
+    first, second = equity_many(situations)
+    assert first[0] == second[1]
+
+
+def test_enumerate_in_pool(monkeypatch):
+    from pyCardDeck import equity as module
+
+    monkeypatch.setattr(module, "BATCH", 100)
+    assert equity([ACES, KINGS], board=FLOP, workers=2) == equity(
+        [ACES, KINGS], board=FLOP
+    )
@@ -0,0 +1,77 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from pyCardDeck import *
+from pyCardDeck.evaluator import (
+    card_code,
+    catalog_codes,
+    evaluate,
+    evaluate_array,
+    evaluate_codes,
+    evaluate_many,
+    hand_class,
+)
+
+
+def hand(*names: str) -> list:
+    suits = {"s": "Spades", "h": "Hearts", "d": "Diamonds", "c": "Clubs"}
+    return [PokerCard(suits[name[-1]], name[:-1], name[:-1]) for name in names]
+
+
+def standard_cards() -> list:
+    return list(CardCatalog.standard())
+
+
+def test_hand_classes():
+    assert evaluate(hand("As", "Ks", "Qs", "Js", "10s")) == 1
+    assert evaluate(hand("5d", "4d", "3d", "2d", "Ad")) == 10
+    assert hand_class(evaluate(hand("9c", "9d", "9h", "9s", "2c"))) == "Four of a Kind"
+    assert hand_class(evaluate(hand("9c", "9d", "9h", "2s", "2c"))) == "Full House"
+    assert hand_class(evaluate(hand("Ah", "5d", "4c", "3s", "2c"))) == "Straight"
+    assert hand_class(evaluate(hand("Ah", "Kd", "4c", "3s", "2c"))) == "High Card"
+    assert evaluate(hand("7h", "5d", "4c", "3s", "2c")) == 7462
+    assert evaluate(hand("Ah", "Ad", "Kc", "Ks", "2c")) < evaluate(
+        hand("Ah", "Ad", "Kc", "Ks", "Qh", "Qs", "3c")[2:]
+    )
+    with pytest.raises(ValueError):
+        evaluate(hand("Ah", "Ad", "Kc", "Ks"))
+    with pytest.raises(ValueError):
+        card_code("Ace of Hearts")
+
+
+def test_best_of_seven():
+    codes = catalog_codes(standard_cards())
+    rng = random.Random(1)
+    for _ in range(300):
+        cards = rng.sample(codes, rng.choice((6, 7)))
+        assert evaluate_codes(cards) == min(
+            evaluate_codes(five) for five in combinations(cards, 5)
+        )
+    # The ace high flush beats the straight
+    assert evaluate(hand("As", "Ks", "Qs", "Js", "9s", "10h", "Ah")) == 323
+
+
+def test_flush_in_seven():
+    assert (
+        hand_class(evaluate(hand("As", "Ks", "2s", "Js", "9s", "Ah", "Ad"))) == "Flush"
+    )
+    assert evaluate(hand("9s", "Ks", "Qs", "Js", "10s", "8s", "Ah")) == 2
+
+
+def test_evaluate_many():
+    cards = standard_cards()
+    hands = [cards[start : start + 7] for start in range(0, 45, 5)]
+    assert evaluate_many(hands) == [evaluate(cards) for cards in hands]
+
+
+def test_evaluate_array():
+    numpy = pytest.importorskip("numpy")
+    codes = catalog_codes(standard_cards())
+    rng = random.Random(2)
+    for size in (5, 6, 7):
+        hands = [rng.sample(codes, size) for _ in range(500)]
+        assert evaluate_array(numpy.array(hands)).tolist() == [
+            evaluate_codes(cards) for cards in hands
+        ]
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+# Modules that should only be imported when a deck is exported or loaded
+LAZY = ("yaml", "jsonpickle")
+
+
+def imported_modules(code: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip().split(".")[0])
+    return modules
+
+
+def test_import_is_cheap():
+    modules = imported_modules("import pyCardDeck")
+    assert "pyCardDeck" in modules
+    for module in LAZY:
+        assert module not in modules
+
+
+def test_lazy_import_on_use():
+    modules = imported_modules(
+        "import pyCardDeck; pyCardDeck.Deck(cards=[1]).export('json')"
+    )
+    assert "jsonpickle" in modules
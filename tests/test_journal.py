@@ -0,0 +1,170 @@
+import random
+
+import pytest
+
+from pyCardDeck import *
+from pyCardDeck.journal import Journal
+
+
+def state(deck):
+    pile = deck._discard_pile
+    discarded = list(pile) if isinstance(pile, list) else list(pile._cards)
+    index = None if deck._index is None else +deck._index
+    return list(deck._cards), discarded, index
+
+
+def operate(deck, rng):
+    # Small decks get new cards, so draws never run into an empty deck and discard pile
+    operation = rng.randrange(11) if len(deck) > 10 else 6
+    if operation == 0:
+        deck.draw()
+    elif operation == 1:
+        deck.draw_bottom()
+    elif operation == 2:
+        deck.draw_random()
+    elif operation == 3:
+        deck.draw_many(rng.randrange(1, 8), rng.choice(["top", "bottom", "random"]))
+    elif operation == 4:
+        deck.draw_specific(rng.choice(list(deck)))
+    elif operation == 5:
+        deck.add_single(rng.randrange(100, 200), rng.choice([None, 0, 3, -1]))
+    elif operation == 6:
+        deck.add_many([rng.randrange(100, 200) for _ in range(rng.randrange(1, 5))])
+    elif operation == 7:
+        deck.discard(rng.randrange(1, 100))
+    elif operation == 8:
+        deck.shuffle()
+    elif operation == 9:
+        deck.shuffle_back()
+    else:
+        deck[rng.randrange(len(deck))] = rng.randrange(200, 300)
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda: Deck(cards=list(range(1, 21)), rng=1),
+        lambda: Deck(cards=list(range(1, 21)), rng=1, indexed=True),
+        lambda: Deck(cards=list(range(1, 21)), rng=1, storage=TreeList),
+        lambda: Deck(cards=list(range(1, 21)), rng=1, discard=Deck(reshuffle=False)),
+    ],
+)
+def test_undo_and_redo_restore_every_state(make):
+    deck = make()
+    deck.start_journal()
+    rng = random.Random(5)
+    states = [state(deck)]
+    for _ in range(300):
+        operate(deck, rng)
+        states.append(state(deck))
+    for expected in reversed(states[:-1]):
+        deck.undo()
+        assert state(deck) == expected
+    for expected in states[1:]:
+        deck.redo()
+        assert state(deck) == expected
+
+
+def test_draw_that_reshuffles_is_one_operation():
+    deck = Deck(cards=[1, 2], rng=3)
+    deck.start_journal()
+    deck.draw()
+    deck.discard(5)
+    deck.discard(6)
+    deck.draw()
+    assert sorted(deck) == [5, 6] and deck.discarded == 0
+    deck.undo()
+    assert list(deck) == [2] and deck._discard_pile == [5, 6]
+
+
+def test_new_operation_forgets_redo():
+    deck = Deck(cards=[1, 2, 3])
+    journal = deck.start_journal()
+    deck.draw()
+    deck.undo()
+    assert journal.can_redo
+    deck.draw_bottom()
+    assert not journal.can_redo
+    with pytest.raises(NoHistory):
+        deck.redo()
+    deck.undo()
+    assert list(deck) == [1, 2, 3]
+    with pytest.raises(NoHistory):
+        deck.undo()
+
+
+def test_limit():
+    deck = Deck(cards=[1, 2, 3, 4])
+    journal = deck.start_journal(limit=2)
+    deck.draw()
+    deck.draw()
+    deck.draw()
+    assert len(journal) == 2
+    deck.undo()
+    deck.undo()
+    assert list(deck) == [2, 3, 4]
+    assert not journal.can_undo
+
+
+def test_without_journal():
+    deck = Deck(cards=[1, 2])
+    with pytest.raises(NoHistory):
+        deck.undo()
+    deck.start_journal()
+    deck.draw()
+    deck.stop_journal()
+    with pytest.raises(NoHistory):
+        deck.undo()
+    with pytest.raises(ValueError):
+        Deck(cards=[1, 2], lazy_shuffle=True).start_journal()
+
+
+def test_fork_keeps_history():
+    deck = Deck(cards=[1, 2, 3])
+    deck.start_journal()
+    deck.draw()
+    fork = deck.fork()
+    fork.draw()
+    fork.undo()
+    fork.undo()
+    assert list(fork) == [1, 2, 3]
+    assert list(deck) == [2, 3]
+    deck.undo()
+    assert list(deck) == [1, 2, 3]
+
+
+def test_load_forgets_history():
+    deck = Deck(cards=[1, 2, 3])
+    journal = deck.start_journal()
+    deck.draw()
+    exported = deck.export("json")
+    assert "_journal" not in exported
+    deck.load(exported)
+    assert not journal.can_undo
+    shoe = Shoe(decks=1, rng=1)
+    journal = shoe.start_journal()
+    shoe.draw()
+    shoe.reset()
+    assert not journal.can_undo
+
+
+def test_catalog_ids():
+    catalog = CardCatalog()
+    deck = Deck(cards=["a", "b", "c"], catalog=catalog, card_ids=True, rng=2)
+    deck.start_journal()
+    before = state(deck)
+    deck.add_many(["d", "e"])
+    deck.discard("a")
+    deck.undo()
+    deck.undo()
+    assert state(deck) == before
+
+
+def test_joined_steps():
+    journal = Journal()
+    journal.record(("remove", 0, [1]))
+    with journal.joined():
+        journal.record(("remove", 0, [2]))
+    journal.record(("remove", 0, [3]), join=True)
+    assert len(journal) == 1
+    assert len(journal.copy()._undo[0]) == 3
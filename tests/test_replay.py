@@ -0,0 +1,149 @@
+import io
+import random
+
+import pytest
+
+from pyCardDeck import *
+from pyCardDeck.replay import digest, record, verify
+
+
+def play(deck, rng):
+    for _ in range(200):
+        operation = rng.randrange(9) if len(deck) > 10 else 5
+        if operation == 0:
+            deck.draw()
+        elif operation == 1:
+            deck.draw_random()
+        elif operation == 2:
+            deck.draw_many(rng.randrange(1, 6), rng.choice(["top", "bottom", "random"]))
+        elif operation == 3:
+            deck.deal(3, 2)
+        elif operation == 4:
+            deck.add_single(rng.randrange(100, 200))
+        elif operation == 5:
+            deck.add_many([rng.randrange(100, 200) for _ in range(3)])
+        elif operation == 6:
+            deck.discard(rng.randrange(1, 100))
+        elif operation == 7:
+            deck.shuffle()
+        else:
+            deck.draw_specific(deck[rng.randrange(len(deck))])
+
+
+@pytest.mark.parametrize("storage", [list, TreeList])
+def test_replay_rebuilds_the_deck(storage):
+    deck = Deck(cards=list(range(1, 31)), storage=storage)
+    stream = io.StringIO()
+    recorder = record(deck, stream)
+    play(deck, random.Random(4))
+    checkpoint = recorder.checkpoint()
+    replayed = Deck(storage=storage)
+    replayed.replay(stream.getvalue().splitlines())
+    assert list(replayed) == list(deck)
+    assert replayed._discard_pile == deck._discard_pile
+    assert digest(replayed) == checkpoint
+
+
+def test_standard_deck_is_logged_by_name():
+    deck = Deck()
+    deck.load_standard_deck()
+    stream = io.StringIO()
+    recorder = record(deck, stream, seed=7)
+    for _ in range(3):
+        deck.draw_random()
+    checkpoint = recorder.checkpoint()
+    log = stream.getvalue()
+    assert '"cards":"standard"' in log and len(log) < 300
+    replayed = verify(log.splitlines(), checkpoint)
+    assert len(replayed) == 49 and list(replayed) == list(deck)
+
+
+def test_reshuffles_and_failed_calls():
+    deck = Deck(cards=list(range(1, 11)))
+    stream = io.StringIO()
+    recorder = record(deck, stream)
+    for _ in range(30):
+        deck.discard(deck.draw_random())
+    with pytest.raises(CardNotFound):
+        deck.draw_specific(99)
+    checkpoint = recorder.checkpoint()
+    recorder.stop()
+    deck.shuffle()
+    lines = stream.getvalue().splitlines()
+    assert lines[-2] == '{"call":"draw_specific","args":[99],"raised":"CardNotFound"}'
+    assert digest(verify(lines, checkpoint)) == checkpoint
+
+
+def test_deal_and_journal():
+    deck = Deck(cards=list(range(1, 21)), rng=1)
+    deck.start_journal()
+    stream = io.StringIO()
+    recorder = record(deck, stream)
+    hands = deck.deal([[0], [0]], 2)
+    deck.shuffle()
+    deck.undo()
+    deck.add_many([30, 31])
+    checkpoint = recorder.checkpoint()
+    assert hands[0][0] == 0
+    replayed = verify(stream.getvalue().splitlines(), checkpoint)
+    assert replayed._journal.can_redo is False and len(replayed._journal) == 2
+
+
+def test_card_instances():
+    cards = [PokerCard("Hearts", rank, rank) for rank in "23456789"]
+    deck = Deck(cards=cards)
+    stream = io.StringIO()
+    recorder = record(deck, stream)
+    deck.discard(deck.draw_specific(PokerCard("Hearts", "5", "5")))
+    deck.add_single(PokerCard("Spades", "A", "A"))
+    checkpoint = recorder.checkpoint()
+    assert "py/object" in stream.getvalue()
+    replayed = verify(stream.getvalue().splitlines(), checkpoint)
+    assert [card.name for card in replayed] == [card.name for card in deck]
+
+
+def test_verify_detects_changes():
+    deck = Deck(cards=list(range(1, 21)))
+    stream = io.StringIO()
+    recorder = record(deck, stream, seed=3)
+    deck.draw_random()
+    deck.shuffle()
+    checkpoint = recorder.checkpoint()
+    lines = stream.getvalue().splitlines()
+    with pytest.raises(ReplayError):
+        verify([lines[0].replace('"seed":3', '"seed":4'), *lines[1:]])
+    with pytest.raises(ReplayError):
+        verify([lines[0], '{"call":"draw_bottom"}', *lines[2:]])
+    with pytest.raises(ReplayError):
+        verify(lines[:-1], checkpoint[::-1])
+    with pytest.raises(ReplayError):
+        verify(lines, deck=Deck(storage=TreeList))
+    with pytest.raises(ReplayError):
+        verify([])
+
+
+def test_record_needs_replayable_deck():
+    with pytest.raises(ValueError):
+        record(Deck(cards=[1, 2], lazy_shuffle=True), io.StringIO())
+    with pytest.raises(ValueError):
+        record(Deck(cards=[1, 2], discard=Deck()), io.StringIO())
+
+
+@pytest.mark.parametrize("from_file", [False, True])
+def test_load_is_logged(tmp_path, from_file):
+    deck = Deck(cards=list(range(1, 11)))
+    stream = io.StringIO()
+    recorder = record(deck, stream)
+    deck.draw_random()
+    exported = Deck(cards=["a", "b", "c"]).export("json")
+    if from_file:
+        location = tmp_path / "deck.json"
+        location.write_text(exported)
+        deck.load(str(location), is_file=True)
+        location.unlink()
+    else:
+        deck.load(exported)
+    deck.draw_random()
+    recorder.checkpoint()
+    replayed = verify(stream.getvalue().splitlines(), digest(deck))
+    assert list(replayed) == list(deck) and len(deck) == 2
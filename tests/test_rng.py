@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from pyCardDeck import *
+
+
+def play(deck: Deck) -> list:
+    deck.shuffle()
+    drawn = [deck.draw_random(), deck.draw()]
+    deck.add_single("x")
+    deck.add_many(["y", "z"])
+    drawn.extend(deck.draw_many(3, position="random"))
+    return drawn + list(deck)
+
+
+def test_seeded_decks_repeat():
+    assert play(Deck(cards=list(range(20)), rng=7)) == play(
+        Deck(cards=list(range(20)), rng=random.Random(7))
+    )
+    assert play(Deck(cards=list(range(20)), rng=7)) != play(
+        Deck(cards=list(range(20)), rng=8)
+    )
+
+
+def test_decks_have_own_streams():
+    first = Deck(cards=list(range(20)), rng=7)
+    second = Deck(cards=list(range(20)), rng=7)
+    random.seed(1)
+    first.shuffle()
+    random.seed(2)
+    second.shuffle()
+    assert list(first) == list(second)
+
+
+def test_global_random_by_default():
+    random.seed(3)
+    first = play(Deck(cards=list(range(20))))
+    random.seed(3)
+    assert play(Deck(cards=list(range(20)))) == first
+
+
+def test_numpy_generator():
+    numpy = pytest.importorskip("numpy")
+    first = play(Deck(cards=list(range(20)), rng=numpy.random.default_rng(5)))
+    second = play(Deck(cards=list(range(20)), rng=numpy.random.default_rng(5)))
+    assert first == second
+    assert sorted(first, key=str) == sorted(list(range(20)) + ["x", "y", "z"], key=str)
+
+
+def test_rng_not_exported():
+    d = Deck(cards=[1, 2], rng=1)
+    assert "Random" not in d.export("yaml")
+    e = Deck(rng=2)
+    e.load(d.export("json"))
+    assert list(e) == [1, 2]
+
+
+def test_invalid_rng():
+    with pytest.raises(TypeError):
+        Deck(rng="seed")
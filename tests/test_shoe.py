@@ -0,0 +1,48 @@
+import pytest
+
+from pyCardDeck import *
+
+
+def test_shoe():
+    shoe = Shoe(decks=6, penetration=0.75, rng=1)
+    assert len(shoe) == 312
+    assert shoe.card_exists("Ace of Spades")
+    dealt = shoe.draw_many(233)
+    assert len({card.name for card in dealt}) == 52
+    assert not shoe.cut_card_reached
+    shoe.discard(shoe.draw())
+    assert shoe.cut_card_reached and shoe.discarded == 1
+    shoe.reset()
+    assert len(shoe) == 312 and shoe.discarded == 0
+    assert not shoe.cut_card_reached
+    assert list(shoe) != list(Shoe(decks=6, rng=2))
+
+
+def test_shoe_cards():
+    shoe = Shoe(decks=2, penetration=1, cards=["a", "b"], reshuffle=False)
+    assert sorted(shoe) == ["a", "a", "b", "b"]
+    shoe.draw_many(3)
+    assert not shoe.cut_card_reached
+    shoe.draw()
+    assert shoe.cut_card_reached
+    with pytest.raises(OutOfCards):
+        shoe.draw()
+
+
+def test_shoe_lazy():
+    shoe = Shoe(decks=8, rng=3, lazy_shuffle=True)
+    shoe.draw_many(10)
+    shoe.reset()
+    assert shoe._unshuffled == 416
+    drawn = shoe.draw_many(52)
+    assert shoe._unshuffled == 364
+    assert sorted(card.name for card in drawn + list(shoe)) == sorted(
+        card.name for card in Shoe(decks=8)
+    )
+
+
+def test_shoe_invalid():
+    with pytest.raises(ValueError):
+        Shoe(decks=0)
+    with pytest.raises(ValueError):
+        Shoe(penetration=1.5)
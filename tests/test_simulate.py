@@ -0,0 +1,52 @@
+import random
+
+from pyCardDeck import *
+from pyCardDeck.simulate import run, simulate
+
+
+def new_deck(rng: random.Random) -> Deck:
+    deck = Deck(rng=rng)
+    deck.load_standard_deck()
+    return deck
+
+
+def top_suit(deck: Deck) -> str:
+    deck.shuffle()
+    return deck.draw().suit
+
+
+def coin(deck: Deck) -> bool:
+    return random.random() < 0.5
+
+
+def test_run_reproducible():
+    first = run(top_suit, new_deck, trials=500, seed=3, workers=1, chunk_size=64)
+    assert sum(first.values()) == 500
+    assert set(first) == {"Hearts", "Spades", "Clubs", "Diamonds"}
+    assert first == run(
+        top_suit, new_deck, trials=500, seed=3, workers=2, chunk_size=64
+    )
+    assert first != run(
+        top_suit, new_deck, trials=500, seed=4, workers=1, chunk_size=64
+    )
+
+
+def test_global_random_seeded():
+    assert run(coin, new_deck, trials=300, seed=5, workers=1, chunk_size=50) == run(
+        coin, new_deck, trials=300, seed=5, workers=2, chunk_size=50
+    )
+
+
+def test_caller_random_state_kept():
+    random.seed(9)
+    expected = random.random()
+    random.seed(9)
+    run(coin, new_deck, trials=100, seed=5, workers=1)
+    assert random.random() == expected
+
+
+def test_simulate_streams():
+    progress = list(
+        simulate(top_suit, new_deck, trials=250, seed=1, workers=1, chunk_size=100)
+    )
+    assert [sum(totals.values()) for totals in progress] == [100, 200, 250]
@@ -0,0 +1,125 @@
+import json
+
+import pytest
+
+from pyCardDeck import *
+from pyCardDeck.stats import BUCKETS, StatsRegistry, instrument, uninstrument
+
+
+@pytest.fixture
+def total():
+    return StatsRegistry()
+
+
+def test_not_instrumented():
+    deck = Deck(cards=[1, 2, 3])
+    deck.draw()
+    assert deck.stats == {}
+    assert "draw" not in vars(deck)
+
+
+def test_counts_calls_and_cards(total):
+    deck = Deck(cards=list(range(1, 21)), reshuffle=False)
+    instrument(deck, [total])
+    deck.draw()
+    deck.draw_bottom()
+    deck.draw_specific(10)
+    deck.draw_many(3, "random")
+    deck.deal(2, 2)
+    deck.add_many([30, 31])
+    deck.discard(1)
+    deck.shuffle()
+    with pytest.raises(CardNotFound):
+        deck.draw_specific(99)
+    stats = deck.stats
+    assert stats["draw"]["calls"] == 1
+    assert stats["draw_many"]["cards"] == 3
+    assert stats["deal"]["cards"] == 4
+    assert stats["add_many"]["cards"] == 2
+    assert stats["shuffle"]["cards"] == len(deck)
+    assert stats["draw_specific"] == {
+        **stats["draw_specific"],
+        "calls": 2,
+        "errors": 1,
+        "cards": 1,
+    }
+    assert sum(stats["discard"]["buckets"]) == 1
+    assert len(stats["draw"]["buckets"]) == len(BUCKETS) + 1
+    assert total.snapshot() == stats
+
+
+def test_aggregates_decks(total):
+    first = Deck(cards=[1, 2, 3])
+    second = Deck(cards=[1, 2, 3])
+    for deck in (first, second):
+        instrument(deck, [total])
+        deck.discard(deck.draw())
+    assert total.snapshot()["draw"]["calls"] == 2
+    assert first.stats["draw"]["calls"] == 1
+
+
+def test_shuffle_back_counts_returned_cards(total):
+    deck = Deck(cards=[1, 2])
+    instrument(deck, [total])
+    deck.discard(5)
+    deck.discard(6)
+    deck.shuffle_back()
+    assert deck.stats["shuffle_back"]["cards"] == 2
+
+
+def test_add_many_from_generator(total):
+    deck = Deck(cards=[1, 2])
+    instrument(deck, [total])
+    deck.add_many(card for card in (3, 4, 5))
+    assert len(deck) == 5
+    assert deck.stats["add_many"]["cards"] == 3
+
+
+def test_export_and_load(total):
+    deck = Deck(cards=[1, 2, 3], name="table")
+    instrument(deck, [total])
+    exported = deck.export("json")
+    assert "instrumented" not in exported and "_stats" not in exported
+    deck.load(exported)
+    assert deck.stats["export"]["cards"] == 3
+    assert deck.stats["load"]["calls"] == 1
+    loaded = Deck()
+    loaded.load(exported)
+    assert loaded.stats == {} and loaded.draw() == 1
+
+
+def test_forks_are_not_instrumented(total):
+    deck = Deck(cards=[1, 2, 3])
+    instrument(deck, [total])
+    fork = deck.fork()
+    fork.draw()
+    assert fork.stats == {} and deck.stats == {}
+    deck.draw()
+    assert len(deck) == 2 and deck.stats["draw"]["calls"] == 1
+
+
+def test_uninstrument(total):
+    deck = Deck(cards=[1, 2, 3])
+    instrument(deck, [total])
+    assert instrument(deck, [total]) is deck._stats
+    uninstrument(deck)
+    deck.draw()
+    assert deck.stats == {}
+    assert "draw" not in total.snapshot()
+
+
+def test_outputs(total):
+    deck = Deck(cards=[1, 2, 3])
+    instrument(deck, [total])
+    deck.draw()
+    decoded = json.loads(total.json())
+    assert decoded["operations"]["draw"]["calls"] == 1
+    text = total.prometheus(labels={"table": 'a"b'})
+    assert "# TYPE pycarddeck_operation_seconds histogram" in text
+    assert 'pycarddeck_operations_total{operation="draw",table="a\\"b"} 1' in text
+    assert (
+        'pycarddeck_operation_seconds_bucket{operation="draw",table="a\\"b",le="+Inf"} 1'
+        in text
+    )
+    total.reset()
+    assert total.snapshot() == {}
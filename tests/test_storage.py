@@ -0,0 +1,135 @@
+import random
+
+import pytest
+
+from pyCardDeck import *
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(TreeList, "block_size", 4)
+
+
+def test_tree_list_matches_list(small_blocks):
+    rng = random.Random(0)
+    expected = []
+    tree = TreeList()
+    for _ in range(3000):
+        operation = rng.randrange(9)
+        if operation == 0:
+            index = rng.randrange(-5, len(expected) + 5)
+            expected.insert(index, operation)
+            tree.insert(index, operation)
+        elif operation == 1:
+            expected.append(rng.random())
+            tree.append(expected[-1])
+        elif operation == 2 and expected:
+            index = rng.randrange(-len(expected), len(expected))
+            assert tree.pop(index) == expected.pop(index)
+        elif operation == 3 and expected:
+            assert tree.pop() == expected.pop()
+        elif operation == 4:
+            values = [rng.random() for _ in range(rng.randrange(20))]
+            expected.extend(values)
+            tree.extend(values)
+        elif operation == 5:
+            count = rng.randrange(1, 10)
+            del expected[-count:]
+            del tree[-count:]
+        elif operation == 6:
+            position = slice(
+                rng.randrange(-10, len(expected) + 3),
+                rng.randrange(-10, len(expected) + 3),
+                rng.choice((1, -1, 2, -3)),
+            )
+            assert tree[position] == expected[position]
+            del expected[position]
+            del tree[position]
+        elif operation == 7:
+            expected.reverse()
+            tree.reverse()
+        elif operation == 8 and expected:
+            index = rng.randrange(len(expected))
+            expected[index] = operation
+            tree[index] = operation
+            assert tree[index] == expected[index]
+        assert len(tree) == len(expected)
+        assert list(tree) == expected
+    assert list(reversed(tree)) == expected[::-1]
+    assert tree == expected
+
+
+def test_tree_list_copies_are_independent(small_blocks):
+    rng = random.Random(1)
+    pairs = [(TreeList(range(50)), list(range(50)))]
+    for step in range(2000):
+        tree, expected = rng.choice(pairs)
+        operation = rng.randrange(7)
+        if operation == 0:
+            copied = tree.copy()
+            assert copied == tree
+            pairs.append((copied, list(expected)))
+        elif operation == 1:
+            index = rng.randrange(len(expected) + 1)
+            expected.insert(index, step)
+            tree.insert(index, step)
+        elif operation == 2 and expected:
+            assert tree.pop() == expected.pop()
+        elif operation == 3 and expected:
+            index = rng.randrange(len(expected))
+            del expected[index]
+            del tree[index]
+        elif operation == 4 and expected:
+            index = rng.randrange(len(expected))
+            expected[index] = tree[index] = step
+        elif operation == 5:
+            expected.extend([step] * 5)
+            tree.extend([step] * 5)
+        elif operation == 6:
+            expected.reverse()
+            tree.reverse()
+        for tree, expected in pairs:
+            assert list(tree) == expected
+
+
+def test_tree_list_errors():
+    tree = TreeList([1])
+    with pytest.raises(IndexError):
+        tree[1]
+    tree.pop()
+    with pytest.raises(IndexError):
+        tree.pop()
+    with pytest.raises(IndexError):
+        tree.pop(0)
+
+
+def test_deck_with_tree_storage(small_blocks):
+    d = Deck(cards=list(range(50)), reshuffle=False, storage=TreeList, rng=1)
+    assert isinstance(d._cards, TreeList)
+    assert d.draw() == 0
+    assert d.draw_bottom() == 49
+    assert d.show_top(3) == [1, 2, 3]
+    assert d[10] == 11
+    d[10] = "x"
+    assert d.draw_specific("x") == "x"
+    d.add_single("y", position=5)
+    assert d[5] == "y"
+    d.add_many(["z"] * 10)
+    d.shuffle()
+    drawn = [d.draw_random() for _ in range(5)] + d.draw_many(50)
+    drawn += d.draw_many(len(d), position="bottom")
+    assert sorted(map(str, drawn)) == sorted(
+        [str(card) for card in range(1, 49) if card != 11] + ["y"] + ["z"] * 10
+    )
+    assert d.empty
+
+
+def test_tree_storage_export():
+    d = Deck(cards=[1, 2, 3], storage=TreeList)
+    assert "TreeList" not in d.export("yaml")
+    e = Deck(storage=TreeList)
+    e.load(d.export("json"))
+    assert isinstance(e._cards, TreeList)
+    assert list(e) == [1, 2, 3]
+    e.clear()
+    assert isinstance(e._cards, TreeList)